@@ -1,4 +1,4 @@
-import { defineConfig } from 'vitest/config';
+import { configDefaults, defineConfig } from 'vitest/config';
 import path from 'path';
 
 export default defineConfig({
@@ -6,6 +6,8 @@ export default defineConfig({
     globals: true,
     environment: 'node',
     include: ['src/test/**/*.test.ts'],
+    // Generated route smoke specs run on their own: npm run test:smoke (vitest.smoke.config.ts).
+    exclude: [...configDefaults.exclude, 'src/test/generated/**'],
     setupFiles: ['src/test/setup.ts'],
     coverage: {
       provider: 'v8',
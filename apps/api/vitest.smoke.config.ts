@@ -0,0 +1,12 @@
+import { defineConfig } from 'vitest/config';
+
+// Smoke specs for the generated ebay-* routers, written by codex/smoke_tests.py.
+// Kept out of the default suite (vitest.config.ts); run with npm run test:smoke.
+export default defineConfig({
+  test: {
+    globals: true,
+    environment: 'node',
+    include: ['src/test/generated/**/*.test.ts'],
+    testTimeout: 30000,
+  },
+});
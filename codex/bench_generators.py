@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Benchmark the codex generators against a throwaway directory tree.
+
+Each scenario runs in a forked child process with ROUTES_DIR / UI_DIR /
+TESTS_DIR / OUTPUT_DIR / ROUTES_FILE pointed at a fresh temporary directory, so
+the real checkout is never touched and peak RSS is measured per scenario.
+
+Scenarios:
+  series-<N>   generate_series for the first N series + one update_routes_batch
+  ui-<N>       make_ui_page for every route of the first N series (render only)
+  writer-<m>   OutputWriter throughput for WRITER_FILES route-sized files, with
+               durability mode m: nosync (renames only), batched (fsync
+               checkpoints every DEFAULT_SYNC_EVERY files) or perfile (fsync
+               after every file)
+  elite        generate_elite.main()
+  titan        generate-titan.py main()
+
+Usage: python3 bench_generators.py [--sizes 1,10,156] [--json out.json] [--baseline old.json]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+from output_backend import DEFAULT_SYNC_EVERY
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WRITER_FILES = 5000
+
+SEED_ROUTES = """import { Express } from 'express';
+
+export function registerEbayRoutes(app: Express): void {
+}
+"""
+
+
+def load_script(filename: str, name: str):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def point_at(module, root: str):
+    """Redirect a generator module's hardcoded paths into root."""
+    paths = {
+        "ROUTES_DIR": os.path.join(root, "apps/api/src/routes"),
+        "UI_DIR": os.path.join(root, "apps/web/src/app/ebay"),
+        "TESTS_DIR": os.path.join(root, "apps/api/src/test/generated"),
+        "OUTPUT_DIR": os.path.join(root, "codex/output"),
+        "ROUTES_FILE": os.path.join(root, "apps/api/src/routes/ebay-routes.ts"),
+    }
+    for attr, path in paths.items():
+        if hasattr(module, attr):
+            setattr(module, attr, path)
+    os.makedirs(paths["ROUTES_DIR"], exist_ok=True)
+    os.makedirs(paths["OUTPUT_DIR"], exist_ok=True)
+    with open(paths["ROUTES_FILE"], "w") as f:
+        f.write(SEED_ROUTES)
+
+
+def tree_size(root: str):
+    files = size = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            files += 1
+            size += os.path.getsize(os.path.join(dirpath, filename))
+    return files, size
+
+
+def bench_series(root: str, count: int) -> dict:
+    gs = load_script("generate_series.py", "generate_series")
+    point_at(gs, root)
+    names = list(gs.SERIES_ADJECTIVES)[:count]
+    plan = gs.plan_batch(names, 100000)
+    writer = gs.make_writer(gs.OUTPUT_DIR, "fs")
+
+    started = time.perf_counter()
+    for series_name, start, _ in plan:
+        gs.generate_series(series_name, start, writer)
+    generated = time.perf_counter()
+    gs.update_routes_batch(plan, writer)
+    writer.close()
+    finished = time.perf_counter()
+
+    return {
+        "series": len(plan),
+        "files": writer.written + writer.skipped,
+        "bytes_written": writer.bytes_written,
+        "update_routes_s": finished - generated,
+        "fsync_s": writer.backend.sync_s,
+        "wall_s": finished - started,
+    }
+
+
+def bench_writer(root: str, sync_every: int) -> dict:
+    """Write WRITER_FILES distinct API-template-sized files, 70 per directory like a series."""
+    gs = load_script("generate_series.py", "generate_series")
+    writer = gs.make_writer(os.path.join(root, "codex/output"), "fs", sync_every)
+    started = time.perf_counter()
+    for i in range(WRITER_FILES):
+        path = os.path.join(root, "routes", f"d{i // 70}", f"route-{i}.ts")
+        writer.write(path, f"// {i}\n" + gs.API_TEMPLATE)
+    writer.close()
+    elapsed = time.perf_counter() - started
+    return {"files": writer.written, "bytes_written": writer.bytes_written, "wall_s": elapsed,
+            "fsync_s": writer.backend.sync_s, "checkpoints": writer.backend.checkpoints}
+
+
+def bench_ui(root: str, count: int) -> dict:
+    gs = load_script("generate_series.py", "generate_series")
+    specs = [
+        spec
+        for series_name in list(gs.SERIES_ADJECTIVES)[:count]
+        for spec in gs.iter_route_specs(series_name, gs.SERIES_ADJECTIVES[series_name], 0,
+                                        gs.CATEGORIES, gs.CAT_NOUNS, gs.COLORS)
+    ]
+    size = 0
+    started = time.perf_counter()
+    for spec in specs:
+        size += len(gs.make_ui_page(spec.route_name, spec.color, spec.category))
+    elapsed = time.perf_counter() - started
+    hits, misses = gs.ui_cache_counts()
+    return {"series": count, "files": len(specs), "bytes_rendered": size, "wall_s": elapsed,
+            "ui_cache_hits": hits, "ui_cache_misses": misses}
+
+
+def bench_script(root: str, filename: str, name: str) -> dict:
+    module = load_script(filename, name)
+    point_at(module, root)
+    seed_files, seed_size = tree_size(root)
+    started = time.perf_counter()
+    module.main()
+    elapsed = time.perf_counter() - started
+    files, size = tree_size(root)
+    return {"files": files - seed_files, "bytes_written": size - seed_size, "wall_s": elapsed}
+
+
+def _child(queue, scenario, args):
+    root = tempfile.mkdtemp(prefix="codex-bench-")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = scenario(root, *args)
+        result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        queue.put(result)
+    except Exception as e:  # surfaced in the parent
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def run_isolated(scenario, *args) -> dict:
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child, args=(queue, scenario, args))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    if result.get("wall_s"):
+        result["files_per_s"] = result["files"] / result["wall_s"]
+    return result
+
+
+def scenarios(sizes):
+    for n in sizes:
+        yield f"series-{n}", bench_series, (n,)
+    for n in sizes:
+        yield f"ui-{n}", bench_ui, (n,)
+    yield "writer-nosync", bench_writer, (-1,)
+    yield "writer-batched", bench_writer, (DEFAULT_SYNC_EVERY,)
+    yield "writer-perfile", bench_writer, (1,)
+    yield "elite", bench_script, ("generate_elite.py", "generate_elite")
+    yield "titan", bench_script, ("generate-titan.py", "generate_titan")
+
+
+def print_table(results: dict, baseline: dict):
+    print(f"{'scenario':<15} {'wall s':>9} {'files/s':>10} {'MB':>8} {'rss MB':>8} {'routes s':>9} "
+          f"{'fsync s':>8} {'vs base':>8}")
+    for name, r in results.items():
+        size = r.get("bytes_written", r.get("bytes_rendered", 0)) / 1e6
+        delta = ""
+        if name in baseline and baseline[name].get("wall_s"):
+            delta = f"{100.0 * (r['wall_s'] / baseline[name]['wall_s'] - 1):+.0f}%"
+        routes = f"{r['update_routes_s']:.3f}" if "update_routes_s" in r else "-"
+        fsync = f"{r['fsync_s']:.3f}" if "fsync_s" in r else "-"
+        print(f"{name:<15} {r['wall_s']:>9.3f} {r.get('files_per_s', 0):>10.0f} {size:>8.2f} "
+              f"{r['peak_rss_kb'] / 1024:>8.1f} {routes:>9} {fsync:>8} {delta:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the codex generators in a temporary tree.")
+    parser.add_argument("--sizes", default="1,10,156", help="comma-separated series counts (default: 1,10,156)")
+    parser.add_argument("--json", dest="json_path", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="previous --json output to compare wall time against")
+    args = parser.parse_args(argv)
+
+    sizes = [int(n) for n in args.sizes.split(",") if n]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    for name, scenario, scenario_args in scenarios(sizes):
+        results[name] = run_isolated(scenario, *scenario_args)
+
+    print_table(results, baseline)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
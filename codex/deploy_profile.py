@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Deployment profiles: stage an API + web tree that contains only enabled series.
+
+ebay-routes.ts imports and mounts every series that was ever generated. A
+profile, codex/profiles/<name>.json, lists what a deployment serves:
+
+  {"series": ["blaze", "storm"], "categories": ["listing", "order"]}
+
+("categories" is optional; without it every category of the listed series is
+kept). build_profile() stages apps/api and apps/web into
+codex/output/profiles/<name>/ and leaves the generated sources untouched:
+
+  * route modules and UI pages of generated routes outside the profile (per
+    the route registry, see route_db.py) are left out;
+  * ebay-routes.ts and the ebay-routes-<series>.ts shards lose their mounts and
+    imports, and shards of series without any enabled route are unhooked;
+  * the lazy manifest, the shared router table, the dispatch table (with its
+    trie and dispatcher) and the ebay/[slug] UI manifest are filtered;
+  * the generated smoke specs (apps/api/src/test/generated) are not staged.
+
+Every other file is hard-linked from the source tree (or copied with --copy,
+or when linking fails), so staging costs one directory walk. Rewritten files
+are replaced, never written through a link. Hand-written routes are kept.
+
+Usage: python3 deploy_profile.py <profile name|path.json> [--out DIR] [--copy]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+from lazy_registry import MANIFEST_FILE as LAZY_MANIFEST_FILE, render_manifest as render_lazy_manifest
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import OUTPUT_DIR, ROUTES_DIR, ROUTES_FILE, SHARD_PREFIX, connect, db_path, generated_routes
+from route_dispatch import (DISPATCHER_FILE, TABLE_FILE as DISPATCH_TABLE_FILE, TRIE_FILE, render_dispatcher,
+                            render_table as render_dispatch_table, render_trie_module)
+from route_registry import prune_routes
+from route_shards import register_function, shard_module
+from run_profile import PROFILE
+from shared_router import TABLE_FILE as SHARED_TABLE_FILE, render_table as render_shared_table
+from ui_manifest import MANIFEST_FILE as UI_MANIFEST_FILE, SLUG_DIR, render_manifest as render_ui_manifest
+
+PROFILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+UI_DIR = repo_path("apps/web/src/app/ebay")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
+STAGED_APPS = (repo_path("apps/api"), repo_path("apps/web"))
+SKIP_DIRS = {"node_modules", "dist", ".next", ".turbo", "coverage"}
+MARKER = ".deploy-profile"
+
+
+class ProfileError(Exception):
+    pass
+
+
+def profile_path(name: str) -> str:
+    return name if name.endswith(".json") else os.path.join(PROFILES_DIR, f"{name}.json")
+
+
+def load_profile(name: str) -> dict:
+    path = profile_path(name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except FileNotFoundError:
+        raise ProfileError(f"no profile at {path}")
+    if not isinstance(profile.get("series"), list) or not profile["series"]:
+        raise ProfileError(f"{path}: 'series' must be a non-empty list")
+    if "categories" in profile and not isinstance(profile["categories"], list):
+        raise ProfileError(f"{path}: 'categories' must be a list")
+    profile["name"] = os.path.basename(path)[: -len(".json")]
+    return profile
+
+
+def split_routes(profile: dict, rows):
+    """(enabled, disabled) registry rows of generated routes under profile."""
+    series = set(profile["series"])
+    categories = set(profile["categories"]) if "categories" in profile else None
+    enabled, disabled = [], []
+    for row in rows:
+        keep = row["series"] in series and (categories is None or row["category"] in categories)
+        (enabled if keep else disabled).append(row)
+    return enabled, disabled
+
+
+def _filtered_json(path: str, keep):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return keep(json.load(f))
+
+
+def rewrites(disabled, dropped_series) -> dict:
+    """{source path: pruned content} for every registry/manifest file the profile changes."""
+    names = {row["route_name"] for row in disabled}
+    shard_modules = [shard_module(s) for s in dropped_series]
+    shard_calls = [f"{register_function(s)}(app);" for s in dropped_series]
+    out = {}
+    for name in sorted(os.listdir(ROUTES_DIR)):
+        path = os.path.join(ROUTES_DIR, name)
+        if path == ROUTES_FILE or (name.startswith(SHARD_PREFIX) and name.endswith(".ts")):
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            pruned = prune_routes(text, names, shard_modules, shard_calls)
+            if pruned != text:
+                out[path] = pruned
+
+    lazy = _filtered_json(os.path.join(ROUTES_DIR, LAZY_MANIFEST_FILE),
+                          lambda routes: {k: v for k, v in routes.items() if k not in names})
+    if lazy is not None:
+        out[os.path.join(ROUTES_DIR, LAZY_MANIFEST_FILE)] = render_lazy_manifest(lazy)
+    shared = _filtered_json(os.path.join(ROUTES_DIR, SHARED_TABLE_FILE),
+                            lambda table: {v: [n for n in ns if n not in names] for v, ns in table.items()})
+    if shared is not None:
+        out[os.path.join(ROUTES_DIR, SHARED_TABLE_FILE)] = render_shared_table(shared)
+    dispatch = _filtered_json(os.path.join(ROUTES_DIR, DISPATCH_TABLE_FILE),
+                              lambda table: [n for n in table if n not in names])
+    if dispatch is not None:
+        out[os.path.join(ROUTES_DIR, DISPATCH_TABLE_FILE)] = render_dispatch_table(dispatch)
+        out[os.path.join(ROUTES_DIR, TRIE_FILE)] = render_trie_module(dispatch)
+        out[os.path.join(ROUTES_DIR, DISPATCHER_FILE)] = render_dispatcher(dispatch)
+
+    slugs = {name[len("ebay-"):] for name in names}
+    manifest_path = os.path.join(UI_DIR, SLUG_DIR, UI_MANIFEST_FILE)
+    ui = _filtered_json(manifest_path, lambda m: {**m, "pages": {s: e for s, e in m["pages"].items()
+                                                                 if s not in slugs}})
+    if ui is not None:
+        out[manifest_path] = render_ui_manifest(ui)
+    return out
+
+
+def _clear_stage(stage: str):
+    if os.path.isdir(stage) and os.listdir(stage):
+        if not os.path.exists(os.path.join(stage, MARKER)):
+            raise ProfileError(f"{stage} is not empty and was not staged by deploy_profile.py; refusing to clear it")
+        shutil.rmtree(stage)
+    os.makedirs(stage, exist_ok=True)
+
+
+@PROFILE.timed("deploy profile")
+def build_profile(profile: dict, stage: str = None, copy: bool = False, output_dir: str = OUTPUT_DIR) -> dict:
+    """Stage the profile's tree; returns counts for the summary line."""
+    stage = stage or os.path.join(output_dir, "profiles", profile["name"])
+    if not os.path.exists(db_path(output_dir)):
+        raise ProfileError(f"no route registry at {db_path(output_dir)}; run a generator first")
+    conn = connect(db_path(output_dir))
+    try:
+        rows = generated_routes(conn)
+    finally:
+        conn.close()
+    known = {row["series"] for row in rows}
+    unknown = sorted(set(profile["series"]) - known)
+    if unknown:
+        print(f"Warning: profile {profile['name']} lists series with no generated routes: {', '.join(unknown)}")
+    enabled, disabled = split_routes(profile, rows)
+    dropped_series = sorted(known - {row["series"] for row in enabled})
+
+    root = repo_path()
+    skipped = {os.path.join(root, row[column]) for row in disabled for column in ("api_file", "ui_file")
+               if row[column]}
+    skipped |= {os.path.join(ROUTES_DIR, shard_module(s) + ".ts") for s in dropped_series}
+    replaced = {path: text for path, text in rewrites(disabled, dropped_series).items() if path not in skipped}
+
+    _clear_stage(stage)
+    stats = {"linked": 0, "copied": 0, "rewritten": 0, "skipped": 0, "bytes": 0}
+    for app_dir in STAGED_APPS:
+        for dirpath, dirnames, filenames in os.walk(app_dir):
+            dirnames[:] = [d for d in dirnames
+                           if d not in SKIP_DIRS and os.path.join(dirpath, d) != TESTS_DIR]
+            target_dir = os.path.join(stage, os.path.relpath(dirpath, root))
+            made = False
+            for filename in filenames:
+                source = os.path.join(dirpath, filename)
+                if source in skipped:
+                    stats["skipped"] += 1
+                    continue
+                if source in replaced:
+                    continue
+                if not made:
+                    os.makedirs(target_dir, exist_ok=True)
+                    made = True
+                target = os.path.join(target_dir, filename)
+                stats["bytes"] += os.path.getsize(source)
+                if not copy:
+                    try:
+                        os.link(source, target)
+                        stats["linked"] += 1
+                        continue
+                    except OSError:
+                        pass
+                shutil.copy2(source, target)
+                stats["copied"] += 1
+
+    writer = make_writer(stage)
+    for source, text in replaced.items():
+        writer.write(os.path.join(stage, os.path.relpath(source, root)), text)
+        stats["rewritten"] += 1
+        stats["bytes"] += len(text.encode("utf-8"))
+    writer.write(os.path.join(stage, MARKER),
+                 json.dumps({k: v for k, v in profile.items() if k != "name"}, indent=2) + "\n")
+    writer.close()
+    stats.update(stage=stage, enabled=len(enabled), disabled=len(disabled), dropped_series=dropped_series)
+    return stats
+
+
+def summary(profile: dict, stats: dict) -> str:
+    return (f"Profile {profile['name']}: {stats['enabled']} generated routes kept, {stats['disabled']} pruned "
+            f"({len(stats['dropped_series'])} series dropped); {stats['linked']} files linked, "
+            f"{stats['copied']} copied, {stats['rewritten']} rewritten, {stats['skipped']} left out, "
+            f"{stats['bytes'] / 1e6:.1f} MB staged in {stats['stage']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stage an apps/api + apps/web tree with only a profile's series.")
+    parser.add_argument("profile", help="profile name (codex/profiles/<name>.json) or path to a profile .json")
+    parser.add_argument("--out", default=None, help="stage directory (default: codex/output/profiles/<name>)")
+    parser.add_argument("--copy", action="store_true", help="copy files instead of hard-linking them")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    try:
+        profile = load_profile(args.profile)
+        stats = build_profile(profile, args.out, args.copy)
+    except ProfileError as e:
+        print(f"Error: {e}")
+        return 1
+    print(summary(profile, stats) + f" ({time.perf_counter() - started:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
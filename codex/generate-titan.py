@@ -1,10 +1,33 @@
 #!/usr/bin/env python3
-"""Generate eBay Phase 2401-2470 (Titan series) route files."""
+"""Generate eBay Phase 2401-2470 (Titan series) route files.
+
+Pass --shared to mount the routes on the shared standard router instead of
+writing one file per route, or --dispatch to also add them to the radix-trie
+dispatch table (see route_dispatch.py).
+
+Pass --static-responses to write routers that send precomputed JSON buffers
+(with ETag / 304 support) instead of calling res.json() per request.
+
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-generate-titan.json / .pstats).
+"""
 
 import os
+import sys
 
-ROUTES_DIR = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import record_routes, route_row
+from route_dispatch import DISPATCH_CONFLICT, emit_dispatch_routes
+from run_profile import profile_run
+from shared_router import BUNDLE_HANDLER, emit_shared_routes, variant_of
+from smoke_tests import emit_smoke_tests
+from static_router import SHARED_CONFLICT, static_template
+
+ROUTES_DIR = repo_path("apps/api/src/routes")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
 
 ROUTE_CONTENT = r"""import { Router } from 'express';
 import type { Request, Response } from 'express';
@@ -53,6 +76,24 @@ router.get('/export', (_req: Request, res: Response) => res.json({ section: 'uti
 router.post('/import', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'import' }));
 router.post('/sync', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'sync' }));
 
+// Bundle (1)
+const BUNDLE: Record<string, { section: string; action: string }> = {
+  'dashboard': { section: 'dashboard', action: 'dashboard' },
+  'dashboard/summary': { section: 'dashboard', action: 'summary' },
+  'dashboard/metrics': { section: 'dashboard', action: 'metrics' },
+  'dashboard/recent': { section: 'dashboard', action: 'recent' },
+  'dashboard/alerts': { section: 'dashboard', action: 'alerts' },
+  'tests': { section: 'tests', action: 'list' },
+  'variants': { section: 'variants', action: 'list' },
+  'listings': { section: 'listings', action: 'list' },
+  'analytics': { section: 'analytics', action: 'analytics' },
+  'analytics/overview': { section: 'analytics', action: 'overview' },
+  'analytics/trends': { section: 'analytics', action: 'trends' },
+  'settings': { section: 'settings', action: 'get' },
+  'health': { section: 'utilities', action: 'health' },
+  'export': { section: 'utilities', action: 'export' },
+};
+""" + BUNDLE_HANDLER + r"""
 export default router;
 """
 
@@ -169,15 +210,24 @@ def to_camel_case(name):
 def to_route_path(name):
     return f"/api/{name}"
 
-def main():
-    # 1. Generate route files
-    created = 0
-    for name in FILE_NAMES:
-        filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
-        with open(filepath, "w") as f:
-            f.write(ROUTE_CONTENT)
-        created += 1
-    print(f"Created {created} route files in {ROUTES_DIR}")
+def main(shared: bool = False, static_responses: bool = False, dispatch: bool = False):
+    template = static_template(ROUTE_CONTENT) if static_responses else ROUTE_CONTENT
+    writer = make_writer(OUTPUT_DIR)
+
+    # 1. Generate route files (or mount them on the shared standard router)
+    if shared:
+        added = emit_shared_routes(ROUTES_DIR, ROUTES_FILE, variant_of(ROUTE_CONTENT), FILE_NAMES, writer,
+                                   [("titan", PHASE_GROUPS[0][0], PHASE_GROUPS[-1][1])])
+        print(f"Added {added} Titan routes to the shared router table")
+    else:
+        for name in FILE_NAMES:
+            filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
+            writer.write(filepath, template)
+        print(f"Route files in {ROUTES_DIR}: {writer.summary()}")
+    if dispatch:
+        added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, FILE_NAMES, writer, (), OUTPUT_DIR,
+                                     [("titan", PHASE_GROUPS[0][0], PHASE_GROUPS[-1][1])])
+        print(f"Added {added} Titan routes to the route dispatch table")
 
     # 2. Generate imports and registrations
     imports_lines = []
@@ -199,14 +249,30 @@ def main():
         registrations_lines.append("")
 
     imports_path = os.path.join(OUTPUT_DIR, "titan-imports.txt")
-    with open(imports_path, "w") as f:
-        f.write("\n".join(imports_lines) + "\n")
+    writer.write(imports_path, "\n".join(imports_lines) + "\n")
     print(f"Written imports to {imports_path}")
 
     registrations_path = os.path.join(OUTPUT_DIR, "titan-registrations.txt")
-    with open(registrations_path, "w") as f:
-        f.write("\n".join(registrations_lines) + "\n")
+    writer.write(registrations_path, "\n".join(registrations_lines) + "\n")
     print(f"Written registrations to {registrations_path}")
 
+    record_routes(OUTPUT_DIR, [
+        route_row(name, 2401 + i, "titan", "generate-titan", template=template,
+                  api_file=None if shared else os.path.join(ROUTES_DIR, f"{name}.ts"))
+        for i, name in enumerate(FILE_NAMES)
+    ], writer)
+    shards = emit_smoke_tests("titan", FILE_NAMES, variant_of(ROUTE_CONTENT), writer, ROUTES_DIR, TESTS_DIR, shared)
+    print(f"Smoke specs: {shards} shards in {TESTS_DIR}")
+    writer.close()
+
 if __name__ == "__main__":
-    main()
+    options = dict(shared="--shared" in sys.argv[1:], static_responses="--static-responses" in sys.argv[1:],
+                   dispatch="--dispatch" in sys.argv[1:])
+    if options["shared"] and options["static_responses"]:
+        sys.exit(SHARED_CONFLICT)
+    if options["shared"] and options["dispatch"]:
+        sys.exit(DISPATCH_CONFLICT)
+    if "--profile" in sys.argv[1:]:
+        profile_run("generate-titan", OUTPUT_DIR, main, **options)
+    else:
+        main(**options)
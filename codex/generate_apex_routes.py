@@ -1,10 +1,34 @@
 #!/usr/bin/env python3
-"""Generate eBay Phase 2331-2400 (Apex series) route files."""
+"""Generate eBay Phase 2331-2400 (Apex series) route files.
+
+Pass --lazy to also add the routes to the lazy route manifest, --dispatch to
+add them to the radix-trie dispatch table (see route_dispatch.py), or --shared
+to mount them on the shared standard router instead of writing one file per route.
+
+Pass --static-responses to write routers that send precomputed JSON buffers
+(with ETag / 304 support) instead of calling res.json() per request.
+
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-generate_apex_routes.json / .pstats).
+"""
 
 import os
+import sys
 
-ROUTES_DIR = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+from lazy_registry import emit_lazy_routes
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import record_routes, route_row
+from route_dispatch import DISPATCH_CONFLICT, emit_dispatch_routes
+from run_profile import profile_run
+from shared_router import BUNDLE_HANDLER, emit_shared_routes, variant_of
+from smoke_tests import emit_smoke_tests
+from static_router import SHARED_CONFLICT, static_template
+
+ROUTES_DIR = repo_path("apps/api/src/routes")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
 
 TEMPLATE = '''import { Router } from 'express';
 import type { Request, Response } from 'express';
@@ -53,6 +77,24 @@ router.get('/export', (_req: Request, res: Response) => res.json({ section: 'uti
 router.post('/import', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'import' }));
 router.post('/sync', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'sync' }));
 
+// Bundle (1)
+const BUNDLE: Record<string, { section: string; action: string }> = {
+  'dashboard': { section: 'dashboard', action: 'dashboard' },
+  'dashboard/summary': { section: 'dashboard', action: 'summary' },
+  'dashboard/metrics': { section: 'dashboard', action: 'metrics' },
+  'dashboard/recent': { section: 'dashboard', action: 'recent' },
+  'dashboard/alerts': { section: 'dashboard', action: 'alerts' },
+  'tests': { section: 'tests', action: 'list' },
+  'variants': { section: 'variants', action: 'list' },
+  'listings': { section: 'listings', action: 'list' },
+  'analytics': { section: 'analytics', action: 'analytics' },
+  'analytics/overview': { section: 'analytics', action: 'overview' },
+  'analytics/trends': { section: 'analytics', action: 'trends' },
+  'settings': { section: 'settings', action: 'get' },
+  'health': { section: 'utilities', action: 'health' },
+  'export': { section: 'utilities', action: 'export' },
+};
+''' + BUNDLE_HANDLER + '''
 export default router;
 '''
 
@@ -163,21 +205,22 @@ def kebab_to_camel(kebab):
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
-def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def main(lazy: bool = False, shared: bool = False, static_responses: bool = False, dispatch: bool = False):
+    template = static_template(TEMPLATE) if static_responses else TEMPLATE
 
     imports_lines = []
     registrations_lines = []
     total_files = 0
+    writer = make_writer(OUTPUT_DIR)
 
     for start, end, names in GROUPS:
         registrations_lines.append(f"// Phase {start}-{end}")
 
         for name in names:
-            filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
-            with open(filepath, "w") as f:
-                f.write(TEMPLATE)
-            total_files += 1
+            if not shared:
+                filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
+                writer.write(filepath, template)
+                total_files += 1
 
             var_name = kebab_to_camel(name) + "Router"
 
@@ -192,17 +235,50 @@ def main():
         registrations_lines.append("")
 
     imports_path = os.path.join(OUTPUT_DIR, "apex-imports.txt")
-    with open(imports_path, "w") as f:
-        f.write("\n".join(imports_lines) + "\n")
+    writer.write(imports_path, "\n".join(imports_lines) + "\n")
 
     registrations_path = os.path.join(OUTPUT_DIR, "apex-registrations.txt")
-    with open(registrations_path, "w") as f:
-        f.write("\n".join(registrations_lines) + "\n")
+    writer.write(registrations_path, "\n".join(registrations_lines) + "\n")
+
+    if shared:
+        names = [name for _, _, group in GROUPS for name in group]
+        added = emit_shared_routes(ROUTES_DIR, ROUTES_FILE, variant_of(TEMPLATE), names, writer,
+                                   [("apex", GROUPS[0][0], GROUPS[-1][1])])
+        print(f"Added {added} Apex routes to the shared router table")
+    elif dispatch:
+        names = [name for _, _, group in GROUPS for name in group]
+        added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, names, writer, (), OUTPUT_DIR,
+                                     [("apex", GROUPS[0][0], GROUPS[-1][1])])
+        print(f"Added {added} Apex routes to the route dispatch table")
+    elif lazy:
+        names = [name for _, _, group in GROUPS for name in group]
+        added = emit_lazy_routes(ROUTES_DIR, ROUTES_FILE, names, writer,
+                                 [("apex", GROUPS[0][0], GROUPS[-1][1])])
+        print(f"Added {added} Apex routes to the lazy route manifest")
+    record_routes(OUTPUT_DIR, [
+        route_row(name, start + i, "apex", "generate_apex_routes", template=template,
+                  api_file=None if shared else os.path.join(ROUTES_DIR, f"{name}.ts"))
+        for start, _, group in GROUPS
+        for i, name in enumerate(group)
+    ], writer)
+    shards = emit_smoke_tests("apex", [name for _, _, group in GROUPS for name in group], variant_of(TEMPLATE),
+                              writer, ROUTES_DIR, TESTS_DIR, shared)
+    writer.close()
 
-    print(f"Generated {total_files} route files in {ROUTES_DIR}")
+    print(f"Generated {total_files} route files in {ROUTES_DIR} ({writer.summary()})")
     print(f"Generated imports: {imports_path}")
     print(f"Generated registrations: {registrations_path}")
+    print(f"Smoke specs: {shards} shards in {TESTS_DIR}")
 
 
 if __name__ == "__main__":
-    main()
+    options = dict(lazy="--lazy" in sys.argv[1:], shared="--shared" in sys.argv[1:],
+                   static_responses="--static-responses" in sys.argv[1:], dispatch="--dispatch" in sys.argv[1:])
+    if options["shared"] and options["static_responses"]:
+        sys.exit(SHARED_CONFLICT)
+    if options["shared"] and options["dispatch"]:
+        sys.exit(DISPATCH_CONFLICT)
+    if "--profile" in sys.argv[1:]:
+        profile_run("generate_apex_routes", OUTPUT_DIR, main, **options)
+    else:
+        main(**options)
@@ -1,4 +1,22 @@
-"""Generate import and registration text blocks for eBay Elite series phases 2191-2260."""
+"""Generate import and registration text blocks for eBay Elite series phases 2191-2260.
+
+Pass --lazy to add the Elite routes to the lazy route manifest instead, or
+--dispatch to add them to the radix-trie dispatch table (see route_dispatch.py;
+routes whose router module does not exist yet are skipped).
+
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-generate_elite.json / .pstats).
+"""
+
+import os
+import sys
+
+from lazy_registry import emit_lazy_routes
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import record_routes, route_row
+from route_dispatch import emit_dispatch_routes
+from run_profile import profile_run
 
 FILE_NAMES = [
     "ebay-listing-intelligence-management-elite",
@@ -75,7 +93,9 @@ FILE_NAMES = [
 
 START_PHASE = 2191
 GROUP_SIZE = 5
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_DIR = repo_path("apps/api/src/routes")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
 
 
 def kebab_to_camel(kebab: str) -> str:
@@ -85,9 +105,34 @@ def kebab_to_camel(kebab: str) -> str:
     return camel + "Router"
 
 
-def main():
+def registry_rows():
+    # Elite writes no router files; api_file is the module its registrations import.
+    return [route_row(name, START_PHASE + i, "elite", "generate_elite",
+                      api_file=os.path.join(ROUTES_DIR, f"{name}.ts"))
+            for i, name in enumerate(FILE_NAMES)]
+
+
+def main(lazy: bool = False, dispatch: bool = False):
     assert len(FILE_NAMES) == 70, f"Expected 70 file names, got {len(FILE_NAMES)}"
 
+    if dispatch:
+        writer = make_writer(OUTPUT_DIR)
+        added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, FILE_NAMES, writer, (), OUTPUT_DIR,
+                                     [("elite", START_PHASE, START_PHASE + len(FILE_NAMES) - 1)])
+        record_routes(OUTPUT_DIR, registry_rows(), writer)
+        writer.close()
+        print(f"Added {added} Elite routes to the route dispatch table")
+        return
+
+    if lazy:
+        writer = make_writer(OUTPUT_DIR)
+        added = emit_lazy_routes(ROUTES_DIR, ROUTES_FILE, FILE_NAMES, writer,
+                                 [("elite", START_PHASE, START_PHASE + len(FILE_NAMES) - 1)])
+        record_routes(OUTPUT_DIR, registry_rows(), writer)
+        writer.close()
+        print(f"Added {added} Elite routes to the lazy route manifest")
+        return
+
     import_lines = []
     registration_lines = []
 
@@ -112,11 +157,11 @@ def main():
     imports_path = f"{OUTPUT_DIR}/elite-imports.txt"
     registrations_path = f"{OUTPUT_DIR}/elite-registrations.txt"
 
-    with open(imports_path, "w") as f:
-        f.write(imports_text)
-
-    with open(registrations_path, "w") as f:
-        f.write(registrations_text)
+    writer = make_writer(OUTPUT_DIR)
+    writer.write(imports_path, imports_text)
+    writer.write(registrations_path, registrations_text)
+    record_routes(OUTPUT_DIR, registry_rows(), writer)
+    writer.close()
 
     print(f"Written {len(FILE_NAMES)} import lines to {imports_path}")
     print(f"Written registration blocks to {registrations_path}")
@@ -124,4 +169,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    options = dict(lazy="--lazy" in sys.argv[1:], dispatch="--dispatch" in sys.argv[1:])
+    if "--profile" in sys.argv[1:]:
+        profile_run("generate_elite", OUTPUT_DIR, main, **options)
+    else:
+        main(**options)
@@ -1,13 +1,35 @@
 #!/usr/bin/env python3
-"""Generate eBay Phase series route + UI files. Reusable for any series."""
+"""Generate eBay Phase series route + UI files. Reusable for any series, or a batch of them."""
 
+import argparse
+import functools
 import os
+import re
 import sys
-
-ROUTES_DIR = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes"
-UI_DIR = "/Users/naokijodan/Desktop/rakuda/apps/web/src/app/ebay"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
-ROUTES_FILE = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes/ebay-routes.ts"
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from output_backend import repo_path
+from output_writer import make_writer
+import phase_planner
+from lazy_registry import emit_lazy_routes
+from route_dispatch import emit_dispatch_routes
+from route_registry import apply_series
+from route_shards import apply_shards
+from route_stream import LineSink, Progress, iter_route_specs
+from run_journal import IncompleteSeriesError, JournalError, RunJournal, check_complete, journal_path
+from run_profile import PROFILE, profile_run
+from series_data import SeriesIndex
+from shared_router import BUNDLE_HANDLER, emit_shared_routes, variant_of
+from static_router import SHARED_CONFLICT, static_template
+from ui_fetch import CACHED_FETCH, fetch_hooks
+from ui_manifest import emit_dynamic_ui
+
+ROUTES_DIR = repo_path("apps/api/src/routes")
+UI_DIR = repo_path("apps/web/src/app/ebay")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
 
 API_TEMPLATE = '''import { Router } from 'express';
 import type { Request, Response } from 'express';
@@ -56,6 +78,24 @@ router.get('/export', (_req: Request, res: Response) => res.json({ section: 'uti
 router.post('/import', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'import' }));
 router.post('/sync', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'sync' }));
 
+// Bundle (1)
+const BUNDLE: Record<string, { section: string; action: string }> = {
+  'dashboard': { section: 'dashboard', action: 'dashboard' },
+  'dashboard/summary': { section: 'dashboard', action: 'summary' },
+  'dashboard/metrics': { section: 'dashboard', action: 'metrics' },
+  'dashboard/recent': { section: 'dashboard', action: 'recent' },
+  'dashboard/alerts': { section: 'dashboard', action: 'alerts' },
+  'resources': { section: 'resources', action: 'list' },
+  'variants': { section: 'variants', action: 'list' },
+  'listings': { section: 'listings', action: 'list' },
+  'analytics': { section: 'analytics', action: 'analytics' },
+  'analytics/overview': { section: 'analytics', action: 'overview' },
+  'analytics/trends': { section: 'analytics', action: 'trends' },
+  'settings': { section: 'settings', action: 'get' },
+  'health': { section: 'utilities', action: 'health' },
+  'export': { section: 'utilities', action: 'export' },
+};
+''' + BUNDLE_HANDLER + '''
 export default router;
 '''
 
@@ -117,1151 +157,57 @@ CAT_UI_TABS = {
     ],
 }
 
-# Adjective sets for each series
-SERIES_ADJECTIVES = {
-    "blaze": [
-        "autonomous", "cognitive", "generative", "semantic", "contextual",
-        "adaptive-ai", "neural", "deep", "reinforced", "evolutionary",
-        "probabilistic", "heuristic", "algorithmic", "computational",
-    ],
-    "storm": [
-        "resilient", "fault-tolerant", "redundant", "recoverable", "durable",
-        "persistent", "consistent", "available", "partitioned", "replicated",
-        "sharded", "clustered", "federated", "synchronized",
-    ],
-    "wave": [
-        "event-driven", "stream", "pipeline", "workflow", "orchestrated",
-        "choreographed", "message", "queue", "pub-sub", "broadcast",
-        "multicast", "unicast", "bidirectional", "asynchronous",
-    ],
-    "prism": [
-        "observable", "traceable", "auditable", "loggable", "monitorable",
-        "measurable", "quantifiable", "benchmarkable", "profileable", "debuggable",
-        "inspectable", "diagnosable", "analyzable", "reportable",
-    ],
-    "nexus": [
-        "composable-v2", "modular-v2", "pluggable-v2", "extensible-v2", "configurable-v2",
-        "customizable", "themeable", "localizable", "accessible", "responsive-v2",
-        "progressive", "isomorphic", "universal", "hybrid-v2",
-    ],
-    "forge": [
-        "secure", "encrypted", "authenticated", "authorized", "validated",
-        "sanitized", "hardened", "isolated", "sandboxed", "containerized",
-        "immutable", "versioned", "cacheable", "optimizable",
-    ],
-    "drift": [
-        "temporal", "scheduled", "periodic", "recurring", "triggered",
-        "delayed", "throttled", "debounced", "batched", "queued",
-        "prioritized", "weighted", "balanced", "distributed-v2",
-    ],
-    "arc": [
-        "graph-based", "tree-based", "node-based", "edge-based", "mesh-based",
-        "hierarchical", "flat", "nested", "recursive", "iterative",
-        "parallel", "sequential", "concurrent", "transactional",
-    ],
-    "vortex": [
-        "data-driven", "model-driven", "domain-driven", "event-sourced", "cqrs-based",
-        "saga-based", "state-machine", "finite-state", "reactive-v2", "functional",
-        "declarative", "imperative", "procedural", "object-oriented",
-    ],
-    "echo": [
-        "cloud-native", "serverless", "microservice", "monolithic", "modular-v3",
-        "layered", "hexagonal", "clean-arch", "onion-arch", "vertical-slice",
-        "feature-based", "domain-based", "service-based", "component-based",
-    ],
-    "cipher": [
-        "zero-trust", "end-to-end", "blockchain", "tokenized", "obfuscated",
-        "decentralized", "verifiable", "trustless", "permissioned", "multi-sig",
-        "zero-knowledge", "homomorphic", "post-quantum", "threshold",
-    ],
-    "helix": [
-        "genomic", "evolutionary-v2", "mutagenic", "phenotypic", "epigenetic",
-        "proteomic", "metabolic", "symbiotic", "biometric", "enzymatic",
-        "catalytic", "polymorphic", "recombinant", "transgenic",
-    ],
-    "orbit": [
-        "orbital", "celestial", "gravitational", "interstellar", "planetary",
-        "asteroidal", "cometary", "galactic", "nebular", "stellar",
-        "pulsar", "quasar-based", "solar", "lunar",
-    ],
-    "matrix": [
-        "tensor", "vectorized", "matrix-based", "scalar", "eigenvalue",
-        "stochastic", "deterministic", "gradient", "bayesian", "markov",
-        "fourier", "laplacian", "gaussian", "poisson",
-    ],
-    "crystal": [
-        "crystalline", "amorphous", "polymeric", "ceramic", "metallic",
-        "composite", "nano-scale", "micro-scale", "macro-scale", "atomic",
-        "molecular", "ionic", "covalent", "quantum-dot",
-    ],
-    "dynamo": [
-        "kinetic", "potential", "thermal", "electromagnetic", "photovoltaic",
-        "piezoelectric", "thermoelectric", "hydroelectric", "geothermal", "nuclear",
-        "fusion-based", "fission-based", "plasma", "superconducting",
-    ],
-    "fusion": [
-        "cross-platform", "multi-tenant", "polyglot", "interoperable", "bridged",
-        "federated-v2", "gateway", "mesh", "sidecar", "proxy-based",
-        "load-balanced", "circuit-breaker", "bulkhead", "retry-based",
-    ],
-    "photon": [
-        "light-speed", "fiber-optic", "holographic", "spectral", "chromatic",
-        "infrared", "ultraviolet", "x-ray", "gamma", "terahertz",
-        "microwave", "radio-freq", "laser", "coherent",
-    ],
-    "quasar": [
-        "high-energy", "ultra-dense", "relativistic", "quantum-field", "string-theory",
-        "dark-matter", "dark-energy", "antimatter", "neutrino", "boson",
-        "fermion", "hadron", "lepton", "photonic",
-    ],
-    "nebula": [
-        "cloud-burst", "fog-computing", "edge-native", "mist-computing", "dew-computing",
-        "ambient", "ubiquitous", "pervasive", "context-aware", "location-aware",
-        "proximity", "geofenced", "beacon", "mesh-networked",
-    ],
-    "astral": [
-        "astral-plane", "dimensional", "transcendent", "ethereal", "celestial-v2",
-        "metaphysical", "quantum-leap", "hyperdimensional", "multiverse", "singularity",
-        "wormhole", "tesseract", "hyperspace", "subspace",
-    ],
-    "cosmic": [
-        "cosmic-ray", "supernova", "black-hole", "white-dwarf", "red-giant",
-        "neutron-star", "magnetar", "cosmic-web", "dark-flow", "cosmic-string",
-        "inflation", "big-bang", "cosmic-dawn", "recombination",
-    ],
-    "phantom": [
-        "stealth", "invisible", "cloaked", "shadow", "ghost",
-        "spectral-v2", "wraithlike", "ephemeral", "transient", "volatile",
-        "phantom-zone", "null-space", "void", "liminal",
-    ],
-    "thunder": [
-        "electrostatic", "lightning", "thunderbolt", "capacitive", "inductive",
-        "resonant", "oscillating", "pulsating", "surging", "cascading",
-        "avalanche", "breakdown", "discharge", "ionized",
-    ],
-    "glacier": [
-        "cryogenic", "frozen", "permafrost", "glacial", "icecore",
-        "snowflake", "crystallized", "frost", "subzero", "polar",
-        "arctic", "tundra", "alpine", "boreal",
-    ],
-    "ember": [
-        "incandescent", "molten", "pyroclastic", "volcanic", "magmatic",
-        "geothermal-v2", "hydrothermal", "fumarolic", "obsidian", "basaltic",
-        "igneous", "metamorphic", "sedimentary", "tectonic",
-    ],
-    "torrent": [
-        "fluvial", "deltaic", "estuarine", "riparian", "alluvial",
-        "hydraulic", "hydrodynamic", "turbulent", "laminar", "vortical",
-        "siphonic", "artesian", "aquifer", "watershed",
-    ],
-    "pinnacle": [
-        "summit", "apex-v2", "zenith-v2", "meridian", "culmination",
-        "acme", "paragon", "epitome", "archetype", "paradigm",
-        "exemplar", "benchmark-v2", "criterion", "touchstone",
-    ],
-    "aurora": [
-        "borealis", "australis", "solar-wind", "magnetospheric", "ionospheric",
-        "thermospheric", "mesospheric", "stratospheric", "tropospheric", "exospheric",
-        "chromospheric", "photospheric", "coronal", "heliospheric",
-    ],
-    "radiant": [
-        "luminous", "phosphorescent", "fluorescent", "bioluminescent", "chemiluminescent",
-        "triboluminescent", "electroluminescent", "cathodoluminescent", "radioluminescent", "sonoluminescent",
-        "thermoluminescent", "photoluminescent", "scintillating", "iridescent",
-    ],
-    "zenith": [
-        "apex-peak", "stratospheric-v2", "altitudinal", "summit-v2", "pinnacle-v2",
-        "climactic", "culminating", "supreme", "paramount", "preeminent",
-        "transcendental", "elevated", "ascendant", "sovereign",
-    ],
-    "cascade": [
-        "waterfall", "torrent-v2", "downstream", "tributary", "confluent",
-        "meandering", "cascading-v2", "overflowing", "spillway", "cataract",
-        "rapids", "whirlpool", "maelstrom", "undercurrent",
-    ],
-    "horizon": [
-        "panoramic", "wide-angle", "far-reaching", "boundary-v2", "frontier",
-        "peripheral", "vantage", "scenic", "expansive", "limitless",
-        "unbounded", "infinite-v2", "vast", "sweeping",
-    ],
-    "tempest": [
-        "cyclonic", "typhonic", "monsoon", "squall", "gale-force",
-        "hurricane", "tornado", "blizzard", "hailstorm", "downburst",
-        "windshear", "microburst", "supercell", "derecho",
-    ],
-    "mirage": [
-        "illusory", "phantasmal", "holographic-v2", "virtual-v2", "augmented",
-        "simulated", "synthetic-v2", "rendered", "projected", "refracted",
-        "diffracted", "scattered", "polarized", "prismatic",
-    ],
-    "vertex": [
-        "geometric", "topological", "fractal-v2", "tessellated", "polytopal",
-        "geodesic", "hyperbolic", "elliptic", "parabolic", "cylindrical",
-        "spherical", "toroidal", "helical", "spiral-v2",
-    ],
-    "solstice": [
-        "equinoctial", "diurnal", "nocturnal", "circadian", "seasonal-v2",
-        "vernal", "autumnal", "hibernal", "aestival", "solstitial",
-        "lunisolar", "sidereal-v2", "synodic", "tropical-v2",
-    ],
-    "nova": [
-        "supernova-v2", "hypernova", "kilonova", "micronova", "thermonuclear-v2",
-        "detonation", "deflagration", "implosion", "accretion", "ejection",
-        "progenitor", "remnant", "afterglow", "precursor",
-    ],
-    "eclipse": [
-        "penumbral", "umbral", "annular", "total", "partial",
-        "hybrid-v3", "saros", "syzygy", "occultation", "transit-v2",
-        "coronagraph", "limb-darkening", "baily-beads", "diamond-ring",
-    ],
-    "spectrum": [
-        "chromatic-v2", "monochromatic", "polychromatic", "achromatic", "dichroic",
-        "trichromatic", "tetrachromatic", "hyperspectral", "multispectral", "broadband",
-        "narrowband", "wideband", "baseband", "passband",
-    ],
-    "sentinel": [
-        "watchful", "warding", "vigilant", "stalwart", "ever-guard", "iron-bound", "hawk-eyed", "gate-keeping",
-        "oath-kept", "shield-ready", "border-wise", "threat-aware", "fortress-bred", "sentry-grade",
-    ],
-    "comet": [
-        "trail-blazing", "swift-arc", "hyper-velocity", "vector-driven", "streak-fast", "orbit-skirting",
-        "tail-lit", "apex-aimed", "glide-true", "sky-rending", "fast-track", "zero-drag", "jet-streamed", "path-cut",
-    ],
-    "titan": [
-        "ironclad", "heavy-forged", "mega-struct", "colossus-built", "steel-milled", "bulk-formed",
-        "power-dense", "load-bearing", "foundry-born", "rigid-frame", "monolith-cast", "factory-grade", "engine-room", "overbuilt",
-    ],
-    "spark": [
-        "ignite-ready", "fresh-lit", "idea-charged", "newly-minted", "start-up", "bold-forged",
-        "invention-primed", "seed-fired", "proto-made", "flash-born", "creative-surge", "draft-cut", "blueprint-bright", "origin-mark",
-    ],
-    "pulse": [
-        "beat-matched", "signal-clean", "rhythm-locked", "heart-timed", "wave-synced", "tempo-true",
-        "metered", "cadence-set", "throb-plain", "tick-driven", "vibe-steady", "cycle-tuned", "frequency-set", "tone-pure",
-    ],
-    "meridian": [
-        "map-aligned", "north-marked", "course-true", "grid-locked", "waypointed", "bearing-set",
-        "chart-ready", "track-lined", "azimuth-fixed", "longitudinal", "latitude-bound", "route-certain", "compass-led", "coordinate-sure",
-    ],
-    "aegis": [
-        "shielded", "barrier-built", "wall-borne", "fortified", "armor-plated", "defense-grade",
-        "bastion-strong", "guard-stitched", "bulwark-set", "rampart-locked", "safe-keep", "counterstrike", "redoubt-ready", "vaulted",
-    ],
-    "catalyst": [
-        "reaction-led", "transformative", "phase-shift", "accelerant", "chain-start", "change-forged",
-        "mix-triggered", "rapid-turn", "conversion-ready", "flux-driven", "mutation-spun", "boost-primed", "shift-fueled", "rate-raised",
-    ],
-    "stratos": [
-        "high-alt", "upper-layer", "sky-stacked", "airborne", "cloud-borne", "thin-air",
-        "jet-level", "altitude-rich", "upper-atmo", "layered-sky", "strata-swept", "lifted", "aero-tier", "roofline",
-    ],
-    "quantum": [
-        "probability-tuned", "entangle-linked", "superposed", "spin-aligned", "wavefunction", "micro-scale",
-        "particle-sharp", "uncertainty-aware", "qubit-ready", "state-split", "phase-locked", "field-coupled", "collapse-bound", "tunneling",
-    ],
-    "obsidian": [
-        "volcanic-glass", "razor-edged", "mirror-dark", "lava-born", "vitreous", "jet-black",
-        "flint-hard", "silica-rich", "shard-keen", "gloss-smooth", "magma-forged", "tecton-cut", "flow-banded", "perlite",
-    ],
-    "tidal": [
-        "spring-tide", "neap-bound", "lunar-drawn", "ebb-flowing", "surge-mapped", "coast-locked",
-        "wave-carved", "reef-swept", "current-wise", "deep-pull", "swell-driven", "shore-bound", "bay-curved", "lagoon-still",
-    ],
-    "basalt": [
-        "column-formed", "lava-laid", "flood-plain", "pillow-shaped", "vesicular", "porphyritic",
-        "olivine-rich", "pyroxene-dark", "fine-grained", "extrusive", "mafic-dense", "plateau-built", "dike-cut", "sill-spread",
-    ],
-    "sapphire": [
-        "corundum-pure", "blue-deep", "star-formed", "facet-cut", "clarity-graded", "carat-weighed",
-        "padparadscha", "kashmir-hued", "heat-treated", "gem-set", "cabochon-round", "brilliant-cut", "pavilion-angled", "crown-faceted",
-    ],
-    "condor": [
-        "high-soaring", "thermal-riding", "wing-spread", "peak-nesting", "updraft-borne", "ridge-gliding",
-        "canyon-cruising", "alpine-dwelling", "keen-sighted", "cliff-perched", "wind-mastered", "sky-ruling", "range-crossing", "summit-bound",
-    ],
-    "tungsten": [
-        "ultra-dense", "heat-proof", "arc-resistant", "filament-grade", "high-melting", "carbide-hard",
-        "alloy-tough", "sintered", "refractory", "electrode-fit", "ballast-heavy", "tool-steel", "wear-proof", "spark-plug",
-    ],
-    "mangrove": [
-        "root-tangled", "brackish-water", "salt-tolerant", "coast-guarding", "tide-adapted", "prop-rooted",
-        "estuary-bound", "nursery-rich", "canopy-dense", "storm-buffer", "sediment-trap", "carbon-sink", "bio-diverse", "inter-tidal",
-    ],
-    "opal": [
-        "fire-flash", "play-of-color", "silica-gel", "hydrated", "precious-grade", "boulder-set",
-        "black-opal", "white-opal", "crystal-clear", "matrix-held", "doublet-backed", "triplet-capped", "pinfire", "broadflash",
-    ],
-    "falcon": [
-        "stoop-diving", "raptor-swift", "talon-gripped", "prey-locked", "aerie-built", "hover-hunt",
-        "kestrel-keen", "peregrine-fast", "merlin-sized", "gyrfalcon-white", "saker-strong", "lanner-lean", "hobby-agile", "caracara-bold",
-    ],
-    "graphene": [
-        "mono-layer", "hex-lattice", "sp2-bonded", "zero-gap", "ballistic-transport", "flex-strong",
-        "ultra-thin", "high-conduct", "sheet-rolled", "nano-ribbon", "oxide-form", "doped-layer", "edge-state", "dirac-cone",
-    ],
-    # ===== New series for Phase 7231+ =====
-    "obsidian-v2": [
-        "glass-sharp", "mirror-polish", "lava-cooled", "edge-honed", "shard-split", "obsid-core",
-        "dark-gleam", "fracture-clean", "volcanic-born", "silica-dense", "smoke-black", "knap-ready", "flow-lined", "vitric-pure",
-    ],
-    "tundra": [
-        "permafrost-deep", "lichen-grown", "windswept-flat", "frost-heaved", "snow-packed", "ice-wedged",
-        "caribou-trail", "peat-rich", "taiga-edge", "polar-bare", "aurora-lit", "solstice-dark", "drift-covered", "melt-pooled",
-    ],
-    "monsoon": [
-        "rain-heavy", "wind-shift", "cloud-burst-v2", "flood-prone", "season-turn", "tropic-wet",
-        "delta-fed", "paddy-green", "river-swelled", "mud-slick", "thunder-drawn", "mist-wrapped", "storm-bred", "humidity-peak",
-    ],
-    "bastion": [
-        "wall-thick", "tower-high", "moat-ringed", "gate-barred", "parapet-topped", "keep-central",
-        "curtain-walled", "arrow-slit", "drawbridge-set", "turret-crowned", "sally-port", "barbican-front", "citadel-core", "rampart-edged",
-    ],
-    "typhoon": [
-        "eye-wall", "spiral-band", "pressure-low", "wind-max", "rain-band", "surge-high",
-        "track-curved", "intensity-peak", "feeder-band", "outflow-jet", "convection-deep", "shear-low", "warm-core", "rapid-intensify",
-    ],
-    "sequoia": [
-        "bark-thick", "crown-tall", "root-deep", "ring-ancient", "fire-scarred", "grove-dense",
-        "trunk-massive", "canopy-high", "needle-green", "cone-bearing", "heartwood-strong", "sapwood-fresh", "giant-scale", "old-growth",
-    ],
-    "compass": [
-        "north-true", "bearing-fixed", "course-set", "declination-adj", "azimuth-read", "heading-locked",
-        "waypoint-marked", "meridian-crossed", "rose-printed", "needle-steady", "calibrated", "deviation-free", "pole-seeking", "chart-plotted",
-    ],
-    "anvil": [
-        "hammer-struck", "forge-heated", "steel-shaped", "horn-curved", "hardy-hole", "face-flat",
-        "pritchel-cut", "swage-formed", "tong-gripped", "quench-ready", "temper-drawn", "billet-set", "scale-free", "spark-thrown",
-    ],
-    "delta-v2": [
-        "sediment-rich", "fan-shaped", "channel-split", "alluvial-plain", "levee-built", "marsh-edged",
-        "distributary", "backwater-calm", "silt-laden", "flood-plain-v2", "oxbow-curved", "meander-belt", "bar-formed", "deposit-layered",
-    ],
-    "kelvin": [
-        "absolute-zero", "thermal-scale", "entropy-low", "heat-capacity", "conduction-rate", "blackbody-peak",
-        "temperature-grad", "isothermal", "adiabatic-v2", "exothermic", "endothermic", "calorimetric", "boltzmann-const", "planck-law",
-    ],
-    "trident": [
-        "three-pronged", "deep-sea", "coral-pierced", "current-split", "tide-master", "wave-breaker",
-        "reef-guard", "abyss-reach", "brine-forged", "kelp-carved", "barnacle-tough", "nautical-grade", "fathom-deep", "hull-strong",
-    ],
-    "bramble": [
-        "thorn-dense", "hedge-woven", "berry-ripe", "vine-tangled", "root-spread", "leaf-layered",
-        "wild-grown", "path-blocked", "thicket-deep", "stem-arched", "bud-set", "pollen-rich", "seed-scattered", "canopy-low",
-    ],
-    "citrine": [
-        "amber-hued", "quartz-clear", "golden-warm", "facet-bright", "gem-polished", "crystal-grown",
-        "mineral-rich", "luster-high", "carat-fine", "deposit-found", "heat-formed", "matrix-set", "prism-split", "clarity-top",
-    ],
-    "magnet": [
-        "pole-north", "field-strong", "flux-dense", "ferrite-core", "coil-wound", "gauss-high",
-        "domain-aligned", "hysteresis-low", "eddy-free", "rare-earth", "neodymium-grade", "attraction-pull", "repulsion-push", "induction-fast",
-    ],
-    "glacier-v2": [
-        "ice-shelf", "crevasse-deep", "moraine-left", "calving-front", "firn-packed", "glacial-lake",
-        "erratic-placed", "striation-marked", "cirque-carved", "arête-sharp", "till-deposited", "drumlin-shaped", "esker-ridged", "kettle-formed",
-    ],
-    "voltage": [
-        "amp-high", "ohm-matched", "watt-dense", "circuit-closed", "resistor-tuned", "capacitor-charged",
-        "diode-gated", "transistor-switched", "relay-triggered", "fuse-rated", "breaker-set", "transformer-wound", "rectifier-clean", "inverter-driven",
-    ],
-    "prairie": [
-        "grass-tall", "wind-bent", "horizon-wide", "bison-roamed", "loam-rich", "drought-hard",
-        "wildfire-swept", "root-mat", "sod-thick", "bloom-spring", "frost-browned", "hawk-hunted", "creek-cut", "bluff-edged",
-    ],
-    "garnet": [
-        "almandine-red", "pyrope-deep", "spessartine-orange", "grossular-green", "andradite-dark", "uvarovite-chrome",
-        "cabochon-set", "inclusion-free", "refractive-high", "hardness-seven", "dodecahedral", "trapezohedral", "alluvial-found", "metamorphic-born",
-    ],
-    "rampart": [
-        "battlement-crowned", "crenel-cut", "merlon-topped", "embrasure-set", "machicolation-hung", "chemin-de-ronde",
-        "escarp-steep", "counterscarp-faced", "glacis-sloped", "postern-hidden", "casemate-vaulted", "revetment-stone", "terreplein-wide", "banquette-stepped",
-    ],
-    "helios": [
-        "solar-flare", "corona-bright", "prominence-arced", "sunspot-dark", "photon-stream", "plasma-ejected",
-        "magnetic-loop", "chromosphere-hot", "convection-zone", "radiation-core", "fusion-powered", "hydrogen-rich", "helium-born", "luminosity-peak",
-    ],
-    # ===== New series for Phase 8631+ =====
-    "summit": [
-        "peak-crowned", "ridge-line", "summit-view", "cairn-marked", "switchback-trail", "tree-line",
-        "scree-slope", "col-passage", "saddle-point", "false-peak", "knife-edge", "cornice-hung", "windward-face", "leeward-calm",
-    ],
-    "coral": [
-        "reef-built", "polyp-grown", "lagoon-sheltered", "atoll-ringed", "brain-coral", "staghorn-branched",
-        "fan-spread", "table-flat", "pillar-tall", "elkhorn-wide", "fire-coral", "soft-swayed", "deep-water", "bleach-resistant",
-    ],
-    # ===== New series for Phase 8771+ =====
-    "flint": [
-        "strike-sparked", "chert-hard", "knapped-edge", "fire-starter", "conchoidal-break", "nodule-formed",
-        "siliceous", "crypto-crystalline", "biface-shaped", "cortex-rimmed", "lithic-core", "flake-detached", "pressure-chipped", "micro-blade",
-    ],
-    "zephyr": [
-        "west-blown", "breeze-light", "petal-carried", "dawn-stirred", "soft-gust", "vale-swept",
-        "meadow-crossed", "reed-bent", "mist-borne", "dusk-fading", "warm-front", "gentle-drift", "sky-whisper", "cloud-nudged",
-    ],
-    "riptide": [
-        "current-strong", "shore-pulling", "undertow-deep", "channel-carved", "sand-bar", "break-zone",
-        "seaward-flow", "neck-narrow", "feeder-current", "escape-route", "foam-line", "surf-edge", "lateral-drift", "rip-head",
-    ],
-    "cobalt": [
-        "blue-metallic", "alloy-grade", "magnetic-core", "catalyst-active", "pigment-deep", "oxide-layered",
-        "electrode-coated", "battery-cell", "superalloy", "gamma-phase", "spinel-form", "arsenide-base", "valence-shift", "coordination-six",
-    ],
-    "granite": [
-        "quartz-rich", "feldspar-white", "mica-flecked", "plutonic-deep", "batholithic", "coarse-grained",
-        "porphyritic-v2", "pegmatite-vein", "aplite-dike", "rapakivi-texture", "gneiss-foliated", "migmatite-mixed", "tor-weathered", "inselberg-risen",
-    ],
-    "fjord": [
-        "glacier-carved", "steep-walled", "deep-basin", "u-shaped", "threshold-shallow", "hanging-valley",
-        "tidewater-front", "sill-blocked", "stratified-water", "anoxic-deep", "waterfall-fed", "cliff-flanked", "arm-branched", "sound-open",
-    ],
-    "ironwood": [
-        "dense-grained", "axe-resistant", "heartwood-dark", "bark-furrowed", "slow-grown", "drought-hardy",
-        "termite-proof", "fence-post", "charcoal-grade", "tool-handle", "ship-timber", "bridge-beam", "mill-wheel", "forge-fuel",
-    ],
-    "mariana": [
-        "hadal-zone", "trench-deep", "abyssal-plain", "subduction-born", "pressure-extreme", "bioluminescent-v2",
-        "vent-heated", "seep-cold", "xenophyophore", "amphipod-rich", "manganese-crust", "sediment-thick", "fault-scarped", "plate-converged",
-    ],
-    "boreal": [
-        "taiga-vast", "spruce-dense", "moss-carpeted", "bog-pitted", "lake-dotted", "snow-laden",
-        "fire-cycled", "lichen-draped", "muskeg-soft", "moose-browsed", "owl-hunted", "frost-cracked", "daylight-long", "winter-dark",
-    ],
-    "obsidian-v3": [
-        "glass-flow", "rhyolite-born", "apache-tear", "snowflake-pattern", "rainbow-sheen", "mahogany-brown",
-        "pele-hair", "marekanite", "pitchstone-gray", "tachylite-dark", "hyaloclastite", "pumice-light", "scoria-rough", "tephra-blast",
-    ],
-    # ===== New series for Phase 9471+ =====
-    "caldera": [
-        "magma-chamber", "collapse-rim", "crater-wide", "fumarole-vent", "resurgent-dome", "tephra-layer",
-        "lava-lake", "hot-spring", "sulfur-crust", "ash-fall", "pyroclastic-flow", "caldera-fill", "ring-fault", "post-collapse",
-    ],
-    "cypress": [
-        "swamp-rooted", "knee-high", "moss-draped", "evergreen-tall", "resin-rich", "bark-fibrous",
-        "cone-scaled", "wind-resistant", "wetland-king", "bald-crowned", "timber-straight", "bayou-born", "flood-proof", "centuries-old",
-    ],
-    "quartz": [
-        "silicon-pure", "piezo-active", "crystal-hexed", "vein-threaded", "milky-white", "rose-tinted",
-        "smoky-dark", "amethyst-purple", "rutilated", "phantom-layered", "double-terminated", "druzy-coated", "geode-filled", "oscillator-grade",
-    ],
-    "peridot": [
-        "olivine-green", "mantle-born", "gem-clarity", "iron-tinted", "volcanic-ejected", "meteorite-found",
-        "basalt-hosted", "xenolith-carried", "facet-brilliant", "chrysolite-old", "hawaiite-set", "kimberlite-piped", "orthorhombic", "birefringent",
-    ],
-    "sandstone": [
-        "grain-cemented", "cross-bedded", "wind-sculpted", "mesa-forming", "arch-carved", "canyon-walled",
-        "red-ochre", "buff-yellow", "ripple-marked", "fossil-bearing", "aquifer-porous", "flagstone-split", "desert-varnished", "cliff-dwelling",
-    ],
-    "terracotta": [
-        "kiln-fired", "earthen-warm", "clay-molded", "ochre-glazed", "pot-shaped", "tile-pressed",
-        "sun-dried", "slip-coated", "coil-built", "wheel-thrown", "bisque-stage", "engobe-painted", "sgraffito-carved", "amphora-styled",
-    ],
-    "permafrost": [
-        "ice-cemented", "ground-frozen", "pingo-mound", "thermokarst", "active-layer", "yedoma-rich",
-        "syngenetic", "epigenetic", "talik-thawed", "palsa-raised", "cryopeg-briny", "ice-wedge-v2", "retrogressive-thaw", "solifluction",
-    ],
-    "stalactite": [
-        "drip-formed", "cave-hung", "calcite-pure", "mineral-deposited", "column-merged", "speleothem",
-        "flowstone-spread", "soda-straw", "curtain-draped", "helictite-twisted", "rim-stone", "cave-pearl", "bacon-strip", "gour-pool",
-    ],
-    "archipelago": [
-        "island-chain", "volcanic-arc", "barrier-reef", "atoll-based", "continental-shelf", "strait-linked",
-        "channel-deep", "lagoon-calm", "windward-exposed", "leeward-sheltered", "islet-dotted", "seamount-risen", "coral-fringed", "trade-wind",
-    ],
-    "monsoon-v2": [
-        "inter-tropical", "hadley-cell", "jet-stream", "orographic-lift", "convective-burst", "dry-spell",
-        "onset-surge", "withdrawal-phase", "monsoon-trough", "low-pressure", "cyclogenesis", "outflow-boundary", "gust-front", "squall-line",
-    ],
-    # ===== New series for Phase 10171+ =====
-    "aurora-v2": [
-        "solar-particle", "magnetic-reconnect", "substorm-onset", "oval-shift", "proton-arc", "diffuse-glow",
-        "discrete-arc", "pulsating-patch", "theta-aurora", "cusp-precipitate", "black-aurora", "steve-glow", "polar-rain", "conjugate-point",
-    ],
-    "cascade-v2": [
-        "plunge-pool", "tiered-fall", "mist-rising", "bedrock-carved", "log-jam", "fish-ladder",
-        "spray-zone", "erosion-notch", "hanging-lip", "curtain-fall", "horsetail-drop", "punchbowl", "ribbon-fall", "block-fall",
-    ],
-    "tempest-v2": [
-        "wall-cloud", "mesocyclone", "hook-echo", "bear-cage", "inflow-jet", "flanking-line",
-        "anvil-crawl", "mammatus-hang", "overshooting-top", "bounded-weak", "rear-flank", "forward-flank", "tail-end", "bow-echo",
-    ],
-    "ember-v2": [
-        "smolder-slow", "char-edge", "heat-flux", "radiant-ember", "convection-plume", "fire-whirl",
-        "spot-fire", "crown-fire", "ground-fire", "ladder-fuel", "backburn", "fire-line", "retardant-drop", "burnout-zone",
-    ],
-    "helix-v2": [
-        "double-strand", "base-pair", "codon-read", "anticodon-match", "ribosome-bind", "polymerase-chain",
-        "transcription-start", "translation-frame", "splicing-site", "promoter-region", "enhancer-loop", "silencer-block", "telomere-cap", "centromere-link",
-    ],
-    "nexus-v2": [
-        "hub-central", "spoke-radial", "mesh-complete", "star-topology", "ring-connected", "bus-shared",
-        "tree-branched", "hybrid-mesh", "point-to-point", "multi-drop", "daisy-chain", "backbone-linked", "peer-to-peer", "client-server",
-    ],
-    "prism-v2": [
-        "refraction-angle", "dispersion-spread", "total-internal", "critical-angle", "brewster-angle", "snell-law",
-        "birefringent-split", "dichroic-filter", "achromat-lens", "apochromat-corrected", "fresnel-zone", "abbe-number", "cauchy-equation", "sellmeier-fit",
-    ],
-    "dynamo-v2": [
-        "armature-wound", "field-coil", "commutator-split", "brush-contact", "back-emf", "torque-constant",
-        "speed-constant", "flux-linkage", "reluctance-gap", "hysteresis-loop", "eddy-suppressed", "laminated-core", "series-wound", "shunt-wound",
-    ],
-    "orbit-v2": [
-        "perigee-low", "apogee-high", "inclination-set", "eccentricity-tuned", "epoch-fixed", "mean-anomaly",
-        "true-anomaly", "argument-periapsis", "ascending-node", "hohmann-transfer", "bi-elliptic", "gravity-assist", "lagrange-point", "halo-orbit",
-    ],
-    "crystal-v2": [
-        "lattice-cubic", "unit-cell", "miller-index", "bragg-diffract", "debye-scherrer", "laue-pattern",
-        "point-defect", "line-dislocation", "planar-fault", "grain-boundary", "twinning-plane", "cleavage-face", "habit-form", "polymorphic-transition",
-    ],
-    # ===== New series for Phase 10871+ =====
-    "magma": [
-        "chamber-deep", "viscosity-high", "volatile-rich", "crystal-mush", "dike-injected", "sill-intruded",
-        "plume-driven", "hotspot-fed", "rift-sourced", "partial-melt", "fractionated", "assimilated", "degassed", "eruption-ready",
-    ],
-    "vanguard": [
-        "forward-scout", "advance-guard", "point-lead", "trailhead", "pathfinder-grade", "recon-swift",
-        "spearhead", "outrider", "flank-secure", "column-front", "sortie-bound", "skirmish-ready", "picket-post", "vanguard-elite",
-    ],
-    "pylon": [
-        "tower-mounted", "cable-strung", "steel-lattice", "cross-arm", "insulator-hung", "foundation-deep",
-        "span-wide", "conductor-clad", "grounding-rod", "strain-tower", "angle-turn", "terminal-end", "suspension-hung", "dead-end",
-    ],
-    "apex": [
-        "peak-altitude", "summit-grade", "crest-line", "ridge-top", "pinnacle-set", "crown-point",
-        "high-mark", "zenith-reached", "vertex-placed", "acme-level", "climax-point", "tip-top", "capstone-set", "keystone-locked",
-    ],
-    "meridian-v2": [
-        "prime-line", "antimeridian", "great-circle", "geodetic-datum", "projection-mapped", "graticule-set",
-        "isogonic-line", "agonic-traced", "magnetic-declination", "true-north-v2", "grid-convergence", "transverse-mercator", "utm-zone", "gauss-kruger",
-    ],
-    "tundra-v2": [
-        "polygon-ground", "solifluction-lobe", "frost-boil", "stone-circle", "ice-lens", "needle-ice",
-        "patterned-ground", "cryoturbation", "gelisol-deep", "nivation-hollow", "blockfield", "felsenmeer", "rock-glacier", "protalus-rampart",
-    ],
-    "typhoon-v2": [
-        "super-typhoon", "central-dense", "cloud-top", "dvorak-intensity", "saffir-simpson", "accumulated-cyclone",
-        "power-dissipation", "potential-intensity", "rapid-decay", "extratropical-transition", "fujiwhara-effect", "binary-interaction", "concentric-eyewall", "vortex-rossby",
-    ],
-    "sequoia-v2": [
-        "sierra-grove", "montane-belt", "fire-regime", "seed-cone", "bark-spongy", "buttress-root",
-        "snag-standing", "nurse-log", "mycorrhizal", "understory-shade", "gap-dynamic", "succession-late", "crown-spread", "dbh-massive",
-    ],
-    "bastion-v2": [
-        "trace-italienne", "star-fort", "ravelin-front", "demilune-placed", "tenaille-set", "hornwork-extended",
-        "crownwork-built", "covered-way", "countermine", "caponier-flanked", "embankment-raised", "firing-step", "powder-magazine", "garrison-quartered",
-    ],
-    "trident-v2": [
-        "harpoon-thrown", "whale-road", "kraken-deep", "leviathan-vast", "siren-call", "maelstrom-spun",
-        "scylla-guard", "charybdis-pull", "triton-horn", "poseidon-wrath", "amphitrite-calm", "nereid-swift", "thalassic", "pelagic-zone",
-    ],
-    # ===== New series for Phase 11571+ =====
-    "kraken": [
-        "tentacle-reach", "ink-cloud", "depth-lurking", "sucker-grip", "beak-crushing", "camouflage-shift",
-        "jet-propelled", "chromatophore", "bioluminescent-lure", "colossal-scale", "mantle-strong", "siphon-blast", "arm-regenerate", "abyssal-hunt",
-    ],
-    "monolith": [
-        "slab-hewn", "obelisk-tall", "megalithic", "dolmen-capped", "menhir-stood", "trilithon-framed",
-        "sarsen-dragged", "lintel-placed", "henge-circled", "cairn-stacked", "stele-carved", "pillar-monumental", "bedrock-rooted", "age-defiant",
-    ],
-    "nomad": [
-        "caravan-led", "steppe-roaming", "yurt-pitched", "trade-route", "oasis-bound", "dune-crossing",
-        "silk-road", "pastoral-drift", "camp-mobile", "horizon-chasing", "star-navigated", "sandstorm-braved", "water-wise", "territory-vast",
-    ],
-    "raptor": [
-        "talon-sharp", "dive-strike", "thermal-soaring", "eyrie-perched", "prey-spotted", "wing-tucked",
-        "beak-hooked", "feather-streamlined", "kill-zone", "territory-claimed", "nest-defended", "dawn-hunter", "dusk-patrol", "sky-sovereign",
-    ],
-    "crucible": [
-        "molten-core", "alloy-fused", "slag-skimmed", "flux-added", "pour-ready", "ingot-cast",
-        "temper-quenched", "anneal-slow", "forge-bright", "crucible-grade", "refractory-lined", "heat-soaked", "melt-point", "reduction-fired",
-    ],
-    "obelisk": [
-        "granite-hewn", "sun-aligned", "hieroglyph-carved", "pyramidion-topped", "quarry-cut", "barge-floated",
-        "temple-placed", "shadow-cast", "solstice-marked", "cartouche-inscribed", "capstone-gilded", "avenue-flanked", "dynasty-raised", "desert-standing",
-    ],
-    "leviathan": [
-        "ocean-spanning", "hull-plated", "keel-deep", "bow-wave", "stern-wake", "ballast-trimmed",
-        "cargo-laden", "bridge-commanded", "engine-room-v2", "propeller-driven", "anchor-set", "bulkhead-sealed", "draft-marked", "tonnage-vast",
-    ],
-    "steppe": [
-        "grass-sea", "horseback-range", "kurgan-mound", "felt-tent", "eagle-hunt", "ferment-brewed",
-        "frost-plain", "black-soil", "wind-corridor", "migration-path", "river-bend", "plateau-edge", "salt-lake", "sky-dome",
-    ],
-    "atoll": [
-        "ring-reef", "lagoon-center", "coral-built-v2", "palm-fringed", "tide-pool", "pass-channel",
-        "motu-island", "coconut-grove", "turquoise-shallow", "barrier-outer", "sand-cay", "bird-colony", "mangrove-inner", "current-swept-v2",
-    ],
-    "ridgeline": [
-        "spine-sharp", "divide-water", "trail-narrow", "vista-wide", "wind-exposed", "tree-stunted",
-        "rock-spine", "saddle-dip", "false-summit-v2", "knife-edge-v2", "scramble-grade", "exposure-high", "weather-side", "lee-sheltered",
-    ],
-    # ===== New series for Phase 12271+ =====
-    "citadel": [
-        "keep-fortified", "portcullis-barred", "watchtower-tall", "garrison-strong", "siege-proof", "moat-deep",
-        "battlement-wide", "arrow-loop", "murder-hole", "gatehouse-guarded", "curtain-thick", "dungeon-sealed", "chapel-vaulted", "great-hall",
-    ],
-    "avalanche": [
-        "snow-slab", "trigger-point", "fracture-line", "debris-field", "runout-zone", "crown-face",
-        "stauchwall", "powder-cloud", "wet-slide", "dry-slab", "cornice-drop", "gully-channeled", "deposit-fan", "burial-deep",
-    ],
-    "pangaea": [
-        "supercontinent", "rift-valley", "craton-core", "shield-area", "orogen-belt", "suture-zone",
-        "terrane-docked", "plate-margin", "seafloor-spread", "hotspot-track", "mantle-plume", "lithosphere-thick", "asthenosphere-flow", "isostatic-balance",
-    ],
-    "solaris": [
-        "heliocentric", "corona-mass", "solar-cycle", "sunspot-pair", "flare-class", "prominence-loop",
-        "photosphere-grain", "convection-cell-v2", "radiation-belt", "magnetogram", "irradiance-total", "spectroheliograph", "coronagraph-v2", "ecliptic-plane",
-    ],
-    "labyrinth": [
-        "maze-walled", "dead-end", "passage-narrow", "chamber-hidden", "thread-guided", "minotaur-deep",
-        "turn-blind", "corridor-long", "exit-distant", "branching-path", "loop-back", "false-door", "pit-trap", "torch-lit",
-    ],
-    "tectonic": [
-        "plate-boundary", "convergent-zone", "divergent-rift", "transform-fault", "subduction-angle", "collision-front",
-        "seismic-gap", "stress-field", "strain-rate", "fault-plane", "focal-mechanism", "moment-tensor", "aftershock-sequence", "foreshock-cluster",
-    ],
-    "maelstrom": [
-        "whirlpool-center", "vortex-pull", "spiral-current", "tidal-bore", "eddy-spin", "gyre-vast",
-        "turbulence-zone", "undertow-force", "cavitation-bubble", "standing-wave", "rotor-cell", "shear-layer", "kelvin-helmholtz", "bernoulli-effect",
-    ],
-    "cerberus": [
-        "three-headed", "gate-guardian", "underworld-bound", "chain-linked", "fang-bared", "shadow-lurking",
-        "sentinel-post", "passage-denied", "howl-echoing", "iron-collared", "flame-breathed", "styx-guarding", "hades-loyal", "soul-watcher",
-    ],
-    "colosseum": [
-        "arena-vast", "tier-stacked", "arch-vaulted", "column-ringed", "velarium-shade", "hypogeum-below",
-        "podium-front", "cavea-seated", "ambulacrum-wide", "vomitorium-exit", "travertine-clad", "opus-caementicium", "reticulatum-faced", "spina-central",
-    ],
-    "siberia": [
-        "taiga-endless", "permafrost-bound", "river-frozen", "mammoth-steppe", "diamond-pipe", "gulag-remote",
-        "baikal-deep", "yenisei-flow", "larch-forest", "sable-fur", "frost-cracked-v2", "tundra-edge", "meteor-crater", "aurora-belt",
-    ],
-    # ===== New series for Phase 12971+ =====
-    "obsidian-fortress": [
-        "bastion-walled", "iron-gate", "keep-stone", "portcullis-heavy", "arrow-slotted", "rampart-crowned",
-        "siege-hardened", "drawbridge-chain", "turret-watch", "garrison-held", "moat-circled", "battlement-sharp", "tower-capped", "vault-sealed",
-    ],
-    "aurora-veil": [
-        "shimmer-curtain", "polar-glow", "ribbon-light", "green-arc", "solar-kissed", "magnetic-dance",
-        "night-veil", "sky-drape", "ion-stream", "corona-wisp", "photon-shower", "particle-rain", "dawn-haze", "spectrum-fold",
-    ],
-    "tempest-crown": [
-        "storm-king", "gale-throne", "thunder-reign", "cyclone-peak", "whirlwind-crest", "squall-helm",
-        "lightning-scepter", "cloud-palace", "rain-sovereign", "hail-crown", "tornado-spire", "monsoon-rule", "blizzard-court", "typhoon-seat",
-    ],
-    "crystal-depths": [
-        "abyss-clear", "deep-facet", "trench-prism", "pressure-gem", "fathom-shine", "ocean-lattice",
-        "hydro-crystal", "brine-diamond", "seabed-quartz", "coral-gem", "pearl-matrix", "abyssal-shard", "sapphire-deep", "aqua-refract",
-    ],
-    "ember-throne": [
-        "flame-seat", "ash-crown", "cinder-reign", "blaze-rule", "inferno-peak", "char-throne",
-        "spark-scepter", "molten-hall", "fire-court", "smolder-king", "pyre-gate", "hearth-sovereign", "coal-vault", "magma-seat",
-    ],
-    "glacier-peak": [
-        "ice-summit", "snow-cap", "frost-ridge", "berg-crown", "crevasse-edge", "firn-peak",
-        "glacial-spire", "rime-crest", "polar-summit", "frozen-apex", "ice-field-top", "neve-ridge", "serac-tower", "moraine-peak",
-    ],
-    "thunder-vale": [
-        "bolt-valley", "storm-glen", "rumble-gorge", "flash-canyon", "crack-ravine", "echo-dale",
-        "charge-basin", "spark-hollow", "voltage-vale", "arc-gulch", "static-dell", "plasma-gap", "ion-cleft", "surge-valley",
-    ],
-    "nebula-gate": [
-        "star-portal", "cloud-arch", "cosmic-door", "dust-gateway", "plasma-entry", "nova-threshold",
-        "void-passage", "stellar-lock", "gas-bridge", "ion-gate", "photon-arch", "quasar-portal", "dark-entry", "emission-gate",
-    ],
-    "titan-forge": [
-        "anvil-giant", "hammer-colossal", "furnace-vast", "bellows-roar", "ingot-titan", "crucible-massive",
-        "slag-mountain", "tong-iron", "quench-deep", "temper-strong", "alloy-prime", "smelt-core", "cast-monolith", "weld-titan",
-    ],
-    "phantom-reef": [
-        "ghost-coral", "wraith-lagoon", "specter-atoll", "shade-reef", "mist-barrier", "vanish-shoal",
-        "haunt-tide", "ether-reef", "mirage-bank", "shadow-cay", "phantom-pass", "spirit-shelf", "void-reef", "unseen-bar",
-    ],
-    # ===== New series for Phase 13671+ =====
-    "iron-canyon": [
-        "iron-veined", "rust-banded", "ore-layered", "anvil-hewn", "canyon-scarped", "gorge-carved",
-        "butte-guarded", "mesa-rimmed", "slot-narrow", "talus-choked", "rim-traced", "cliff-ironbound", "iron-bridge", "redrock-layered",
-    ],
-    "jade-forest": [
-        "jade-polished", "nephrite-green", "verdant-canopy", "moss-draped-v2", "fern-carpeted", "resin-scented",
-        "grove-emerald", "leaf-glossed", "bough-shadowed", "understory-deep", "canopy-filtered", "dew-laden", "stone-lantern", "shrine-hidden",
-    ],
-    "silver-storm": [
-        "argent-squall", "silver-lined", "quicksilver-arc", "cloud-metallic", "sleet-bright", "hail-gleam",
-        "thunder-glint", "lightning-filament", "gale-plated", "squall-polished", "storm-lustrous", "rain-mercurial", "stratus-silvered", "vortex-argent",
-    ],
-    "copper-ridge": [
-        "copper-veined", "patina-green", "verdigris-rimmed", "ridgeback-cast", "spine-coppered", "hogback-formed",
-        "cuesta-tilted", "escarp-copper", "anticline-crest", "faulted-ridge", "knoll-banded", "rim-oxidized", "ore-scarp", "cuprite-capped",
-    ],
-    "amber-coast": [
-        "amber-washed", "resin-cast", "honeyed-shore", "dune-gilded", "beach-ambered", "tideline-gold",
-        "driftwood-glow", "sea-polished", "cove-sunned", "kelp-amber", "surf-warmed", "bay-amberlit", "shell-bright", "sunset-resin",
-    ],
-    "onyx-spire": [
-        "onyx-dark", "jet-gloss", "spire-needled", "needle-steepled", "gothic-risen", "black-faceted",
-        "tower-obscured", "shadow-etched", "night-polished", "pinnacle-onyx", "steeple-inked", "basalt-anchored", "ebon-lustrous", "obsidian-kissed",
-    ],
-    "ruby-depths": [
-        "ruby-lit", "carmine-abyss", "crimson-pressure", "gem-sunken", "trench-rubied", "abyss-ruby",
-        "deep-scarlet", "lode-crimson", "chamber-ruby", "mantle-glow", "vein-jewel", "magma-rouge", "dark-cabochon", "pressure-lucent",
-    ],
-    "bronze-summit": [
-        "bronze-cast", "summit-burnished", "crest-bronzed", "peak-patinaed", "ridge-medaled", "cairn-bronze",
-        "scree-gleaming", "cornice-bronze", "alpine-burnished", "col-bronze", "plateau-bronzed", "spire-burnished", "rock-cast", "summit-verdigris",
-    ],
-    "pearl-harbor": [
-        "pearl-lustrous", "nacre-sheen", "oyster-borne", "quay-calm", "berth-deep", "breakwater-white",
-        "lantern-buoy", "harbor-misted", "dock-polished", "tide-sheltered", "cove-moored", "jetty-lined", "sail-pearl", "marina-quiet",
-    ],
-    "diamond-glacier": [
-        "diamond-cut", "facet-ice", "crystal-ablated", "blue-ice", "serac-spark", "crevasse-glistened",
-        "firn-faceted", "rime-jewel", "berg-brilliant", "moraine-gleam", "albedo-high", "icefield-prismatic", "lattice-diamond", "diamond-hard",
-    ],
-    # ===== New series for Phase 14371+ =====
-    "malachite-gorge": [
-        "banded-green", "copper-carbonate", "stalactitic-form", "botryoidal-mass", "gorge-veined", "azurite-paired",
-        "lapidary-grade", "matrix-rough", "cabochon-polished", "bull-eye", "silk-banded", "congo-mine", "ural-sourced", "patina-aged",
-    ],
-    "titanium-shelf": [
-        "alloy-light", "corrosion-free", "aerospace-grade", "biocompatible", "anodized-color", "grade-five",
-        "shelf-stable", "oxide-layer", "sponge-refined", "rutile-ore", "ilmenite-source", "kroll-process", "beta-phase", "alpha-structure",
-    ],
-    "obsidian-drift": [
-        "glass-drift", "lava-stream", "edge-razor", "flake-tooled", "snowflake-spec", "mahogany-hued",
-        "rainbow-sheen-v2", "fire-polished", "tear-drop", "flow-banded-v2", "conchoidal-v2", "perlitic-crack", "vitrophyre", "devitrified",
-    ],
-    "rhodium-peak": [
-        "catalyst-pure", "reflective-max", "oxidation-proof", "plating-bright", "group-nine", "rare-extract",
-        "crucible-melt", "acid-resistant", "thermocouple-fit", "spectra-line", "isotope-stable", "alloy-hardened", "electro-deposited", "peak-lustrous",
-    ],
-    "lapis-canyon": [
-        "lazurite-blue", "pyrite-flecked", "calcite-veined", "ultramarine-ground", "afghan-sourced", "canyon-strata",
-        "gilding-grade", "pigment-crushed", "cabochon-domed", "inlay-set", "royal-blue", "celestial-stone", "metamorphic-formed", "lazuward-named",
-    ],
-    "platinum-reef": [
-        "noble-metal", "catalyst-grade", "hallmark-pure", "troy-weighed", "reef-deposited", "placer-found",
-        "nugget-form", "sponge-platinum", "crucible-cast", "acid-proof", "ductile-drawn", "wire-gauge", "thermocouple-pair", "isotope-rich",
-    ],
-    "bismuth-spire": [
-        "rainbow-oxide", "crystal-hopper", "diamagnetic", "pepto-pink", "low-toxicity", "spire-grown",
-        "staircase-crystal", "iridescent-layer", "melt-cast", "alloy-fusible", "cosmetic-grade", "pharmaceutical", "telluride-ore", "geometric-form",
-    ],
-    "tourmaline-cove": [
-        "elbaite-green", "rubellite-pink", "indicolite-blue", "watermelon-slice", "paraiba-neon", "schorl-black",
-        "cove-sheltered", "dravite-brown", "liddicoatite", "piezo-charged", "pyro-electric", "trigonal-prism", "striated-face", "gem-tourmaline",
-    ],
-    "beryllium-ridge": [
-        "emerald-bearing", "aquamarine-tint", "light-alloy", "stiff-modulus", "x-ray-window", "neutron-reflect",
-        "ridge-crystalline", "hexagonal-close", "chrysoberyl-hard", "goshenite-clear", "morganite-peach", "heliodor-gold", "phenakite-rare", "bertrandite-ore",
-    ],
-    "zirconium-vale": [
-        "reactor-clad", "corrosion-shield", "hafnium-free", "oxide-ceramic", "cubic-zirconia", "vale-deposited",
-        "baddeleyite-ore", "zircon-sand", "plasma-sprayed", "thermal-barrier", "prosthetic-grade", "getter-active", "pyrophoric-fine", "alloy-naval",
-    ],
-    # ===== New series for Phase 15071+ =====
-    "selenite-arch": [
-        "gypsum-clear", "moon-stone", "desert-rose", "twin-crystal", "tabular-form", "prismatic-habit",
-        "cleavage-perfect", "satin-spar", "cave-grown", "evaporite-born", "fibrous-silk", "selenite-plate", "water-soluble", "optical-grade",
-    ],
-    "chromium-basin": [
-        "stainless-alloy", "chrome-plated", "emerald-dopant", "ferrochrome", "refractory-lined", "passivation-film",
-        "hexavalent-free", "trivalent-state", "specular-finish", "hardface-weld", "catalyst-carrier", "pigment-oxide", "corrosion-immune", "basin-smelted",
-    ],
-    "feldspar-mesa": [
-        "orthoclase-pink", "plagioclase-white", "twinning-striped", "weathered-clay", "perthite-intergrown", "anorthite-calcic",
-        "albite-sodic", "labradorite-flash", "moonstone-sheen", "sanidine-clear", "microcline-green", "mesa-exposed", "granitic-host", "pegmatite-coarse",
-    ],
-    "antimony-gorge": [
-        "stibnite-metallic", "flame-retardant", "alloy-hardener", "trioxide-white", "sulfide-gray", "gorge-mined",
-        "brittle-fracture", "lead-battery", "semiconductor-doped", "antimonial-lead", "type-metal", "bearing-alloy", "vermillion-base", "glass-fining",
-    ],
-    "apatite-ridge": [
-        "phosphate-rich", "fluorapatite", "hydroxy-form", "bone-mineral", "fertilizer-source", "hexagonal-prism",
-        "ridge-outcrop", "igneous-accessory", "sedimentary-layer", "bio-apatite", "laser-host", "rare-earth-doped", "francolite-crypto", "collophane-massive",
-    ],
-    "vermiculite-pass": [
-        "mica-exfoliated", "heat-expanded", "insulation-fill", "soil-conditioner", "fire-barrier", "acoustic-dampen",
-        "pass-quarried", "lightweight-aggregate", "asbestos-free", "hydroponic-medium", "packing-material", "friction-liner", "refractory-filler", "absorbent-grade",
-    ],
-    "cassiterite-bluff": [
-        "tin-ore", "placer-deposit", "alluvial-worked", "smelter-feed", "bronze-age", "bluff-exposed",
-        "tetragonal-crystal", "adamantine-luster", "heavy-mineral", "greisenized", "pegmatite-hosted", "wood-tin", "stream-tin", "vein-mined",
-    ],
-    "sphalerite-hollow": [
-        "zinc-blende", "wurtzite-hex", "resinous-luster", "cleavage-six", "hollow-mined", "galena-associated",
-        "cadmium-trace", "indium-source", "germanium-carrier", "marmatite-iron", "schalenblende", "fluorescent-orange", "triboluminescent-spark", "metamorphic-skarn",
-    ],
-    "dolomite-terrace": [
-        "calcium-magnesium", "rhombohedral-form", "saddle-shaped", "terrace-layered", "reef-builder", "dolostone-massive",
-        "hydrothermal-replaced", "pearl-spar", "ferroan-variety", "ankerite-iron", "huntite-white", "stromatolite-bound", "burial-diagenetic", "sabkha-evaporite",
-    ],
-    "molybdenite-peak": [
-        "disulfide-layer", "lubricant-dry", "steel-alloy", "catalyst-hydro", "peak-porphyry", "rhenium-host",
-        "hexagonal-plate", "metallic-sheen", "high-melting-v2", "superlubricant", "photovoltaic-contact", "nitrogen-fixation", "electrode-material", "quantum-emitter",
-    ],
-    # ===== New series for Phase 15771+ =====
-    "chalcedony-ridge": [
-        "microcrystalline", "agate-banded", "carnelian-red", "chrysoprase-green", "jasper-opaque", "onyx-layered",
-        "ridge-silicified", "botryoidal-crust", "geode-lined", "chalcedonic-vein", "flint-nodule", "chert-bedded", "moss-agate", "dendritic-pattern",
-    ],
-    "magnetite-basin": [
-        "iron-oxide", "lodestone-polar", "octahedral-form", "magnetite-sand", "skarn-hosted", "banded-iron",
-        "basin-concentrated", "titano-magnetite", "detrital-grain", "biogenic-magnetite", "curie-point", "spinel-structure", "ilmenite-inter", "hematite-martite",
-    ],
-    "fluorite-arch": [
-        "calcium-fluoride", "cubic-habit", "octahedral-cleave", "fluorspar-grade", "arch-mineralized", "purple-zone",
-        "green-fluorite", "blue-john", "thermoluminescent-v2", "flux-agent", "optical-window", "rare-earth-host", "gangue-mineral", "hydrothermal-vein",
-    ],
-    "bauxite-mesa": [
-        "alumina-rich", "laterite-weathered", "gibbsite-form", "boehmite-phase", "diaspore-hard", "mesa-capped",
-        "bayer-process", "red-mud", "pisolitic-texture", "karst-bauxite", "tropical-leached", "iron-stained", "residual-deposit", "refinery-grade",
-    ],
-    "celestite-gorge": [
-        "strontium-sulfate", "sky-blue", "tabular-crystal", "evaporite-hosted", "gorge-deposited", "geode-cluster",
-        "orthorhombic-form", "celestine-nodule", "fibrous-vein", "replacement-origin", "sedimentary-bed", "concretion-core", "dogtooth-spar", "karstic-fill",
-    ],
-    "wolframite-pass": [
-        "tungsten-ore", "iron-manganese", "monoclinic-form", "pass-vein", "greisen-hosted", "quartz-associated",
-        "scheelite-paired", "hubnerite-end", "ferberite-dark", "alluvial-placer", "gravity-separated", "flotation-concentrate", "high-density", "strategic-mineral",
-    ],
-    "cinnabar-bluff": [
-        "mercury-sulfide", "vermillion-red", "trigonal-crystal", "bluff-outcrop", "hot-spring-deposited", "epithermal-vein",
-        "retort-smelted", "native-mercury", "metacinnabar-black", "livingstonite-mix", "fumarole-sublimate", "silica-sinter", "opalized-host", "stockwork-ore",
-    ],
-    "nepheline-hollow": [
-        "feldspathoid", "hexagonal-prismatic", "silica-undersaturated", "hollow-intrusive", "syenite-host", "phonolite-rock",
-        "sodalite-group", "leucite-related", "cancrinite-altered", "analcime-replaced", "ceramic-flux", "alumina-source", "alkali-rich", "peralkaline-melt",
-    ],
-    "kyanite-terrace": [
-        "aluminum-silicate", "triclinic-blade", "blue-bladed", "terrace-metamorphic", "high-pressure", "andalusite-polymorph",
-        "sillimanite-transition", "eclogite-facies", "mullite-converted", "refractory-cast", "abrasive-grain", "indicator-mineral", "garnet-schist", "staurolite-paired",
-    ],
-    "galena-peak": [
-        "lead-sulfide", "cubic-crystal", "galena-cleavage", "silver-bearing", "peak-lode", "mississippi-valley",
-        "replacement-body", "skarn-contact", "anglesite-weathered", "cerussite-crust", "flotation-recovered", "smelter-concentrate", "isotope-dated", "ore-shoot",
-    ],
-    # ===== New series for Phase 16471+ =====
-    "rutile-canyon": [
-        "titanium-dioxide", "tetragonal-prism", "needle-crystal", "beach-placer", "ilmenite-altered", "anatase-polymorph",
-        "brookite-ortho", "canyon-bedrock", "refractory-pigment", "photocatalyst", "rutile-twin", "geniculated", "sagenite-net", "epitaxial-growth",
-    ],
-    "spodumene-vale": [
-        "lithium-bearing", "pyroxene-chain", "kunzite-pink", "hiddenite-green", "pegmatite-crystal", "vale-quarried",
-        "monoclinic-prism", "cleavage-perfect-v2", "alpha-phase", "beta-converted", "glass-ceramic", "battery-grade", "flotation-pure", "concentrate-refined",
-    ],
-    "wollastonite-arch": [
-        "calcium-silicate", "acicular-habit", "contact-metamorphic", "skarn-mineral", "arch-outcrop", "fibrous-mass",
-        "ceramic-filler", "friction-material", "paint-extender", "plastics-reinforcer", "low-shrinkage", "alkaline-flux", "deinking-agent", "fireproof-board",
-    ],
-    "prehnite-mesa": [
-        "calcium-aluminum", "botryoidal-habit", "zeolite-facies", "mesa-volcanic", "pipe-vesicle", "green-translucent",
-        "fan-spherulite", "epidote-associated", "pumpellyite-paired", "low-grade-meta", "cavity-lining", "reniform-crust", "tabular-aggregate", "vein-filling",
-    ],
-    "enstatite-gorge": [
-        "magnesium-silicate", "ortho-pyroxene", "bronzite-sheen", "hypersthene-dark", "gorge-ultramafic", "mantle-xenolith",
-        "meteorite-phase", "chondrite-common", "bowen-series", "cumulate-layer", "harzburgite-host", "lherzolite-bound", "norite-component", "corona-texture",
-    ],
-    "andalusite-pass": [
-        "aluminum-silicate-v2", "chiastolite-cross", "contact-aureole", "hornfels-grade", "pass-metamorphic", "prismatic-square",
-        "viridine-manganese", "porcelain-jasper", "refractory-brick", "mullite-precursor", "pelite-porphyroblast", "cordierite-paired-v2", "biotite-zone", "spotted-slate",
-    ],
-    "chrysoberyl-bluff": [
-        "beryllium-aluminate", "cyclic-twin", "alexandrite-color", "cymophane-chatoyant", "bluff-pegmatite", "orthorhombic-dipyramid",
-        "color-change", "cats-eye-v2", "trillings-form", "hard-gemstone", "alluvial-gem", "chrysoberyl-green", "iron-chromium", "sixling-twin",
-    ],
-    "staurolite-hollow": [
-        "iron-aluminum", "cruciform-twin", "fairy-cross", "garnet-grade", "hollow-schist", "monoclinic-pseudo",
-        "penetration-twin", "sixty-degree", "ninety-degree", "kyanite-associated", "regional-meta", "barrovian-zone", "pelitic-index", "medium-grade",
-    ],
-    "epidote-terrace": [
-        "calcium-iron-aluminum", "pistachio-green", "clinozoisite-iron-free", "zoisite-ortho", "terrace-greenschist", "prismatic-striated",
-        "saussurite-mass", "unakite-rock", "pistacite-end", "pleochroic-strong", "anomalous-interference", "vein-epidote", "skarn-accessory", "retrograde-product",
-    ],
-    "cordierite-peak": [
-        "magnesium-alumino", "iolite-gem", "sector-twin", "peak-granulite", "dichroic-strong", "pinite-altered",
-        "sekaninaite-iron", "indialite-hex", "water-bearing", "cordierite-gneiss", "hornfels-mineral", "emery-associated", "buckling-fold", "osumilite-group",
-    ],
-    # ===== New series for Phase 17171+ =====
-    "siderite-canyon": [
-        "carbonate-iron", "rhombohedral-cleavage", "clay-ironstone", "blackband-ore", "bog-iron", "canyon-bedded",
-        "spathic-crystal", "siderite-concretion", "coal-measure", "chalybite-old", "vivianite-stained", "ankerite-mixed", "goethite-weathered", "limonite-crust",
-    ],
-    "anorthite-bluff": [
-        "calcic-plagioclase", "triclinic-twin", "labradorescence-sheen", "bytownite-range", "bluff-volcanic", "gabbro-hosted",
-        "anorthosite-massive", "schiller-effect", "exsolution-lamella", "bowen-continuous", "lunar-highland-v2", "refractory-calcium", "zoning-oscillatory", "albite-rim",
-    ],
-    "garnierite-vale": [
-        "nickel-silicate", "serpentine-derived", "laterite-zone", "saprolite-rich", "vale-tropical", "limonite-cap",
-        "nontronite-clay", "chlorite-green-v2", "magnetite-remnant", "chrysoprase-trace", "weathering-profile", "oxide-enriched", "supergene-zone", "karst-hosted",
-    ],
-    "zinnwaldite-pass": [
-        "lithium-mica", "iron-rich-v2", "greisen-associated", "pass-granitic", "fluorine-bearing", "lepidolite-related",
-        "pegmatite-margin", "tin-tungsten", "topaz-paired", "masutomilite-rare", "polylithionite-end", "siderophyllite-iron", "tetraferriphlogopite", "protolithionite",
-    ],
-    # ===== New series for Phase 17451+ =====
-    "arsenopyrite-gorge": [
-        "iron-arsenic", "monoclinic-crystal", "gold-indicator", "gorge-vein-hosted", "pyrite-associated", "marcasite-dimorph",
-        "lollingite-end", "cobaltite-cousin", "thermal-decompose", "magnetic-roast", "arsenical-pyrite", "mispickel-old", "crystal-striated", "sulfo-arsenide",
-    ],
-    "chrysocolla-mesa": [
-        "copper-silicate", "botryoidal-blue", "mesa-oxidized", "turquoise-cousin", "opal-admixed", "dehydration-crack",
-        "chrysocolla-chalcedony", "gem-silica", "copper-stain", "gossan-indicator", "secondary-copper", "azurite-replaced", "malachite-banded", "supergene-blanket",
-    ],
-    "scapolite-ridge": [
-        "marialite-sodic", "meionite-calcic", "tetragonal-prism-v2", "ridge-granulite", "wernerite-old", "fluorescent-yellow",
-        "dipyre-intermediate", "metamorphic-calc", "amphibolite-facies", "contact-zone", "replacement-feldspar", "skarned-margin", "cathodoluminescent-blue", "volatile-bearing",
-    ],
-    "columbite-hollow": [
-        "niobium-oxide", "tantalite-end-member", "orthorhombic-prism", "hollow-pegmatite", "rare-earth-host-v2", "manganocolumbite",
-        "ferrocolumbite", "tapiolite-polymorph", "samarskite-group", "euxenite-related", "pyrochlore-cubic", "capacitor-grade", "superconductor-flux", "ferro-alloy-source",
-    ],
-    # ===== New series for Phase 17731+ =====
-    "hauyne-basin": [
-        "sodalite-group", "lazurite-kin", "nosean-cousin", "feldspathoid-blue", "phonolite-hosted", "basin-volcanic",
-        "sulfate-bearing", "cubic-crystal-v2", "lapis-component", "isometric-form", "alkaline-igneous", "leucite-tephrite", "melilite-nephelinite", "undersaturated-melt",
-    ],
-    "perovskite-ridge": [
-        "calcium-titanate", "orthorhombic-distort", "solar-cell", "piezo-ceramic", "ridge-skarn", "magnetoresistance",
-        "superconductor-parent", "ferroelectric-switch", "photovoltaic-layer", "thin-film-deposited", "cubic-perovskite", "tolerance-factor", "octahedral-tilt", "goldschmidt-rule",
-    ],
-    "sodalite-gorge": [
-        "chloro-silicate", "royal-blue-v2", "hackmanite-photo", "gorge-plutonic", "fluorescent-orange-v2", "tenebrescent",
-        "cage-structure", "cancrinite-related", "nosean-sulfate", "tugtupite-rare", "lazurite-sulfur", "hauyne-linked", "cubic-framework", "sodalite-cage",
-    ],
-    "vesuvianite-pass": [
-        "idocrase-old", "tetragonal-dipyramid", "contact-skarn", "pass-metamorphic-v2", "grossular-kin", "rodingite-hosted",
-        "californite-jade", "cyprine-copper", "chrome-vesuvianite", "manganese-variety", "boron-bearing-v2", "fluorine-rich", "columnar-habit", "massive-compact",
-    ],
-    "wulfenite-bluff": [
-        "lead-molybdate", "tabular-orange", "bluff-oxidized", "stolzite-tungsten", "tetragonal-thin", "secondary-mineral",
-        "scheelite-series", "powellite-calcium", "vanadinite-associated", "descloizite-paired", "mimetite-neighbor", "pyromorphite-group", "cerussite-crust-v2", "anglesite-coat",
-    ],
-    "axinite-bluff": [
-        "borosilicate-calcium", "triclinic-blade-v2", "contact-zone-v2", "axe-shaped", "manganese-axinite", "ferro-axinite",
-        "tinzenite-manganese", "magnesio-axinite", "piezo-electric-v2", "cleavage-good", "vitreous-luster", "brown-violet", "wedge-crystal", "hornfels-accessory",
-    ],
-    "danburite-terrace": [
-        "calcium-borosilicate", "orthorhombic-prism-v2", "topaz-similar", "terrace-metamorphic", "colorless-gem", "danbury-named",
-        "prismatic-elongated", "chisel-terminated", "heat-resistant-v2", "fluorescent-blue", "mexican-source", "japanese-twin", "cross-shaped-v2", "refractive-moderate",
-    ],
-    "eudialyte-peak": [
-        "complex-silicate", "trigonal-system", "peak-alkaline", "rare-earth-source", "zirconium-bearing", "sodium-calcium",
-        "eucolite-variety", "agrellite-associated", "lamprophyllite-paired", "loparite-neighbor", "lovozerite-group", "eudialyte-red", "cyclic-structure", "kola-peninsula",
-    ],
-    # ===== New series for Phase 18291+ =====
-    "pyrargyrite-basin": [
-        "silver-antimony", "trigonal-scaleno", "ruby-silver", "proustite-pair", "dark-ruby", "basin-epithermal",
-        "sulfo-salt", "conchoidal-fract", "adamantine-sub", "streak-cherry", "polybasite-kin", "stephanite-group", "tetrahedrite-associated", "freibergite-silver",
-    ],
-    "thomsonite-ridge": [
-        "zeolite-radial", "orthorhombic-needle", "natrolite-kin", "mesolite-cousin", "ridge-basaltic", "amygdule-fill",
-        "hydrothermal-vein-v2", "spherulitic-mass", "acicular-spray", "white-radiating", "stilbite-associated", "heulandite-paired", "chabazite-cubic", "laumontite-prismatic",
-    ],
-    "benitoite-gorge": [
-        "barium-titanium", "ditrigonal-dipyramid", "sapphire-blue-v2", "gorge-serpentinite", "neptunite-associated", "joaquinite-paired",
-        "fluorescent-intense", "san-benito-type", "gem-rare", "crossite-schist", "natrolite-v2-vein", "albite-host", "glaucophane-matrix", "eclogite-origin",
-    ],
-    "prehnite-vale": [
-        "grape-agate", "botryoidal-v2", "zeolite-facies-v2", "vale-basaltic", "epidote-suite", "pumpellyite-pair-v2",
-        "reniform-habit", "tabular-crystal-v2", "apple-green", "translucent-gem", "lining-cavity", "vein-fill-v2", "sub-greenschist", "stilpnomelane-assoc",
-    ],
-    "lazulite-mesa": [
-        "phosphate-blue", "monoclinic-dipyramid", "scorzalite-iron", "mesa-pegmatitic", "quartz-vein-hosted", "kyanite-bearing",
-        "lazurite-confused", "siderite-associated", "rutile-inclusion", "metamorphic-phosphate", "granulite-hosted", "eclogite-rare", "azure-gem", "paragonite-matrix",
-    ],
-    "kermesite-hollow": [
-        "antimony-oxysulfide", "cherry-red", "capillary-needle", "hollow-oxidized", "stibnite-derived", "valentinite-pair",
-        "senarmontite-cubic", "cervantite-ortho", "tufted-acicular", "efflorescent-crust", "secondary-sb", "prismatic-thin", "cleavage-basal", "monoclinic-elongate",
-    ],
-    "vivianite-pass": [
-        "iron-phosphate", "monoclinic-prismatic", "blue-green-deep", "pass-sedimentary", "erythrite-cobalt-kin", "annabergite-nickel-kin",
-        "oxidation-darkening", "tabular-elongated", "bog-ore-assoc", "clay-ironstone-v2", "fossil-replacement", "prismatic-striated-v2", "transparent-fresh", "blackened-surface",
-    ],
-    "pectolite-bluff": [
-        "larimar-blue", "triclinic-acicular", "wollastonite-kin", "bluff-volcanic-v2", "radiating-spray", "silky-luster",
-        "botryoidal-crust-v2", "caribbean-gem", "sodium-calcium-v2", "basalt-vesicle", "zeolite-suite", "needle-mass", "fibrous-compact", "blue-pectolite",
-    ],
-    "adamite-terrace": [
-        "zinc-arsenate", "orthorhombic-wedge", "lime-green-fluor", "terrace-oxidized", "olivenite-copper-kin", "paradamite-triclinic",
-        "cobalt-pink-var", "manganoan-rose", "cuproadamite-blue", "limonite-matrix-v2", "smithsonite-assoc", "hemimorphite-pair", "botryoidal-druzy", "fluorescent-green-v2",
-    ],
-    "cavansite-peak": [
-        "calcium-vanadium", "orthorhombic-rosette", "peacock-blue", "peak-basaltic", "pentagonite-dimorph", "stilbite-substrate",
-        "heulandite-base", "apophyllite-assoc", "zeolite-cavity", "volcanic-vesicle-v2", "prismatic-blue", "rosette-cluster", "deccan-trap", "tuff-hosted",
-    ],
-    # ===== New series for Phase 19691+ =====
-    "beryl-canyon": [
-        "hexagonal-prism-v3", "emerald-chromium", "aquamarine-iron", "morganite-manganese", "heliodor-uranium", "goshenite-pure-v2",
-        "pegmatite-giant", "canyon-vein-hosted", "columnar-crystal", "etched-surface", "vorobyevite-cesium", "rosterite-lithium", "beryl-habit", "maxixe-irradiated",
-    ],
-    "topaz-basin": [
-        "orthorhombic-prism-v3", "imperial-orange", "sherry-golden", "london-blue", "swiss-blue", "sky-blue-natural",
-        "basin-rhyolitic", "fluorine-hydroxyl", "basal-cleavage", "prismatic-striation", "mystic-coated", "phantom-inclusion", "alluvial-gem-v2", "pegmatite-pocket",
-    ],
-    "olivine-ridge": [
-        "forsterite-magnesium", "fayalite-iron-end", "peridot-gem-v2", "mantle-abundant", "ridge-basaltic-v2", "dunite-rock",
-        "xenolith-carried-v2", "meteorite-pallasite", "san-carlos-type", "nesosilicate-island", "olivine-sand", "green-beach", "cumulate-settled", "iddingsite-altered",
-    ],
-    "zircon-gorge": [
-        "tetragonal-dipyramid-v2", "uranium-bearing-v2", "hafnium-trace", "gorge-granitic", "detrital-grain-v2", "geochronometer",
-        "metamict-damaged", "hyacinth-red", "zircon-sand-v2", "refractory-mold", "ceramic-opacifier", "high-zircon", "low-zircon", "reidite-shocked",
-    ],
-    "talc-mesa": [
-        "monoclinic-sheet", "soapstone-carved", "steatite-grade", "mesa-ultramafic", "serpentine-derived-v2", "chlorite-associated",
-        "talc-schist", "paper-grade", "cosmetic-filler", "ceramic-body", "paint-extender-v2", "plastic-nucleant", "rubber-dusting", "pharmaceutical-excipient",
-    ],
-    "augite-pass": [
-        "clinopyroxene-common", "monoclinic-prismatic-v2", "pass-volcanic-v2", "basalt-phenocryst", "gabbro-cumulate", "diopside-end-v2",
-        "hedenbergite-iron-end", "exsolution-pigeonite", "twinned-crystal", "dark-green-black", "stubby-prism", "augite-porphyry", "ophitic-texture", "sub-calcic",
-    ],
-    "biotite-bluff": [
-        "potassium-iron-mica", "monoclinic-sheet-v2", "bluff-granitic-v2", "phlogopite-magnesium", "annite-iron-end", "books-crystal",
-        "perfect-basal", "dark-mica", "pleochroic-brown", "dehydration-melt", "chloritized-alter", "bird-eye-maple", "argon-datable", "biotite-gneiss",
-    ],
-    "muscovite-hollow": [
-        "potassium-aluminum-mica", "monoclinic-tabular", "hollow-pegmatitic", "sericite-fine", "fuchsite-chrome", "phengite-high-p",
-        "paragonite-sodium", "mica-book", "dielectric-sheet", "window-pane", "isinglass-old", "muscovy-glass", "ruby-muscovite", "gilded-mica",
-    ],
-    "anhydrite-terrace": [
-        "calcium-sulfate-dry", "orthorhombic-tabular", "gypsum-dehydrated", "terrace-evaporitic", "cap-rock-v2", "salt-dome",
-        "angelite-blue-v2", "massive-granular", "fibrous-vein-v2", "cleavage-cubic-like", "anhydrite-plug", "sulfur-associated", "halite-interbedded", "polyhalite-mixed",
-    ],
-    "pyrite-peak": [
-        "iron-disulfide", "cubic-pyritohedron", "fools-gold", "peak-hydrothermal", "marcasite-dimorph-v2", "framboidal-form",
-        "arsenic-bearing-v2", "cobalt-trace-v2", "nickel-variety", "striated-cube", "pyritohedral-habit", "replacement-fossil-v2", "massive-granular-v2", "sun-disc",
-    ],
-    # ===== New series for Phase 23891+ =====
-    "valkyrie": [
-        "shield-maiden", "chooser-slain", "einherjar-bound", "wing-helmed", "spear-sworn", "battle-weaver",
-        "mead-hall", "rune-carved", "frost-gale", "war-hymn", "sky-rider", "fate-spinner", "valor-forged", "odin-sent",
-    ],
-    "chimera": [
-        "lion-headed", "goat-bodied", "serpent-tailed", "fire-breath", "hybrid-born", "myth-forged",
-        "beast-fused", "terror-winged", "shadow-stalked", "fang-triple", "scale-maned", "claw-rending", "rage-bound", "labyrinth-kin",
-    ],
-    "pegasus": [
-        "wing-spread", "cloud-gallop", "star-maned", "hoof-struck", "sky-born", "thunder-steed",
-        "dawn-rider", "gale-swept", "silver-flanked", "storm-bridled", "muse-spring", "heaven-vaulted", "wind-saddled", "bolt-swift",
-    ],
-    "phoenix": [
-        "ash-risen", "flame-plumed", "rebirth-cycle", "ember-hearted", "sun-kindled", "pyre-born",
-        "golden-winged", "tear-healing", "immortal-spark", "cinder-crowned", "blaze-sung", "fire-nested", "epoch-turned", "radiance-core",
-    ],
-    "griffin": [
-        "eagle-crowned", "lion-pawed", "gold-guarding", "aerie-throned", "talon-keen", "beak-iron",
-        "feather-mailed", "crest-proud", "nest-gilded", "sky-sentinel", "treasure-warding", "dual-natured", "raptor-roar", "pride-bound",
-    ],
-    "hydra": [
-        "many-headed", "regen-scaled", "swamp-lurking", "venom-blooded", "neck-coiled", "fang-legion",
-        "acid-breathed", "marsh-rooted", "wound-spawning", "serpent-crowned", "lair-sunken", "immortal-head", "cauterize-proof", "lake-dwelling",
-    ],
-    "sphinx": [
-        "riddle-posed", "lion-flanked", "human-faced", "desert-seated", "wisdom-gated", "enigma-bound",
-        "oracle-voiced", "sand-carved", "paw-resting", "guardian-still", "truth-seeking", "passage-barred", "mystery-veiled", "answer-keyed",
-    ],
-    "centaur": [
-        "horse-bodied", "archer-skilled", "forest-roaming", "herd-running", "star-reading", "spear-wielding",
-        "hoof-thundered", "mane-wild", "wisdom-elder", "meadow-galloped", "bow-drawn", "trail-blazed", "sage-taught", "mount-born",
-    ],
-    "cyclops": [
-        "single-eyed", "forge-master", "boulder-hurled", "cave-dwelling", "titan-born", "hammer-struck",
-        "flame-stoking", "anvil-ringing", "thunder-crafted", "island-bound", "sheep-herding", "stone-walled", "bronze-smithed", "peak-seated",
-    ],
-    "siren": [
-        "song-weaving", "shore-perched", "wave-calling", "sailor-luring", "voice-enchanted", "reef-haunting",
-        "tide-singing", "mist-cloaked", "current-voiced", "deep-echoed", "foam-crowned", "moonlit-hymn", "undertow-drawn", "pearl-throated",
-    ],
-    # ===== New series for Phase 24591+ (Mythological Beasts) =====
-    "minotaur": [
-        "labyrinth-bound", "horn-crowned", "maze-walker", "bull-forged", "arena-bred", "axe-wielding",
-        "stone-walled", "corridor-stalking", "thread-traced", "bronze-skinned", "hoof-stamped", "myth-born", "palace-deep", "ritual-carved",
-    ],
-    "gorgon": [
-        "stone-gazing", "serpent-haired", "shield-reflected", "medusa-born", "petrifying", "venom-dripped",
-        "temple-dwelling", "curse-laden", "scale-skinned", "fang-bared", "aegis-mounted", "bronze-clawed", "nightmare-forged", "idol-shattered",
-    ],
-    "triton": [
-        "conch-blown", "trident-armed", "reef-dwelling", "wave-riding", "coral-throned", "deep-sea",
-        "current-steering", "pearl-adorned", "shell-armored", "tide-commanding", "kelp-mantled", "brine-blessed", "surf-born", "abyss-roaming",
-    ],
-    "harpy": [
-        "wind-borne", "talon-sharp", "storm-shrieking", "cliff-nesting", "gale-winged", "sky-hunting",
-        "feather-bladed", "swoop-diving", "tempest-born", "carrion-scenting", "iron-beaked", "cloud-darting", "prey-snatching", "gust-riding",
-    ],
-    "wyvern": [
-        "venom-tailed", "leather-winged", "fire-spewing", "crag-dwelling", "sky-terrorizing", "scale-plated",
-        "roost-perched", "fang-dripping", "shadow-casting", "den-guarding", "acid-breathed", "bone-crushing", "flight-swift", "wyrm-blooded",
-    ],
-    "basilisk": [
-        "death-gazing", "crown-crested", "venom-fanged", "tunnel-lurking", "stone-turning", "serpent-king",
-        "cave-born", "scale-jeweled", "hiss-deadly", "mirror-weak", "rooster-spawned", "den-coiled", "plague-bearing", "eye-blazing",
-    ],
-    "manticore": [
-        "spike-tailed", "lion-bodied", "scorpion-armed", "desert-roaming", "triple-rowed", "prey-devouring",
-        "wing-spread-v2", "fang-triple", "mane-bristled", "barb-launching", "howl-piercing", "sand-stalking", "bone-crunching", "fear-radiating",
-    ],
-    "fenrir": [
-        "chain-breaking", "wolf-giant", "fang-gleaming", "ice-breathed", "fate-bound", "iron-jawed",
-        "shadow-pelted", "howl-shaking", "frost-furred", "rage-fueled", "myth-chained", "doom-heralding", "pack-leading", "tundra-prowling",
-    ],
-    "wyrm": [
-        "earth-burrowing", "coil-massive", "scale-ancient", "fire-bellied", "hoard-guarding", "cavern-dwelling",
-        "gem-encrusted", "wing-vestigial", "breath-toxic", "treasure-sleeping", "mountain-coiled", "claw-rending", "age-eternal", "lair-deep",
-    ],
-    "drake": [
-        "flame-tongued", "wing-folded", "scale-hardened", "ember-eyed", "smoke-trailing", "nest-fierce",
-        "gold-hoarding", "claw-razor", "fire-resistant", "sky-patrolling", "den-warming", "egg-guarding", "roar-thundering", "spine-ridged",
-    ],
-    # ===== New series for Phase 25291+ (Legendary Spirits) =====
-    "selkie": [
-        "seal-folk", "skin-casting", "wave-cloaked", "foam-footed", "tide-called", "kelp-draped",
-        "brine-scented", "moon-haunted", "dune-silent", "cove-hidden", "surf-born-v2", "net-slipping", "gull-watched", "shore-shifting",
-    ],
-    "kelpie": [
-        "water-horse", "ford-haunting", "river-lurking", "mane-dripping", "bridle-beguiling", "bog-luring",
-        "loch-dwelling", "hoof-slick", "reed-whispering", "current-pulling", "rider-tricking", "bank-stalking", "kelp-entangled", "mire-bound",
-    ],
-    "djinn": [
-        "smokeless-flame", "desert-born", "fire-wrought", "wish-binding", "sand-whirling", "brass-lantern",
-        "mirage-casting", "ember-king", "oath-twisting", "wind-housed", "ashless-blaze", "incense-scented", "seal-ringed", "night-wandering",
-    ],
-    "golem": [
-        "clay-wrought", "earth-animated", "rune-etched", "river-soaked", "kiln-baked", "mud-hewn",
-        "guardian-shaped", "breathless-guard", "script-bound", "iron-shod", "stone-browed", "dust-stirred", "warded-mark", "oath-silent",
-    ],
-    "naga": [
-        "serpent-deity", "hood-flared", "coil-guarding", "river-hallowed", "shrine-keeping", "jewel-crowned",
-        "water-ward", "fang-gilded", "scale-ceremonial", "temple-coiled", "rain-bringing", "spring-watching", "lake-circled", "myth-anointed",
-    ],
-    "banshee": [
-        "wail-foretelling", "keening-cry", "barrow-haunting", "pale-veiled", "death-omen", "night-lament",
-        "tear-chilled", "cairn-watched", "wind-weeping", "ruin-wandering", "hearth-forewarned", "moor-bound", "shade-crying", "dirge-calling",
-    ],
-    "thunderbird": [
-        "storm-borne", "cloud-rending", "lightning-eyed", "sky-resounding", "wing-thundered", "rain-commanding",
-        "mountain-circling", "squall-summoning", "talon-stormed", "thunder-waked", "hail-calling", "horizon-shadowing", "prairie-guarding", "tempest-winged",
-    ],
-    "wendigo": [
-        "ice-starved", "hunger-haunted", "spruce-shadowed", "winter-gaunt", "blizzard-stalking", "bone-thin",
-        "frost-bitten", "deer-echoing", "cannibal-curse", "breath-frozen", "moon-starved", "snow-gnashing", "pine-howling", "aurora-glared",
-    ],
-    "tengu": [
-        "crow-headed", "beak-masked", "mountain-ascetic", "cedar-perched", "yamabushi-clad", "wind-trickster",
-        "feather-fanned", "duel-teaching", "bridge-guarding", "cliff-striding", "staff-wielding", "mask-grinning", "shrine-mischief", "path-warding",
-    ],
-    "yokai": [
-        "shape-shifting", "lantern-led", "alley-haunting", "rice-field-roaming", "tea-kettle-spirited", "umbrella-hopping",
-        "night-parade", "shrine-haunting", "household-pranking", "well-dwelling", "shadow-peering", "attic-scuttling", "mirror-dwelling", "kitchen-trickster",
-    ],
-}
+# Adjective sets for each series, read lazily from series-adjectives.dat/.idx (see series_data.py)
+SERIES_ADJECTIVES = SeriesIndex()
 
 
-def to_camel(kebab: str) -> str:
-    parts = kebab.split("-")
-    return parts[0] + "".join(p.capitalize() for p in parts[1:])
+UI_ROUTE_MARKER = "\0route\0"
+UI_COLOR_MARKER = "\0color\0"
+# render_ui_page() uses the color ("indigo-600") and its name ("indigo"); with
+# UI_COLOR_MARKER + "-600" as the color both show up as distinct slots.
+UI_SLOT_RE = re.compile("\0(route|color)\0(-600)?")
 
 
+@PROFILE.timed("render UI")
 def make_ui_page(route_name: str, color: str, category: str) -> str:
+    """Render a UI page by filling the memoized per-category template."""
+    literals, slots = compile_ui_page(category)
+    values = {"route": route_name, "color": color, "color_name": color.replace("-600", "")}
+    parts = [literals[0]]
+    for slot, literal in zip(slots, literals[1:]):
+        parts += (values[slot], literal)
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_ui_page(category: str):
+    """Split the page around its route name and colors. Only len(CATEGORIES) variants exist.
+
+    Returns (literals, slots): the page is literals[0] + value of slots[0] +
+    literals[1] + ..., so every series after the first route of each category
+    renders from the cache.
+    """
+    pieces = UI_SLOT_RE.split(render_ui_page(UI_ROUTE_MARKER, UI_COLOR_MARKER + "-600", category))
+    slots = tuple("route" if kind == "route" else "color" if suffix else "color_name"
+                  for kind, suffix in zip(pieces[1::3], pieces[2::3]))
+    return tuple(pieces[0::3]), slots
+
+
+def ui_cache_counts():
+    info = compile_ui_page.cache_info()
+    return info.hits, info.misses
+
+
+def ui_cache_summary(hits: int, misses: int) -> str:
+    total = hits + misses
+    rate = 100.0 * hits / total if total else 0.0
+    return f"UI template cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)"
+
+
+PAGE_FETCH_HOOKS = fetch_hooks("TABS", "API_BASE")
+
+
+def render_ui_page(route_name: str, color: str, category: str) -> str:
     tabs = CAT_UI_TABS[category]
     tabs_json = ",\n  ".join(
         f'{{"key":"{t[0]}","label":"{t[1]}","path":"{t[2]}"}}'
@@ -1278,22 +224,11 @@ const TABS = [
 ] as const;
 
 const API_BASE = "/api/{route_name}/";
-
+{CACHED_FETCH}
 export default function Page() {{
   const [active, setActive] = useState<(typeof TABS)[number]["key"]>("dashboard");
-  const [data, setData] = useState<ApiResponse | null>(null);
   const [error, setError] = useState<string | null>(null);
-
-  useEffect(() => {{
-    const tab = TABS.find((t) => t.key === active);
-    if (!tab) return;
-    setError(null);
-    fetch(API_BASE + tab.path)
-      .then((r) => r.json())
-      .then(setData)
-      .catch((e) => setError(e.message));
-  }}, [active]);
-
+{PAGE_FETCH_HOOKS}
   return (
     <div className="p-6">
       <h1 className="text-2xl font-bold text-{color} mb-4">
@@ -1326,93 +261,432 @@ export default function Page() {{
 '''
 
 
-def generate_series(series_name: str, start_phase: int):
-    adjectives = SERIES_ADJECTIVES[series_name]
-    os.makedirs(ROUTES_DIR, exist_ok=True)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-    imports = []
-    registrations = []
-    all_routes = []
+def series_size(series_name: str) -> int:
+    """Number of routes (and phases) one series occupies."""
+    return len(SERIES_ADJECTIVES[series_name]) * len(CATEGORIES)
 
-    phase = start_phase
-    for adj in adjectives:
-        for cat in CATEGORIES:
-            noun = CAT_NOUNS[cat]
-            route_name = f"ebay-{cat}-{adj}-{noun}-{series_name}"
-            color = COLORS[(phase - start_phase) % len(COLORS)]
-            var_name = to_camel(route_name) + "Router"
-
-            # API route file
-            api_path = os.path.join(ROUTES_DIR, f"{route_name}.ts")
-            with open(api_path, "w") as f:
-                f.write(API_TEMPLATE)
-
-            # UI page
-            ui_folder_name = f"{cat}-{adj}-{noun}-{series_name}"
-            ui_dir = os.path.join(UI_DIR, ui_folder_name)
-            os.makedirs(ui_dir, exist_ok=True)
-            ui_path = os.path.join(ui_dir, "page.tsx")
-            with open(ui_path, "w") as f:
-                f.write(make_ui_page(route_name, color, cat))
-
-            imports.append(f"import {var_name} from './{route_name}';")
-            registrations.append(f"  app.use('/api/{route_name}', {var_name});")
-            all_routes.append((phase, route_name, cat, color))
-            phase += 1
-
-    # Write imports/registrations
-    with open(os.path.join(OUTPUT_DIR, f"{series_name}-imports.txt"), "w") as f:
-        f.write("\n".join(imports) + "\n")
-    with open(os.path.join(OUTPUT_DIR, f"{series_name}-registrations.txt"), "w") as f:
-        f.write("\n".join(registrations) + "\n")
-
-    end_phase = phase - 1
-    print(f"[{series_name}] Generated {len(all_routes)} files. Phase {start_phase}-{end_phase}")
-    return end_phase
 
+def series_route_names(series_name: str):
+    specs = iter_route_specs(series_name, SERIES_ADJECTIVES[series_name], 0, CATEGORIES, CAT_NOUNS, COLORS)
+    return [spec.route_name for spec in specs]
 
-def update_routes(series_name: str, start_phase: int, end_phase: int):
-    with open(ROUTES_FILE, "r") as f:
-        content = f.read()
 
-    with open(f"{OUTPUT_DIR}/{series_name}-imports.txt", "r") as f:
-        imports = f.read().strip()
+@PROFILE.timed("plan")
+def plan_batch(series_names, start_phase: int):
+    """Assign consecutive phase ranges to each series, starting at start_phase."""
+    plan = []
+    phase = start_phase
+    for name in series_names:
+        end = phase + series_size(name) - 1
+        plan.append((name, phase, end))
+        phase = end + 1
+    return plan
 
-    with open(f"{OUTPUT_DIR}/{series_name}-registrations.txt", "r") as f:
-        regs = f.read().strip()
 
-    content = content.replace(
-        "\nexport function registerEbayRoutes",
-        f"\n// Phase {start_phase}-{end_phase} ({series_name.capitalize()} series)\n{imports}\n\nexport function registerEbayRoutes"
-    )
+def generate_series(series_name: str, start_phase: int, writer=None, shared: bool = False,
+                    static_responses: bool = False, dynamic_ui: bool = False, journal=None):
+    """Write one series' route files, UI pages and side files; returns its last phase.
 
-    last_brace = content.rstrip().rfind("}")
-    content = (
-        content[:last_brace]
-        + f"\n  // Phase {start_phase}-{end_phase} ({series_name.capitalize()} series)\n"
-        + regs
-        + "\n}\n"
-    )
+    With a RunJournal, each finished route is recorded and routes it already
+    lists (from an interrupted run) are not rendered again.
+    """
+    from route_db import RouteRecorder, route_row
+    from smoke_tests import emit_smoke_tests
 
-    with open(ROUTES_FILE, "w") as f:
-        f.write(content)
-    print(f"[{series_name}] Updated ebay-routes.ts")
+    adjectives = SERIES_ADJECTIVES[series_name]
+    api_template = static_template(API_TEMPLATE) if static_responses else API_TEMPLATE
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    written = 0
+    count = 0
+    resumed = 0
+    progress = Progress(series_name, series_size(series_name))
+
+    specs = iter_route_specs(series_name, adjectives, start_phase, CATEGORIES, CAT_NOUNS, COLORS)
+    with LineSink(os.path.join(OUTPUT_DIR, f"{series_name}-imports.txt"), writer) as imports, \
+            LineSink(os.path.join(OUTPUT_DIR, f"{series_name}-registrations.txt"), writer) as registrations, \
+            RouteRecorder(OUTPUT_DIR, writer) as registry:
+        for spec in specs:
+            route_name = spec.route_name
+            # API route file (shared mode mounts the standard router instead)
+            api_path = None if shared else os.path.join(ROUTES_DIR, f"{route_name}.ts")
+            # UI page (dynamic mode serves it from ebay/[slug] instead, see update_ui_manifest)
+            ui_path = None if dynamic_ui else os.path.join(UI_DIR, ui_slug(spec, series_name), "page.tsx")
+
+            if journal is not None and journal.is_done(series_name, route_name):
+                resumed += 1
+            else:
+                if api_path:
+                    written += writer.write(api_path, api_template)
+                if ui_path:
+                    written += writer.write(ui_path, make_ui_page(route_name, spec.color, spec.category))
+
+                if journal is not None:
+                    journal.route_done(series_name, route_name)
+
+            imports.write_line(f"import {spec.var_name} from './{route_name}';")
+            registrations.write_line(f"  app.use('/api/{route_name}', {spec.var_name});")
+            registry.add(route_row(route_name, spec.phase, series_name, "generate_series", spec.category, spec.color,
+                                   api_template, api_path, ui_path))
+            count += 1
+            progress.tick()
+
+    emit_smoke_tests(series_name, series_route_names(series_name), variant_of(API_TEMPLATE), writer, ROUTES_DIR,
+                     TESTS_DIR, shared)
+    end_phase = start_phase + count - 1
+    if journal is not None:
+        # The journal must never claim files that are not durable yet.
+        writer.checkpoint()
+        journal.series_done(series_name)
+    if owns_writer:
+        writer.close()
+    files = (count - resumed) * ((0 if shared else 1) + (0 if dynamic_ui else 1))
+    print(f"[{series_name}] Generated {count} routes ({written} files written, "
+          f"{files - written} unchanged"
+          + (f", {resumed} routes done before resume" if resumed else "")
+          + f"). Phase {start_phase}-{end_phase}")
+    return end_phase
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python3 generate_series.py <series_name> <start_phase>")
-        print(f"Available series: {', '.join(SERIES_ADJECTIVES.keys())}")
+def series_files(series_name: str, shared: bool = False, dynamic_ui: bool = False):
+    """Every file generate_series() leaves behind for a series (the routes step's precondition)."""
+    paths = [os.path.join(OUTPUT_DIR, f"{series_name}-imports.txt"),
+             os.path.join(OUTPUT_DIR, f"{series_name}-registrations.txt")]
+    for spec in iter_route_specs(series_name, SERIES_ADJECTIVES[series_name], 0, CATEGORIES, CAT_NOUNS, COLORS):
+        if not shared:
+            paths.append(os.path.join(ROUTES_DIR, f"{spec.route_name}.ts"))
+        if not dynamic_ui:
+            paths.append(os.path.join(UI_DIR, ui_slug(spec, series_name), "page.tsx"))
+    return paths
+
+
+def ui_slug(spec, series_name: str) -> str:
+    return f"{spec.category}-{spec.adjective}-{spec.noun}-{series_name}"
+
+
+def update_ui_manifest(plan, writer=None):
+    """Dynamic UI mode: add the plan's pages to the ebay/[slug] manifest."""
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    pages = [
+        (ui_slug(spec, series_name), spec.category, spec.color)
+        for series_name, start_phase, _ in plan
+        for spec in iter_route_specs(series_name, SERIES_ADJECTIVES[series_name], start_phase,
+                                     CATEGORIES, CAT_NOUNS, COLORS)
+    ]
+    added = emit_dynamic_ui(UI_DIR, pages, CAT_UI_TABS, writer)
+    if owns_writer:
+        writer.close()
+    print(f"[{', '.join(s for s, _, _ in plan)}] Updated ebay/[slug] UI manifest ({added} new pages)")
+
+
+def update_routes(series_name: str, start_phase: int, end_phase: int, writer=None, monolithic: bool = False):
+    update_routes_batch([(series_name, start_phase, end_phase)], writer, monolithic)
+
+
+def update_routes_batch(plan, writer=None, monolithic: bool = False):
+    """Register every (series, start, end) in plan with a single read/write of ebay-routes.ts.
+
+    By default each series gets its own ebay-routes-<series>.ts shard and
+    ebay-routes.ts only calls the shard entry points; monolithic=True splices
+    the imports/registrations into ebay-routes.ts itself.
+    """
+    names = ", ".join(s for s, _, _ in plan)
+    if monolithic:
+        added = apply_series(ROUTES_FILE, OUTPUT_DIR, plan, writer)
+        print(f"[{names}] Updated ebay-routes.ts ({added} new registrations)")
+    else:
+        added = apply_shards(ROUTES_DIR, ROUTES_FILE, OUTPUT_DIR, plan, writer)
+        print(f"[{names}] Updated route shards ({added} new shards in ebay-routes.ts)")
+
+
+def update_routes_lazy(plan, writer=None):
+    """Lazy mode: add the plan's routes to the lazy manifest instead of static imports."""
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    names = [route for series_name, _, _ in plan for route in series_route_names(series_name)]
+    added = emit_lazy_routes(ROUTES_DIR, ROUTES_FILE, names, writer, plan)
+    if owns_writer:
+        writer.close()
+    print(f"[{', '.join(s for s, _, _ in plan)}] Updated lazy route manifest ({added} new routes)")
+
+
+def update_routes_shared(plan, writer=None):
+    """Shared mode: mount the plan's routes on the shared standard router table."""
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    names = [route for series_name, _, _ in plan for route in series_route_names(series_name)]
+    added = emit_shared_routes(ROUTES_DIR, ROUTES_FILE, variant_of(API_TEMPLATE), names, writer, plan)
+    if owns_writer:
+        writer.close()
+    print(f"[{', '.join(s for s, _, _ in plan)}] Updated shared router table ({added} new routes)")
+
+
+def update_routes_dispatch(plan, writer=None):
+    """Dispatch mode: add the plan's routes to the radix-trie dispatch table."""
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    series = [series_name for series_name, _, _ in plan]
+    names = [route for series_name in series for route in series_route_names(series_name)]
+    added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, names, writer, series, OUTPUT_DIR, plan)
+    if owns_writer:
+        writer.close()
+    print(f"[{', '.join(series)}] Updated route dispatch table ({added} new routes)")
+
+
+def update_registrations(plan, writer, lazy: bool = False, shared: bool = False, monolithic: bool = False,
+                         dispatch: bool = False, dynamic_ui: bool = False, journal=None):
+    """Routes step of a run: register the plan's series in the mode's registry.
+
+    Nothing is registered unless every file of every series in the plan exists,
+    so ebay-routes.ts never lists a router whose file is missing. The routes
+    file itself is replaced atomically (OutputWriter.write(atomic=True)).
+    """
+    if journal is not None and journal.routes_done:
+        print("Routes step already committed before resume")
+        return
+    check_complete(writer, {series_name: series_files(series_name, shared, dynamic_ui)
+                            for series_name, _, _ in plan})
+    if dynamic_ui:
+        update_ui_manifest(plan, writer)
+    if shared:
+        update_routes_shared(plan, writer)
+    elif lazy:
+        update_routes_lazy(plan, writer)
+    elif dispatch:
+        update_routes_dispatch(plan, writer)
+    else:
+        update_routes_batch(plan, writer, monolithic)
+    if journal is not None:
+        journal.routes_committed()
+
+
+def _generate_in_process(series_name: str, start_phase: int, shared: bool, static_responses: bool,
+                         dynamic_ui: bool, journal=None, sync_every=None):
+    """Process-pool entry point: generate one series and hand writer/cache stats back to the parent."""
+    writer = make_writer(OUTPUT_DIR, sync_every=sync_every)
+    hits, misses = ui_cache_counts()
+    generate_series(series_name, start_phase, writer, shared, static_responses, dynamic_ui, journal)
+    writer.checkpoint()
+    after_hits, after_misses = ui_cache_counts()
+    return writer.stats(), (after_hits - hits, after_misses - misses)
+
+
+def generate_batch(series_names, start_phase: int, workers: int = 0, pool: str = "thread",
+                   lazy: bool = False, shared: bool = False, plan=None, writer=None,
+                   monolithic: bool = False, dispatch: bool = False, static_responses: bool = False,
+                   dynamic_ui: bool = False, journal=None):
+    """Generate several series concurrently, then merge ebay-routes.ts once.
+
+    plan, if given, is a list of (series, start, end) overriding the consecutive
+    ranges computed from start_phase. writer, if given, is used instead of a
+    fresh $CODEX_BACKEND writer and left open for the caller. journal, if
+    given, records progress and skips series it already lists as complete.
+    """
+    plan = plan or plan_batch(series_names, start_phase)
+    pending = [entry for entry in plan if journal is None or entry[0] not in journal.done_series]
+    workers = workers or min(len(plan), os.cpu_count() or 1)
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(OUTPUT_DIR)
+    if pool == "process" and not writer.backend.persistent:
+        # Child processes cannot hand in-memory files back; render in threads instead.
+        print(f"[{writer.backend.name}] backend is not persistent, using the thread pool")
+        pool = "thread"
+    executor_cls = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+
+    hits, misses = ui_cache_counts()
+    started = time.perf_counter()
+    with executor_cls(max_workers=workers) as executor:
+        if pool == "process":
+            sync_every = getattr(writer.backend, "sync_every", None)
+            futures = [executor.submit(_generate_in_process, name, start, shared, static_responses, dynamic_ui,
+                                       journal, sync_every)
+                       for name, start, _ in pending]
+        else:
+            futures = [executor.submit(generate_series, name, start, writer, shared, static_responses, dynamic_ui,
+                                       journal)
+                       for name, start, _ in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            if pool == "process":
+                stats, (child_hits, child_misses) = result
+                writer.merge(*stats)
+                hits, misses = hits - child_hits, misses - child_misses
+    after_hits, after_misses = ui_cache_counts()
+    hits, misses = after_hits - hits, after_misses - misses
+    render_elapsed = time.perf_counter() - started
+
+    if len(pending) < len(plan):
+        print(f"Resumed: {len(plan) - len(pending)} series were complete before the interruption")
+    update_registrations(plan, writer, lazy, shared, monolithic, dispatch, dynamic_ui, journal)
+    elapsed = time.perf_counter() - started
+
+    files = writer.written + writer.skipped
+    rate = files / render_elapsed if render_elapsed else float("inf")
+    print(f"Batch: {len(plan)} series, {files} files ({writer.summary()}) in {elapsed:.2f}s "
+          f"({rate:.0f} files/s, {workers} {pool} workers)")
+    print(ui_cache_summary(hits, misses))
+    if owns_writer:
+        writer.close()
+    return plan
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("series", nargs="?", help="series name, comma-separated list of series, or 'all'")
+    parser.add_argument("start_phase", nargs="?", help="first phase, or 'auto' for the next free phase range")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker count for batch runs (default: one per CPU)")
+    parser.add_argument("--pool", choices=["thread", "process"], default="thread")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--lazy", action="store_true",
+                      help="register routes through the lazy manifest/dispatcher instead of static imports")
+    mode.add_argument("--shared", action="store_true",
+                      help="mount routes on the shared createStandardRouter table instead of writing one file each")
+    mode.add_argument("--monolithic", action="store_true",
+                      help="splice routes into ebay-routes.ts itself instead of per-series ebay-routes-<series>.ts shards")
+    mode.add_argument("--dispatch", action="store_true",
+                      help="resolve routes through one generated radix-trie dispatcher instead of app.use() mounts")
+    parser.add_argument("--static-responses", action="store_true",
+                        help="write routers that send precomputed JSON buffers with ETag/304 support (not with --shared)")
+    parser.add_argument("--dynamic-ui", action="store_true",
+                        help="serve UI pages from one ebay/[slug] route + manifest instead of one page.tsx each")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print the phase/file plan and collisions without writing anything")
+    parser.add_argument("--force", action="store_true", help="generate even if the plan has collisions")
+    parser.add_argument("--backend", default=None,
+                        help="output backend: fs, memory, tar:<file> or zip:<file> (default: $CODEX_BACKEND or fs)")
+    parser.add_argument("--sync-every", type=int, default=None,
+                        help="fsync checkpoint every N files (0: only at the end, <0: never; "
+                             "default: $CODEX_SYNC_EVERY or 1000)")
+    parser.add_argument("--profile", action="store_true",
+                        help="run under cProfile with per-stage timers; writes codex/output/profile-generate_series.*")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the interrupted run recorded in codex/output/.generate-journal.jsonl")
+    parser.add_argument("--load-test", action="store_true",
+                        help="afterwards, write codex/output/load-plan.json and load-test.ts over every generated "
+                             "route (see load_test.py)")
+    parser.add_argument("--deploy-profile", metavar="NAME", default=None,
+                        help="afterwards, stage codex/output/profiles/NAME with only the series of "
+                             "codex/profiles/NAME.json (see deploy_profile.py)")
+    args = parser.parse_args(argv)
+    if args.resume and (args.series or args.start_phase or args.dry_run):
+        parser.error("--resume replays the journaled plan; drop the series / start_phase / --dry-run arguments")
+    if not args.resume and not args.start_phase:
+        parser.error("series and start_phase are required (or --resume)")
+    if args.shared and args.static_responses:
+        parser.error(SHARED_CONFLICT)
+    return args
+
+
+# Flags recorded in the journal so that --resume reruns the interrupted run in the same mode.
+JOURNALED_OPTIONS = ("lazy", "shared", "monolithic", "dispatch", "static_responses", "dynamic_ui")
+
+
+def run(args):
+    """One generate_series.py invocation (everything after argument parsing)."""
+    writer = make_writer(OUTPUT_DIR, args.backend, args.sync_every)
+    journal = None
+    try:
+        if args.resume:
+            if not writer.backend.persistent:
+                raise JournalError(f"--resume needs a backend that writes the tree, not {writer.backend.name}")
+            journal = RunJournal.resume(journal_path(OUTPUT_DIR))
+            for option in JOURNALED_OPTIONS:
+                setattr(args, option, journal.options.get(option, False))
+            plan = journal.plan
+            print(f"Resuming {', '.join(s for s, _, _ in plan)}: {journal.progress()}")
+        else:
+            if args.series == "all":
+                names = list(SERIES_ADJECTIVES)
+            else:
+                names = [s for s in args.series.split(",") if s]
+
+            unknown = [s for s in names if s not in SERIES_ADJECTIVES]
+            if unknown:
+                print(f"Unknown series: {', '.join(unknown)}. Available: {', '.join(SERIES_ADJECTIVES.keys())}")
+                sys.exit(1)
+
+            index, known_routes = phase_planner.scan(ROUTES_FILE, OUTPUT_DIR)
+            requested = None if args.start_phase == "auto" else int(args.start_phase)
+            planned = phase_planner.plan_series(index, known_routes, names, series_route_names, requested)
+            if args.dry_run:
+                sys.exit(1 if phase_planner.print_plan(planned, ROUTES_DIR, UI_DIR) else 0)
+            if any(collisions for *_, collisions in planned) and not args.force:
+                phase_planner.print_plan(planned, ROUTES_DIR, UI_DIR)
+                print("Aborting: plan has collisions (use --force to generate anyway)")
+                sys.exit(1)
+            plan = [(name, first, last) for name, first, last, *_ in planned]
+            if writer.backend.persistent:
+                journal = RunJournal.start(journal_path(OUTPUT_DIR), plan,
+                                           {option: getattr(args, option) for option in JOURNALED_OPTIONS})
+
+        if len(plan) == 1:
+            series, start, _ = plan[0]
+            if journal is None or series not in journal.done_series:
+                generate_series(series, start, writer, shared=args.shared, static_responses=args.static_responses,
+                                dynamic_ui=args.dynamic_ui, journal=journal)
+            update_registrations(plan, writer, args.lazy, args.shared, args.monolithic, args.dispatch,
+                                 args.dynamic_ui, journal)
+            print(ui_cache_summary(*ui_cache_counts()))
+        else:
+            generate_batch([name for name, _, _ in plan], plan[0][1], workers=args.workers, pool=args.pool,
+                           lazy=args.lazy, shared=args.shared, monolithic=args.monolithic,
+                           dispatch=args.dispatch, static_responses=args.static_responses,
+                           dynamic_ui=args.dynamic_ui, plan=plan, writer=writer, journal=journal)
+        if args.load_test:
+            from load_test import emit_load_test, registry_routes
+
+            # Non-persistent backends record no registry rows; plan this run's routes then.
+            names = registry_routes(OUTPUT_DIR) or [name for series_name, _, _ in plan
+                                                    for name in series_route_names(series_name)]
+            print(f"Load plan: {emit_load_test(OUTPUT_DIR, names, writer, ROUTES_FILE)} routes "
+                  f"(run: npx tsx codex/output/load-test.ts)")
+    except (JournalError, IncompleteSeriesError) as e:
+        print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        writer.close()
+    if journal is not None:
+        journal.finish()
+    if args.deploy_profile:
+        from deploy_profile import ProfileError, build_profile, load_profile, summary as profile_summary
+
+        if not writer.backend.persistent:
+            print(f"--deploy-profile: skipped, the {writer.backend.name} backend did not write the tree")
+        else:
+            try:
+                profile = load_profile(args.deploy_profile)
+                print(profile_summary(profile, build_profile(profile)))
+            except ProfileError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+    if len(plan) == 1:
+        print(f"Done! Phase {plan[0][1]}-{plan[0][2]} ({plan[0][0].capitalize()} series)")
+    else:
+        print(f"Done! Phase {plan[0][1]}-{plan[-1][2]} ({len(plan)} series)")
 
-    series = sys.argv[1]
-    start = int(sys.argv[2])
 
-    if series not in SERIES_ADJECTIVES:
-        print(f"Unknown series: {series}. Available: {', '.join(SERIES_ADJECTIVES.keys())}")
+if __name__ == "__main__":
+    if len(sys.argv) < 3 and "--resume" not in sys.argv:
+        print("Usage: python3 generate_series.py <series_name|a,b,c|all> <start_phase|auto> "
+              "[--workers N] [--pool thread|process] [--lazy|--shared|--monolithic|--dispatch] [--static-responses] [--dynamic-ui] [--dry-run] [--force] "
+              "[--backend fs|memory|tar:<file>|zip:<file>] [--sync-every N] [--profile] [--load-test] [--deploy-profile NAME]")
+        print("       python3 generate_series.py --resume [--workers N] [--pool thread|process] [--backend ...]")
+        print(f"Available series: {', '.join(SERIES_ADJECTIVES.keys())}")
         sys.exit(1)
 
-    end = generate_series(series, start)
-    update_routes(series, start, end)
-    print(f"Done! Phase {start}-{end} ({series.capitalize()} series)")
+    args = parse_args(sys.argv[1:])
+    if args.profile:
+        if args.pool == "process":
+            print("--profile: using the thread pool so stage timers see every series")
+            args.pool = "thread"
+        profile_run("generate_series", OUTPUT_DIR, run, args)
+    else:
+        run(args)
@@ -1,13 +1,41 @@
 #!/usr/bin/env python3
-"""Generate eBay Phase 2961-3030 (Spark series) route + UI files."""
+"""Generate eBay Phase 2961-3030 (Spark series) route + UI files.
 
-import os
+Pass --shared to mount the routes on the shared standard router instead of
+writing one API file per route.
+
+Pass --static-responses to write routers that send precomputed JSON buffers
+(with ETag / 304 support) instead of calling res.json() per request.
 
-ROUTES_DIR = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes"
-UI_DIR = "/Users/naokijodan/Desktop/rakuda/apps/web/src/app/ebay"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+Pass --dynamic-ui to add the UI pages to the ebay/[slug] manifest instead of
+writing one page.tsx per route.
+
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-generate_spark.json / .pstats).
+"""
+
+import os
+import sys
+
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import RouteRecorder, route_row
+from route_stream import LineSink, Progress, iter_route_specs
+from run_profile import PROFILE, profile_run
+from shared_router import BUNDLE_HANDLER, emit_shared_routes, variant_of
+from smoke_tests import emit_smoke_tests
+from static_router import SHARED_CONFLICT, static_template
+from ui_fetch import CACHED_FETCH, fetch_hooks
+from ui_manifest import emit_dynamic_ui
+
+ROUTES_DIR = repo_path("apps/api/src/routes")
+UI_DIR = repo_path("apps/web/src/app/ebay")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
 
 SERIES = "spark"
+START_PHASE = 2961
 
 API_TEMPLATE = '''import { Router } from 'express';
 import type { Request, Response } from 'express';
@@ -56,6 +84,24 @@ router.get('/export', (_req: Request, res: Response) => res.json({ section: 'uti
 router.post('/import', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'import' }));
 router.post('/sync', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'sync' }));
 
+// Bundle (1)
+const BUNDLE: Record<string, { section: string; action: string }> = {
+  'dashboard': { section: 'dashboard', action: 'dashboard' },
+  'dashboard/summary': { section: 'dashboard', action: 'summary' },
+  'dashboard/metrics': { section: 'dashboard', action: 'metrics' },
+  'dashboard/recent': { section: 'dashboard', action: 'recent' },
+  'dashboard/alerts': { section: 'dashboard', action: 'alerts' },
+  'resources': { section: 'resources', action: 'list' },
+  'variants': { section: 'variants', action: 'list' },
+  'listings': { section: 'listings', action: 'list' },
+  'analytics': { section: 'analytics', action: 'analytics' },
+  'analytics/overview': { section: 'analytics', action: 'overview' },
+  'analytics/trends': { section: 'analytics', action: 'trends' },
+  'settings': { section: 'settings', action: 'get' },
+  'health': { section: 'utilities', action: 'health' },
+  'export': { section: 'utilities', action: 'export' },
+};
+''' + BUNDLE_HANDLER + '''
 export default router;
 '''
 
@@ -123,10 +169,10 @@ ADJECTIVES = [
     "centralized", "optimized", "accelerated", "streamlined",
 ]
 
-def to_camel(kebab: str) -> str:
-    parts = kebab.split("-")
-    return parts[0] + "".join(p.capitalize() for p in parts[1:])
+PAGE_FETCH_HOOKS = fetch_hooks("TABS", "API_BASE")
+
 
+@PROFILE.timed("render UI")
 def make_ui_page(route_name: str, color: str, category: str) -> str:
     tabs = CAT_UI_TABS[category]
     tabs_json = ",\n  ".join(
@@ -144,22 +190,11 @@ const TABS = [
 ] as const;
 
 const API_BASE = "/api/{route_name}/";
-
+{CACHED_FETCH}
 export default function Page() {{
   const [active, setActive] = useState<(typeof TABS)[number]["key"]>("dashboard");
-  const [data, setData] = useState<ApiResponse | null>(null);
   const [error, setError] = useState<string | null>(null);
-
-  useEffect(() => {{
-    const tab = TABS.find((t) => t.key === active);
-    if (!tab) return;
-    setError(null);
-    fetch(API_BASE + tab.path)
-      .then((r) => r.json())
-      .then(setData)
-      .catch((e) => setError(e.message));
-  }}, [active]);
-
+{PAGE_FETCH_HOOKS}
   return (
     <div className="p-6">
       <h1 className="text-2xl font-bold text-{color} mb-4">
@@ -191,51 +226,74 @@ export default function Page() {{
 }}
 '''
 
-def main():
-    os.makedirs(ROUTES_DIR, exist_ok=True)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def spark_specs():
+    return iter_route_specs(SERIES, ADJECTIVES, START_PHASE, CATEGORIES, CAT_NOUNS, COLORS)
+
+
+def ui_folder(spec) -> str:
+    return f"{spec.category}-{spec.adjective}-{spec.noun}-{SERIES}"
+
+
+def main(shared: bool = False, static_responses: bool = False, dynamic_ui: bool = False):
+    template = static_template(API_TEMPLATE) if static_responses else API_TEMPLATE
+    writer = make_writer(OUTPUT_DIR)
 
-    imports = []
-    registrations = []
-    all_routes = []
+    count = 0
+    progress = Progress(SERIES, len(ADJECTIVES) * len(CATEGORIES))
 
-    phase = 2961
-    for adj_idx, adj in enumerate(ADJECTIVES):
-        for cat_idx, cat in enumerate(CATEGORIES):
-            noun = CAT_NOUNS[cat]
-            route_name = f"ebay-{cat}-{adj}-{noun}-{SERIES}"
-            color = COLORS[(phase - 2961) % len(COLORS)]
-            var_name = to_camel(route_name) + "Router"
+    with LineSink(os.path.join(OUTPUT_DIR, f"{SERIES}-imports.txt"), writer) as imports, \
+            LineSink(os.path.join(OUTPUT_DIR, f"{SERIES}-registrations.txt"), writer) as registrations, \
+            RouteRecorder(OUTPUT_DIR, writer) as registry:
+        for spec in spark_specs():
+            route_name = spec.route_name
 
             # API route file
-            api_path = os.path.join(ROUTES_DIR, f"{route_name}.ts")
-            with open(api_path, "w") as f:
-                f.write(API_TEMPLATE)
+            api_path = ui_path = None
+            if not shared:
+                api_path = os.path.join(ROUTES_DIR, f"{route_name}.ts")
+                writer.write(api_path, template)
 
             # UI page
-            ui_folder_name = f"{cat}-{adj}-{noun}-{SERIES}"
-            ui_dir = os.path.join(UI_DIR, ui_folder_name)
-            os.makedirs(ui_dir, exist_ok=True)
-            ui_path = os.path.join(ui_dir, "page.tsx")
-            with open(ui_path, "w") as f:
-                f.write(make_ui_page(route_name, color, cat))
-
-            imports.append(f"import {var_name} from './{route_name}';")
-            registrations.append(f"  app.use('/api/{route_name}', {var_name});")
-            all_routes.append((phase, route_name, cat, color))
-
-            phase += 1
-
-    # Write imports/registrations
-    with open(os.path.join(OUTPUT_DIR, f"{SERIES}-imports.txt"), "w") as f:
-        f.write("\n".join(imports) + "\n")
-    with open(os.path.join(OUTPUT_DIR, f"{SERIES}-registrations.txt"), "w") as f:
-        f.write("\n".join(registrations) + "\n")
-
-    print(f"Generated {len(all_routes)} API route files in {ROUTES_DIR}")
-    print(f"Generated {len(all_routes)} UI pages in {UI_DIR}")
-    print(f"Phase range: {all_routes[0][0]}-{all_routes[-1][0]}")
+            if not dynamic_ui:
+                ui_path = os.path.join(UI_DIR, ui_folder(spec), "page.tsx")
+                writer.write(ui_path, make_ui_page(route_name, spec.color, spec.category))
+            registry.add(route_row(route_name, spec.phase, SERIES, "generate_spark", spec.category, spec.color,
+                                   template, api_path, ui_path))
+
+            imports.write_line(f"import {spec.var_name} from './{route_name}';")
+            registrations.write_line(f"  app.use('/api/{route_name}', {spec.var_name});")
+            count += 1
+            progress.tick()
+
+    # The shared table, UI manifest and smoke specs re-derive names from the specs instead of collecting them.
+    shards = emit_smoke_tests(SERIES, (spec.route_name for spec in spark_specs()), variant_of(API_TEMPLATE),
+                              writer, ROUTES_DIR, TESTS_DIR, shared)
+    if dynamic_ui:
+        pages = ((ui_folder(spec), spec.category, spec.color) for spec in spark_specs())
+        added = emit_dynamic_ui(UI_DIR, pages, CAT_UI_TABS, writer)
+        print(f"Added {added} pages to the ebay/[slug] UI manifest")
+    if shared:
+        names = (spec.route_name for spec in spark_specs())
+        added = emit_shared_routes(ROUTES_DIR, ROUTES_FILE, variant_of(API_TEMPLATE), names, writer,
+                                   [(SERIES, START_PHASE, START_PHASE + count - 1)])
+        print(f"Added {added} routes to the shared router table")
+    writer.close()
+
+    if not shared:
+        print(f"Generated {count} API route files in {ROUTES_DIR}")
+    if not dynamic_ui:
+        print(f"Generated {count} UI pages in {UI_DIR}")
+    print(f"Phase range: {START_PHASE}-{START_PHASE + count - 1}")
     print(f"Imports/registrations written to {OUTPUT_DIR}/{SERIES}-*.txt")
+    print(f"Smoke specs: {shards} shards in {TESTS_DIR}")
+    print(f"Files: {writer.summary()}")
 
 if __name__ == "__main__":
-    main()
+    options = dict(shared="--shared" in sys.argv[1:], static_responses="--static-responses" in sys.argv[1:],
+                   dynamic_ui="--dynamic-ui" in sys.argv[1:])
+    if options["shared"] and options["static_responses"]:
+        sys.exit(SHARED_CONFLICT)
+    if "--profile" in sys.argv[1:]:
+        profile_run("generate_spark", OUTPUT_DIR, main, **options)
+    else:
+        main(**options)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Lazy-loading registry for generated eBay routers.
+
+Instead of splicing one static import + app.use() per generated router into
+ebay-routes.ts, lazy mode records every route in a compact JSON manifest
+(route name -> module file) and mounts a single dispatcher. The dispatcher
+require()s a router the first time its /api/<route> prefix is hit and caches it,
+so API cold start and memory scale with the routes actually used.
+"""
+
+import json
+import os
+
+from route_registry import load_routes_file, series_header
+from run_profile import PROFILE
+
+MANIFEST_FILE = "ebay-lazy-manifest.json"
+DISPATCHER_FILE = "ebay-lazy-routes.ts"
+LAZY_HEADER = "// Lazy-loaded generated routes (ebay-lazy-manifest.json)"
+LAZY_IMPORT = "import { registerLazyEbayRoutes } from './ebay-lazy-routes';"
+LAZY_REGISTRATION = "registerLazyEbayRoutes(app);"
+
+DISPATCHER_TEMPLATE = '''import type { Express, NextFunction, Request, Response, Router } from 'express';
+import manifest from './ebay-lazy-manifest.json';
+
+// Generated by codex/lazy_registry.py. Do not edit by hand.
+// A Map, not the manifest object: /api/constructor or /api/__proto__ must not
+// resolve to an inherited property.
+const ROUTES = new Map<string, string>(Object.entries(manifest as Record<string, string>));
+const loaded = new Map<string, Router>();
+
+function loadRouter(name: string): Router | undefined {
+  let router = loaded.get(name);
+  if (router) return router;
+  const file = ROUTES.get(name);
+  if (!file) return undefined;
+  // eslint-disable-next-line @typescript-eslint/no-var-requires
+  const mod = require(file);
+  router = (mod.default ?? mod) as Router;
+  loaded.set(name, router);
+  return router;
+}
+
+export function loadedEbayRouteCount(): number {
+  return loaded.size;
+}
+
+export function registerLazyEbayRoutes(app: Express): void {
+  app.use('/api', (req: Request, res: Response, next: NextFunction) => {
+    const end = req.path.indexOf('/', 1);
+    const name = end === -1 ? req.path.slice(1) : req.path.slice(1, end);
+    const router = loadRouter(name);
+    if (!router) return next();
+
+    const { url, baseUrl } = req;
+    const rest = url.slice(name.length + 1);
+    req.baseUrl = `${baseUrl}/${name}`;
+    req.url = rest.startsWith('/') ? rest : `/${rest}`;
+    router(req, res, (err?: unknown) => {
+      req.url = url;
+      req.baseUrl = baseUrl;
+      next(err);
+    });
+  });
+}
+'''
+
+
+def load_manifest(routes_dir: str, writer) -> dict:
+    text = writer.read_text(os.path.join(routes_dir, MANIFEST_FILE))
+    if text is None:
+        return {}
+    return json.loads(text)
+
+
+def render_manifest(routes: dict) -> str:
+    return "{\n" + ",\n".join(f"{json.dumps(k)}:{json.dumps(v)}" for k, v in routes.items()) + "\n}\n"
+
+
+@PROFILE.timed("routes splice")
+def emit_lazy_routes(routes_dir: str, routes_file: str, route_names, writer, phases=()) -> int:
+    """Record route_names in the manifest, refresh the dispatcher and hook it into routes_file.
+
+    Every (series, start, end) in phases gets a "// Phase X-Y (Name series)"
+    record above the hook, so the phase planner still sees the ranges. Returns
+    the number of routes newly added to the manifest.
+    """
+    routes = load_manifest(routes_dir, writer)
+    before = len(routes)
+    for name in route_names:
+        routes.setdefault(name, f"./{name}")
+
+    writer.write(os.path.join(routes_dir, MANIFEST_FILE), render_manifest(routes))
+    writer.write(os.path.join(routes_dir, DISPATCHER_FILE), DISPATCHER_TEMPLATE)
+
+    registry = load_routes_file(writer, routes_file)
+    registry.add_block(LAZY_HEADER, [LAZY_IMPORT], [LAZY_REGISTRATION])
+    registry.add_records(LAZY_REGISTRATION, [series_header(*phase) for phase in phases])
+    if registry.changed:
+        writer.write(routes_file, registry.render(), atomic=True)
+    return len(routes) - before
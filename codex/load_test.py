@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""In-process HTTP load test for the mounted ebay-* routes.
+
+Express matches app.use() mounts in registration order, so the cost of the
+routing table grows with every series that is added, and grows most for the
+routes mounted last. This module writes a load-test plan from the generated
+route list plus a driver that measures it, with no external service:
+
+  codex/output/load-plan.json   the generated routes and a weighted request mix
+                                over the standard endpoints
+  codex/output/load-test.ts     boots registerEbayRoutes() on an Express app on
+                                an ephemeral port, fires the mix at random routes
+                                with bounded concurrency over keep-alive sockets,
+                                and reports p50/p95/p99 latency per bucket of
+                                mount positions (plus the Express stack layers
+                                that served them)
+
+Mount positions come from the app itself, not from phase order: the driver
+wraps app.use() while registerEbayRoutes() runs and records the stack layer
+each /api/<route> mount gets, so per-series shards register in their real
+order. Routes behind one shared mount (the lazy manifest or the trie
+dispatcher) all sit at that mount's layer, and the driver says so instead of
+inventing an early/late split.
+
+  npx tsx codex/output/load-test.ts [--requests N] [--concurrency N] [--buckets N]
+                                    [--warmup N] [--seed N] [--plan path/to/plan.json]
+
+The mix in load-plan.json can be edited (or a copy passed with --plan); weights
+are relative. Only endpoints both router variants share are in the default mix.
+
+generate_series.py --load-test writes the plan after registering routes. Standalone:
+
+Usage: python3 load_test.py [<series>[,<series>...]]   (default: every generated route)
+"""
+
+import json
+import os
+import sys
+
+from output_backend import repo_path
+from output_writer import make_writer
+from route_db import OUTPUT_DIR, ROUTES_FILE, connect, db_path, generated_routes
+from run_profile import PROFILE
+from shared_router import VARIANTS, endpoints
+
+PLAN_FILE = "load-plan.json"
+DRIVER_FILE = "load-test.ts"
+
+# Relative weight per method in the default mix.
+METHOD_WEIGHTS = {"get": 8, "post": 1, "put": 1, "delete": 1}
+
+DRIVER_TEMPLATE = '''// Generated by codex/load_test.py. Do not edit by hand.
+// In-process load test over the mounted ebay-* routes; see codex/load_test.py.
+// Run: npx tsx codex/output/load-test.ts [--requests N] [--concurrency N] [--buckets N] [--warmup N] [--seed N] [--plan file]
+import fs from 'fs';
+import http from 'http';
+import type { AddressInfo } from 'net';
+import express from 'express';
+import { registerEbayRoutes } from '{routes_module}';
+import defaultPlan from './load-plan.json';
+
+type Method = 'GET' | 'POST' | 'PUT' | 'DELETE';
+interface Plan {
+  routes: string[];
+  mix: [method: Method, path: string, weight: number][];
+}
+
+function option(name: string): string | undefined {
+  const index = process.argv.indexOf(`--${name}`);
+  return index === -1 ? undefined : process.argv[index + 1];
+}
+
+const REQUESTS = Number(option('requests') ?? 20000);
+const CONCURRENCY = Number(option('concurrency') ?? 64);
+const BUCKETS = Number(option('buckets') ?? 10);
+const WARMUP = Number(option('warmup') ?? 2000);
+const plan: Plan = option('plan') ? JSON.parse(fs.readFileSync(option('plan')!, 'utf-8')) : (defaultPlan as Plan);
+
+// mulberry32: a seeded PRNG, so runs with the same --seed hit the same sequence.
+let seed = Number(option('seed') ?? 1) >>> 0;
+function random(): number {
+  seed = (seed + 0x6d2b79f5) >>> 0;
+  let t = seed;
+  t = Math.imul(t ^ (t >>> 15), t | 1);
+  t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+  return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+}
+
+const totalWeight = plan.mix.reduce((sum, [, , weight]) => sum + weight, 0);
+function pick(): [Method, string] {
+  let roll = random() * totalWeight;
+  for (const [method, path, weight] of plan.mix) {
+    roll -= weight;
+    if (roll < 0) return [method, path];
+  }
+  const [method, path] = plan.mix[plan.mix.length - 1];
+  return [method, path];
+}
+
+type Layer = { regexp: RegExp & { fast_slash?: boolean } };
+
+// Stack layer each /api/<route> mount gets while register() runs, in actual mount order.
+function mountLayers(app: express.Express, register: (app: express.Express) => void): Map<string, number> {
+  const stack: Layer[] = (app as any)._router.stack;
+  const layers = new Map<string, number>();
+  const use = app.use;
+  (app as any).use = (...args: any[]) => {
+    const layer = stack.length;
+    for (const path of typeof args[0] === 'function' ? [] : [args[0]].flat()) {
+      const name = typeof path === 'string' && path.startsWith('/api/') ? path.slice('/api/'.length) : '';
+      if (name && !layers.has(name)) layers.set(name, layer);
+    }
+    return use.apply(app, args);
+  };
+  try {
+    register(app);
+  } finally {
+    app.use = use;
+  }
+  return layers;
+}
+
+// First Express stack layer that handles a route (skipping global middleware); for shared mounts.
+function layerOf(stack: Layer[], name: string): number {
+  return stack.findIndex((layer) => !layer.regexp.fast_slash && layer.regexp.test(`/api/${name}/dashboard`));
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return NaN;
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+}
+
+async function main(): Promise<void> {
+  const app = express();
+  app.use(express.json());
+  const mounted = mountLayers(app, registerEbayRoutes);
+  const stack: Layer[] = (app as any)._router.stack;
+  const placed = plan.routes.map((name) => ({ name, layer: mounted.get(name) ?? layerOf(stack, name) }));
+  // Positions are ranks in mount order (stable, so routes sharing a layer keep plan order).
+  const routes = placed.filter((route) => route.layer !== -1).sort((a, b) => a.layer - b.layer);
+  const unmounted = placed.length - routes.length;
+  if (unmounted) console.warn(`${unmounted} planned routes are not mounted by registerEbayRoutes(); left out`);
+  if (routes.length === 0) throw new Error('no planned route is mounted');
+  const distinctLayers = new Set(routes.map((route) => route.layer)).size;
+
+  const server = app.listen(0);
+  await new Promise<void>((resolve) => server.once('listening', () => resolve()));
+  const { port } = server.address() as AddressInfo;
+  const agent = new http.Agent({ keepAlive: true, maxSockets: CONCURRENCY });
+
+  const bucketOf = (position: number) => Math.floor((position * BUCKETS) / routes.length);
+  const latencies: number[][] = Array.from({ length: BUCKETS }, () => []);
+  let failures = 0;
+
+  function fire(record: boolean): Promise<void> {
+    const position = Math.floor(random() * routes.length);
+    const [method, path] = pick();
+    return new Promise((resolve) => {
+      const started = process.hrtime.bigint();
+      const req = http.request(
+        { agent, port, method, path: `/api/${routes[position].name}${path}`, headers: { 'content-type': 'application/json' } },
+        (res) => {
+          res.resume();
+          res.on('end', () => {
+            if (record) {
+              latencies[bucketOf(position)].push(Number(process.hrtime.bigint() - started) / 1e6);
+              if (res.statusCode !== 200) failures++;
+            }
+            resolve();
+          });
+        },
+      );
+      req.on('error', () => {
+        if (record) failures++;
+        resolve();
+      });
+      req.end(method === 'GET' || method === 'DELETE' ? undefined : '{}');
+    });
+  }
+
+  async function run(count: number, record: boolean): Promise<void> {
+    let issued = 0;
+    const worker = async () => {
+      while (issued < count) {
+        issued++;
+        await fire(record);
+      }
+    };
+    await Promise.all(Array.from({ length: Math.min(CONCURRENCY, count) }, worker));
+  }
+
+  await run(WARMUP, false);
+  const started = process.hrtime.bigint();
+  await run(REQUESTS, true);
+  const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+
+  const rows: Record<string, Record<string, string | number>> = {};
+  for (let bucket = 0; bucket < BUCKETS; bucket++) {
+    const first = Math.ceil((bucket * routes.length) / BUCKETS);
+    const last = Math.ceil(((bucket + 1) * routes.length) / BUCKETS) - 1;
+    if (last < first) continue;
+    const sorted = latencies[bucket].sort((a, b) => a - b);
+    rows[`${first}-${last}`] = {
+      layers: `${routes[first].layer}-${routes[last].layer}`,
+      requests: sorted.length,
+      p50_ms: percentile(sorted, 50).toFixed(3),
+      p95_ms: percentile(sorted, 95).toFixed(3),
+      p99_ms: percentile(sorted, 99).toFixed(3),
+    };
+  }
+  console.log(`${routes.length} routes on ${distinctLayers} of ${stack.length} stack layers, ` +
+    `${REQUESTS} requests at concurrency ${CONCURRENCY} in ${seconds.toFixed(2)}s ` +
+    `(${Math.round(REQUESTS / seconds)} req/s, ${failures} failed)`);
+  if (distinctLayers < Math.min(BUCKETS, routes.length)) {
+    console.log(`Only ${distinctLayers} distinct mount layer(s) (shared router, lazy manifest or trie dispatcher): ` +
+      'buckets compare routes behind the same mounts, not early vs late layers.');
+  }
+  console.table(rows);
+
+  agent.destroy();
+  await new Promise<void>((resolve) => server.close(() => resolve()));
+  if (failures) process.exitCode = 1;
+}
+
+main();
+'''
+
+
+def request_mix():
+    """[(METHOD, path, weight)] over the endpoints every variant serves; ':id' becomes '1'."""
+    shared = set(endpoints(VARIANTS[0])).intersection(*(endpoints(variant) for variant in VARIANTS[1:]))
+    return [
+        (method.upper(), path.replace(":id", "1"), METHOD_WEIGHTS[method])
+        for method, path, section, action in endpoints(VARIANTS[0])
+        if (method, path, section, action) in shared
+    ]
+
+
+def render_plan(route_names) -> str:
+    plan = {"routes": list(route_names), "mix": request_mix()}
+    return json.dumps(plan, indent=2) + "\n"
+
+
+def render_driver(routes_module: str) -> str:
+    return DRIVER_TEMPLATE.replace("{routes_module}", routes_module)
+
+
+@PROFILE.timed("load plan")
+def emit_load_test(output_dir: str, route_names, writer, routes_file: str = ROUTES_FILE) -> int:
+    """Write load-plan.json and load-test.ts to output_dir; returns the number of planned routes."""
+    route_names = list(route_names)
+    routes_module = os.path.relpath(routes_file, output_dir)[: -len(".ts")]
+    writer.write(os.path.join(output_dir, PLAN_FILE), render_plan(route_names))
+    writer.write(os.path.join(output_dir, DRIVER_FILE), render_driver(routes_module))
+    return len(route_names)
+
+
+def registry_routes(output_dir: str, series=None):
+    """Generated route names in phase order, from output_dir's route registry."""
+    path = db_path(output_dir)
+    if not os.path.exists(path):
+        return []
+    conn = connect(path)
+    try:
+        return [row["route_name"] for row in generated_routes(conn, series)]
+    finally:
+        conn.close()
+
+
+def main(argv):
+    series = [s for s in argv[0].split(",") if s] if argv else None
+    names = registry_routes(OUTPUT_DIR, series)
+    if not names:
+        print(f"No generated routes{' for ' + ', '.join(series) if series else ''} in {db_path(OUTPUT_DIR)}; "
+              "run a generator first")
+        return 1
+    writer = make_writer(OUTPUT_DIR)
+    emit_load_test(OUTPUT_DIR, names, writer)
+    writer.close()
+    print(f"Load plan: {len(names)} routes in {os.path.join(OUTPUT_DIR, PLAN_FILE)}")
+    print(f"Run: npx tsx {os.path.relpath(os.path.join(OUTPUT_DIR, DRIVER_FILE), repo_path())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Output roots and pluggable storage backends for the codex generators.
+
+Paths: every generator derives ROUTES_DIR / UI_DIR / OUTPUT_DIR / ROUTES_FILE
+from repo_path(), which resolves against $RAKUDA_ROOT (default: the original
+checkout location).
+
+Backends, selected with $CODEX_BACKEND (or a script's --backend option):
+
+  fs              write into the tree (default)
+  memory          keep everything in RAM; existing files are read through from
+                  disk, so a run doubles as a diff against the current tree
+  tar:<file>      collect output in RAM and write one .tar / .tar.gz archive
+  zip:<file>      same, as a .zip archive
+
+Archive member names are relative to the repo root.
+
+The fs backend never leaves a half-written file behind: every file is written
+to <path>.tmp and renamed into place. Durability is batched instead of paid
+per file: renamed files are queued and every `sync_every` files (and on
+close) a checkpoint fsyncs the queued files concurrently, then each touched
+directory once. sync_every comes from $CODEX_SYNC_EVERY (default 1000);
+0 syncs only on close, a negative value never fsyncs (renames only).
+"""
+
+import io
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from run_profile import PROFILE
+
+DEFAULT_ROOT = "/Users/naokijodan/Desktop/rakuda"
+DEFAULT_SYNC_EVERY = 1000
+SYNC_THREADS = 16
+
+
+def repo_root() -> str:
+    return os.environ.get("RAKUDA_ROOT", DEFAULT_ROOT)
+
+
+def repo_path(*parts: str) -> str:
+    return os.path.join(repo_root(), *parts)
+
+
+def _fsync(path: str):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FileSystemBackend:
+    name = "fs"
+    persistent = True
+
+    def __init__(self, sync_every: int = DEFAULT_SYNC_EVERY):
+        self.sync_every = sync_every
+        self.checkpoints = 0
+        self.synced_files = 0
+        self.synced_dirs = 0
+        self.sync_s = 0.0
+        self._dirs = set()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def _ensure_parent(self, path: str):
+        parent = os.path.dirname(path)
+        if parent in self._dirs:
+            return
+        with PROFILE.stage("mkdir"):
+            os.makedirs(parent, exist_ok=True)
+        PROFILE.count("mkdir calls")
+        with self._lock:
+            self._dirs.add(parent)
+
+    def signature(self, path: str):
+        PROFILE.count("stat calls")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def read(self, path: str):
+        try:
+            with open(path, "rb") as f:
+                PROFILE.count("files opened")
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, path: str, data: bytes):
+        self._ensure_parent(path)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        PROFILE.count("files opened")
+        PROFILE.count("renames")
+        self._renamed(path)
+
+    def open_temp(self, path: str, buffering: int):
+        self._ensure_parent(path)
+        PROFILE.count("files opened")
+        return open(path + ".tmp", "wb", buffering=buffering)
+
+    def commit_temp(self, f, path: str):
+        f.close()
+        os.replace(path + ".tmp", path)
+        PROFILE.count("renames")
+        self._renamed(path)
+
+    def discard_temp(self, f, path: str):
+        f.close()
+        os.remove(path + ".tmp")
+
+    def _renamed(self, path: str):
+        if self.sync_every < 0:
+            return
+        with self._lock:
+            self._pending.append(path)
+            due = self.sync_every and len(self._pending) >= self.sync_every
+        if due:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Make every file renamed into place so far durable: fsync the files, then their directories."""
+        with self._sync_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+            started = time.perf_counter()
+            files = sorted(set(pending))
+            dirs = sorted({os.path.dirname(path) for path in files})
+            with PROFILE.stage("fsync"):
+                # Concurrent fsyncs let the filesystem fold them into a few journal commits.
+                with ThreadPoolExecutor(max_workers=min(SYNC_THREADS, len(files))) as pool:
+                    list(pool.map(_fsync, files))
+                if os.name == "posix":  # directory fds cannot be fsynced elsewhere
+                    for directory in dirs:
+                        _fsync(directory)
+            PROFILE.count("fsyncs", len(files) + (len(dirs) if os.name == "posix" else 0))
+            self.checkpoints += 1
+            self.synced_files += len(files)
+            self.synced_dirs += len(dirs)
+            self.sync_s += time.perf_counter() - started
+
+    def sync_summary(self) -> str:
+        return (f"{self.checkpoints} checkpoints, {self.synced_files} files / {self.synced_dirs} dirs "
+                f"fsynced in {self.sync_s:.2f}s")
+
+    def close(self):
+        self.checkpoint()
+
+
+class MemoryBackend:
+    """In-memory VFS. Unwritten paths are read through from disk (unless read_through=False)."""
+
+    name = "memory"
+    persistent = False
+
+    def __init__(self, read_through: bool = True):
+        self.files = {}
+        self.read_through = read_through
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def signature(self, path: str):
+        if path in self.files:
+            return len(self.files[path]), self._versions[path]
+        if self.read_through:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return None
+            return st.st_size, st.st_mtime_ns
+        return None
+
+    def read(self, path: str):
+        if path in self.files:
+            return self.files[path]
+        if self.read_through:
+            try:
+                with open(path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                return None
+        return None
+
+    def write(self, path: str, data: bytes):
+        with self._lock:
+            self.files[path] = data
+            self._versions[path] = time.perf_counter_ns()
+
+    def open_temp(self, path: str, buffering: int):
+        return io.BytesIO()
+
+    def commit_temp(self, f, path: str):
+        self.write(path, f.getvalue())
+
+    def discard_temp(self, f, path: str):
+        pass
+
+    def checkpoint(self):
+        pass
+
+    def diff(self):
+        """[(path, 'added' | 'modified')] for files that differ from disk."""
+        changes = []
+        for path, data in sorted(self.files.items()):
+            try:
+                with open(path, "rb") as f:
+                    if f.read() != data:
+                        changes.append((path, "modified"))
+            except FileNotFoundError:
+                changes.append((path, "added"))
+        return changes
+
+    def close(self):
+        changes = self.diff()
+        added = sum(1 for _, status in changes if status == "added")
+        print(f"[memory] {len(self.files)} files rendered, {len(changes)} differ from disk "
+              f"({added} added, {len(changes) - added} modified)")
+
+
+class ArchiveBackend(MemoryBackend):
+    """Collect output in memory and write it as a single tar or zip archive on close()."""
+
+    persistent = False
+
+    def __init__(self, archive_path: str, fmt: str):
+        super().__init__(read_through=True)
+        self.archive_path = archive_path
+        self.fmt = fmt
+        self.name = f"{fmt}:{archive_path}"
+
+    def signature(self, path: str):
+        # Files on disk never count as "already written": the archive must be complete.
+        if path in self.files:
+            return len(self.files[path]), self._versions[path]
+        return None
+
+    def _member(self, path: str) -> str:
+        return os.path.relpath(path, repo_root())
+
+    def close(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.archive_path)), exist_ok=True)
+        if self.fmt == "zip":
+            with zipfile.ZipFile(self.archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for path, data in sorted(self.files.items()):
+                    zf.writestr(self._member(path), data)
+        else:
+            mode = "w:gz" if self.archive_path.endswith((".gz", ".tgz")) else "w"
+            now = time.time()
+            with tarfile.open(self.archive_path, mode) as tf:
+                for path, data in sorted(self.files.items()):
+                    info = tarfile.TarInfo(self._member(path))
+                    info.size = len(data)
+                    info.mtime = now
+                    tf.addfile(info, io.BytesIO(data))
+        print(f"[{self.fmt}] Wrote {len(self.files)} files to {self.archive_path}")
+
+
+def sync_every_from_env() -> int:
+    return int(os.environ.get("CODEX_SYNC_EVERY", DEFAULT_SYNC_EVERY))
+
+
+def backend_from_spec(spec: str = None, sync_every: int = None):
+    """Build a backend from 'fs', 'memory', 'tar:<file>' or 'zip:<file>' (default: $CODEX_BACKEND).
+
+    sync_every (fs only) defaults to $CODEX_SYNC_EVERY.
+    """
+    spec = spec or os.environ.get("CODEX_BACKEND", "fs")
+    kind, _, target = spec.partition(":")
+    if kind == "fs":
+        return FileSystemBackend(sync_every_from_env() if sync_every is None else sync_every)
+    if kind == "memory":
+        return MemoryBackend()
+    if kind in ("tar", "zip"):
+        if not target:
+            raise ValueError(f"backend '{kind}' needs a target file, e.g. {kind}:out.{kind}")
+        return ArchiveBackend(target, kind)
+    raise ValueError(f"unknown output backend: {spec}")
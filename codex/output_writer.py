@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Content-hash aware file writer shared by the codex generators.
+
+Most generated files (API_TEMPLATE, ROUTE_CONTENT, ...) are byte-identical
+between runs. Rewriting them anyway bumps mtimes and makes tsc / Next.js /
+tsx-watch reprocess everything, so writes go through OutputWriter, which
+skips files whose content hash has not changed.
+
+Known hashes are kept in a sidecar manifest next to the generator output.
+A manifest entry is only trusted while the file's size and mtime still
+match; otherwise the existing file is hashed directly.
+
+The actual storage is an output_backend backend (real tree, in-memory VFS or
+archive). The manifest is only kept for backends that persist to the tree.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from output_backend import FileSystemBackend, backend_from_spec
+from run_profile import PROFILE
+
+MANIFEST_NAME = ".write-manifest.json"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class OutputWriter:
+    def __init__(self, manifest_path=None, backend=None):
+        self.backend = backend or FileSystemBackend()
+        self.manifest_path = manifest_path if self.backend.persistent else None
+        self.entries = {}
+        self.updates = {}
+        self.written = 0
+        self.skipped = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+        if self.manifest_path and os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                self.entries = json.load(f)
+
+    def _unchanged(self, key: str, path: str, digest: str) -> bool:
+        sig = self.backend.signature(path)
+        if sig is None:
+            return False
+        entry = self.entries.get(key)
+        if entry and (entry["size"], entry["mtime_ns"]) == sig:
+            return entry["sha256"] == digest
+        same = content_hash(self.backend.read(path)) == digest
+        if same:
+            self._record(key, digest, sig)
+        return same
+
+    def _record(self, key: str, digest: str, sig):
+        entry = {"sha256": digest, "size": sig[0], "mtime_ns": sig[1]}
+        with self._lock:
+            self.entries[key] = entry
+            self.updates[key] = entry
+
+    def read_text(self, path: str):
+        """Current content of path as seen by the backend, or None if it does not exist."""
+        data = self.backend.read(path)
+        return None if data is None else data.decode("utf-8")
+
+    @PROFILE.timed("write")
+    def write(self, path: str, content: str, atomic: bool = False) -> bool:
+        """Write content to path unless it is already there. Returns True if written.
+
+        atomic=True goes through a temp file and a rename on every backend and
+        then checkpoints, so path and everything written before it are durable
+        right away (used for ebay-routes.ts and friends, which must never
+        reference a router that a crash could still lose).
+        """
+        data = content.encode("utf-8")
+        digest = content_hash(data)
+        key = os.path.abspath(path)
+        if self._unchanged(key, path, digest):
+            with self._lock:
+                self.skipped += 1
+            return False
+        if atomic:
+            f = self.backend.open_temp(path, -1)
+            f.write(data)
+            self.backend.commit_temp(f, path)
+            self.backend.checkpoint()
+        else:
+            self.backend.write(path, data)
+        self._record(key, digest, self.backend.signature(path))
+        with self._lock:
+            self.written += 1
+            self.bytes_written += len(data)
+        PROFILE.count("bytes written", len(data))
+        return True
+
+    def open_temp(self, path: str, buffering: int):
+        return self.backend.open_temp(path, buffering)
+
+    @PROFILE.timed("write")
+    def commit(self, f, path: str, digest: str, size: int) -> bool:
+        """Move a finished temp file (from open_temp) into place unless path has the same content."""
+        key = os.path.abspath(path)
+        if self._unchanged(key, path, digest):
+            self.backend.discard_temp(f, path)
+            with self._lock:
+                self.skipped += 1
+            return False
+        self.backend.commit_temp(f, path)
+        self._record(key, digest, self.backend.signature(path))
+        with self._lock:
+            self.written += 1
+            self.bytes_written += size
+        PROFILE.count("bytes written", size)
+        return True
+
+    def discard(self, f, path: str):
+        self.backend.discard_temp(f, path)
+
+    def checkpoint(self):
+        """Make everything written so far durable (see output_backend)."""
+        self.backend.checkpoint()
+
+    def merge(self, updates: dict, written: int, skipped: int, bytes_written: int = 0):
+        """Fold in results from a writer that ran in another process."""
+        with self._lock:
+            self.entries.update(updates)
+            self.updates.update(updates)
+            self.written += written
+            self.skipped += skipped
+            self.bytes_written += bytes_written
+
+    def stats(self):
+        return self.updates, self.written, self.skipped, self.bytes_written
+
+    @PROFILE.timed("manifest write")
+    def save(self):
+        if not self.manifest_path or not self.updates:
+            return
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def close(self):
+        """Persist the manifest and flush the backend (archive backends write their file here)."""
+        self.save()
+        self.backend.close()
+
+    def summary(self) -> str:
+        return f"{self.written} written, {self.skipped} unchanged"
+
+
+def manifest_for(output_dir: str) -> str:
+    return os.path.join(output_dir, MANIFEST_NAME)
+
+
+def make_writer(output_dir: str, backend_spec: str = None, sync_every: int = None) -> OutputWriter:
+    """Writer for a generator run: manifest in output_dir, backend from spec or $CODEX_BACKEND.
+
+    sync_every is the fs backend's checkpoint interval (default: $CODEX_SYNC_EVERY).
+    """
+    return OutputWriter(manifest_for(output_dir), backend_from_spec(backend_spec, sync_every))
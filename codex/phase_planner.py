@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Phase allocation index and dry-run planner for the codex generators.
+
+Phase numbers used to be passed by hand, with nothing checking them against
+phases that are already registered. This module scans ebay-routes.ts, the
+codex/output/*-registrations.txt files and the phase ranges generators
+recorded in codex/output/route-registry.sqlite once, building
+
+  * an interval index of used phases (bisect over merged, sorted ranges), and
+  * a route-name index (route name -> owning series),
+
+and uses them to allocate the next free phase range and to report collisions
+before anything is written.
+
+Usage: python3 phase_planner.py <series|a,b,c|all> [--start N]
+"""
+
+import argparse
+import bisect
+import glob
+import os
+import re
+import sys
+
+from run_profile import PROFILE
+
+PHASE_RE = re.compile(r"//\s*Phase (\d+)-(\d+)(?: \((.+?)\))?")
+MOUNT_RE = re.compile(r"app\.use\(\s*'/api/([^']+)'")
+
+
+def owner_of(label: str) -> str:
+    """'Prism series' -> 'prism', 'Group 3 - Titan' -> 'titan'."""
+    label = label.split(" - ")[-1]
+    if label.endswith(" series"):
+        label = label[: -len(" series")]
+    return label.strip().lower()
+
+
+class PhaseIndex:
+    """Sorted, merged phase intervals with the owners that registered them."""
+
+    def __init__(self):
+        self._owned = []   # (start, end, owner), sorted by start
+        self._by_owner = {}
+        self._starts = []  # merged interval starts
+        self._ends = []    # merged interval ends
+        self._gaps = None  # max-segment tree over the gaps between merged intervals, rebuilt after add()
+
+    def add(self, start: int, end: int, owner: str = None):
+        owner = owner or "?"
+        bisect.insort(self._owned, (start, end, owner))
+        self._by_owner.setdefault(owner, []).append((start, end))
+        i = bisect.bisect_left(self._ends, start - 1)
+        j = bisect.bisect_right(self._starts, end + 1)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+        self._gaps = None
+
+    def is_free(self, start: int, end: int) -> bool:
+        i = bisect.bisect_left(self._ends, start)
+        return i == len(self._starts) or self._starts[i] > end
+
+    def owners(self, start: int, end: int):
+        """Owners of registered ranges overlapping [start, end].
+
+        Such a range lies inside a merged interval that overlaps [start, end], so
+        only the owned ranges starting between the first of those intervals and
+        end are looked at.
+        """
+        i = bisect.bisect_left(self._ends, start)
+        if i == len(self._starts) or self._starts[i] > end:
+            return set()
+        lo = bisect.bisect_left(self._owned, (self._starts[i],))
+        hi = bisect.bisect_right(self._owned, (end, float("inf"), ""))
+        return {owner for s, e, owner in self._owned[lo:hi] if e >= start}
+
+    def _gap_tree(self):
+        if self._gaps is None:
+            gaps = [s - e - 1 for e, s in zip(self._ends, self._starts[1:])]
+            leaves = 1
+            while leaves < len(gaps):
+                leaves *= 2
+            tree = [0] * (2 * leaves)
+            tree[leaves:leaves + len(gaps)] = gaps
+            for node in range(leaves - 1, 0, -1):
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            self._gaps = (leaves, tree)
+        return self._gaps
+
+    def _first_gap(self, first: int, size: int):
+        """Smallest k >= first whose gap (after merged interval k) holds size phases, or None."""
+        leaves, tree = self._gap_tree()
+
+        def descend(node, lo, hi):
+            if hi <= first or tree[node] < size:
+                return None
+            if hi - lo == 1:
+                return lo
+            mid = (lo + hi) // 2
+            left = descend(2 * node, lo, mid)
+            return left if left is not None else descend(2 * node + 1, mid, hi)
+
+        return descend(1, 0, leaves)
+
+    def allocate(self, size: int, floor: int = 1) -> int:
+        """First start >= floor where size consecutive phases are free."""
+        i = bisect.bisect_left(self._ends, floor)
+        if i == len(self._starts) or self._starts[i] > floor + size - 1:
+            return floor
+        k = self._first_gap(i, size)
+        return self._ends[k if k is not None else -1] + 1
+
+    def ranges_of(self, owner: str):
+        return list(self._by_owner.get(owner, ()))
+
+    @property
+    def highest(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def __len__(self):
+        return len(self._owned)
+
+
+@PROFILE.timed("plan")
+def scan(routes_file: str, output_dir: str):
+    """Build (PhaseIndex, {route_name: owner}) from the routes file, the side files and the route registry.
+
+    The registry also holds the ranges of series that older lazy, shared or
+    dispatch runs registered through a single hook without any phase record.
+    """
+    index = PhaseIndex()
+    routes = {}
+    seen = set()
+
+    def record(lines, default_owner=None):
+        owner = default_owner
+        for line in lines:
+            m = PHASE_RE.search(line)
+            if m:
+                start, end = int(m.group(1)), int(m.group(2))
+                owner = owner_of(m.group(3)) if m.group(3) else default_owner
+                if (start, end, owner) not in seen:
+                    seen.add((start, end, owner))
+                    index.add(start, end, owner)
+                continue
+            m = MOUNT_RE.search(line)
+            if m:
+                routes.setdefault(m.group(1), owner or "?")
+
+    if os.path.exists(routes_file):
+        with open(routes_file, "r") as f:
+            record(f.read().splitlines())
+    for path in sorted(glob.glob(os.path.join(output_dir, "*-registrations.txt"))):
+        with open(path, "r") as f:
+            record(f.read().splitlines(), os.path.basename(path)[: -len("-registrations.txt")])
+
+    import route_db  # route_db imports this module
+
+    registry = os.path.join(output_dir, route_db.DB_NAME)
+    if os.path.exists(registry):
+        conn = route_db.connect(registry)
+        try:
+            ranges = route_db.series_ranges(conn)
+            for row in route_db.generated_routes(conn):
+                routes.setdefault(row["route_name"], row["series"])
+        finally:
+            conn.close()
+        for owner, start, end in ranges:
+            if (start, end, owner) not in seen:
+                seen.add((start, end, owner))
+                index.add(start, end, owner)
+    return index, routes
+
+
+@PROFILE.timed("plan")
+def plan_series(index: PhaseIndex, routes: dict, series, route_names, start: int = None):
+    """Plan phase ranges for series without touching disk.
+
+    With an explicit start the series get consecutive ranges from there. Otherwise
+    an already-registered series keeps its range and new ones get the next free
+    range above everything registered. route_names(series_name) must return that
+    series' route names in phase order. Returns [(series, start, end, names, collisions)].
+    """
+    plan = []
+    floor = start if start is not None else index.highest + 1
+    for series_name in series:
+        names = route_names(series_name)
+        size = len(names)
+        existing = index.ranges_of(series_name)
+        if start is None and len(existing) == 1 and existing[0][1] - existing[0][0] + 1 == size:
+            begin = existing[0][0]
+        else:
+            begin = floor if start is not None else index.allocate(size, floor)
+            floor = begin + size
+        end = begin + size - 1
+        collisions = [
+            f"{series_name} already registered at phases {s}-{e}"
+            for s, e in existing if (s, e) != (begin, end)
+        ]
+        for owner in sorted(index.owners(begin, end) - {series_name}):
+            collisions.append(f"phases {begin}-{end} overlap {owner}")
+        for name in names:
+            owner = routes.get(name)
+            if owner is not None and owner != series_name:
+                collisions.append(f"route {name} already registered by {owner}")
+        index.add(begin, end, series_name)
+        plan.append((series_name, begin, end, names, collisions))
+    return plan
+
+
+def print_plan(plan, routes_dir: str, ui_dir: str):
+    total = 0
+    for series_name, start, end, names, collisions in plan:
+        total += len(names)
+        print(f"[{series_name}] Phase {start}-{end}: {len(names)} routes")
+        print(f"    {os.path.join(routes_dir, names[0] + '.ts')} ... {names[-1]}.ts")
+        print(f"    {os.path.join(ui_dir, names[0][len('ebay-'):], 'page.tsx')} ...")
+        for collision in collisions:
+            print(f"    COLLISION: {collision}")
+    conflicts = sum(len(p[4]) for p in plan)
+    print(f"Plan: {len(plan)} series, {total} routes, {total * 2} files, {conflicts} collisions")
+    return conflicts
+
+
+def main(argv=None):
+    import generate_series as gs
+
+    parser = argparse.ArgumentParser(description="Plan phase ranges for generate_series.py without writing anything.")
+    parser.add_argument("series", help="series name, comma-separated list of series, or 'all'")
+    parser.add_argument("--start", type=int, default=None, help="first phase (default: next free phase)")
+    args = parser.parse_args(argv)
+
+    names = list(gs.SERIES_ADJECTIVES) if args.series == "all" else [s for s in args.series.split(",") if s]
+    unknown = [s for s in names if s not in gs.SERIES_ADJECTIVES]
+    if unknown:
+        print(f"Unknown series: {', '.join(unknown)}")
+        return 1
+
+    index, routes = scan(gs.ROUTES_FILE, gs.OUTPUT_DIR)
+    print(f"Index: {len(index)} registered phase ranges, {len(routes)} routes")
+    plan = plan_series(index, routes, names, gs.series_route_names, args.start)
+    return 1 if print_plan(plan, gs.ROUTES_DIR, gs.UI_DIR) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
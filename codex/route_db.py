@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""SQLite registry of every generated route.
+
+The *-imports.txt / *-registrations.txt side files only say what to mount; the
+phase, series, category and color of a route used to exist only while a
+generator was running. Every generator now also upserts one row per route
+into codex/output/route-registry.sqlite:
+
+  route_name (primary key), phase, series, category, color,
+  template_hash (sha256 of the router source), api_file, ui_file
+  (repo-relative, NULL when the mode writes no such file), generator, updated_at
+
+with indexes on phase, series and category, so "which series owns phase
+25291" or "all inventory routes" are index lookups instead of greps. The side
+files stay: the routes splice still reads them.
+
+Routes that no generator recorded (hand-written routers, mounts spliced in
+before the registry existed) are folded in by a scanner over ebay-routes.ts,
+the ebay-routes-<series>.ts shards and the apps/api/src/routes listing. Each
+source's (mtime, size) is kept in the sources table and only sources that
+changed since the last query are rescanned, so a query normally costs a few
+stat() calls plus a B-tree lookup; route_name prefix searches are range scans
+over the primary key. Scanned rows have generator "scan" and never overwrite
+what a generator recorded.
+
+Generators stream rows through a RouteRecorder while they write files: one
+executemany() and commit per ROW_BATCH rows, each recorder on its own
+connection, so memory stays flat and thread- and process-pool workers can
+record concurrently. Non-persistent backends (memory / tar / zip) record
+nothing.
+
+Usage:
+  python3 route_db.py phase <n>          owner of a phase
+  python3 route_db.py series <name>      routes of a series, in phase order
+  python3 route_db.py category <name>    routes of a category
+  python3 route_db.py route <name>       one route
+  python3 route_db.py exists <name>      exit status 0 if the route is known
+  python3 route_db.py prefix <prefix>    routes whose name starts with prefix
+  python3 route_db.py free [<size>]      unused phase ranges of at least size phases
+  python3 route_db.py stats              counts per series
+  python3 route_db.py build [--full]     rescan changed sources (--full: all sources)
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+from lazy_registry import DISPATCHER_FILE as LAZY_DISPATCHER_FILE
+from output_backend import repo_path, repo_root
+from output_writer import content_hash
+from phase_planner import MOUNT_RE, PHASE_RE, owner_of
+from route_dispatch import DISPATCHER_FILE, TRIE_FILE
+from run_profile import PROFILE
+from shared_router import FACTORY_FILE, REGISTRY_FILE
+
+DB_NAME = "route-registry.sqlite"
+ROW_BATCH = 500
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_DIR = repo_path("apps/api/src/routes")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+SHARD_PREFIX = "ebay-routes-"
+# Generated support modules in ROUTES_DIR that are not routers themselves.
+SUPPORT_FILES = {LAZY_DISPATCHER_FILE, FACTORY_FILE, REGISTRY_FILE, DISPATCHER_FILE, TRIE_FILE}
+
+COLUMNS = ("route_name", "phase", "series", "category", "color", "template_hash", "api_file", "ui_file",
+           "generator", "updated_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS routes (
+    route_name    TEXT PRIMARY KEY,
+    phase         INTEGER,
+    series        TEXT NOT NULL,
+    category      TEXT,
+    color         TEXT,
+    template_hash TEXT,
+    api_file      TEXT,
+    ui_file       TEXT,
+    generator     TEXT NOT NULL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS routes_phase ON routes (phase);
+CREATE INDEX IF NOT EXISTS routes_series ON routes (series, phase);
+CREATE INDEX IF NOT EXISTS routes_category ON routes (category);
+CREATE TABLE IF NOT EXISTS sources (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scanned (
+    source     TEXT NOT NULL,
+    route_name TEXT NOT NULL,
+    phase      INTEGER,
+    owner      TEXT,
+    file       TEXT,
+    PRIMARY KEY (source, route_name)
+);
+CREATE INDEX IF NOT EXISTS scanned_route ON scanned (route_name);
+"""
+
+UPSERT = (
+    f"INSERT INTO routes ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+    "ON CONFLICT (route_name) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:])
+)
+
+# A scanned route merges what every source says about it. Scan-owned rows are
+# replaced outright; generator rows only get the fields they left unknown.
+# Hand-written route names carry no category, so scan-owned rows have none.
+SCAN_UPSERT = (
+    "INSERT INTO routes (route_name, phase, series, category, api_file, generator, updated_at) "
+    "SELECT route_name, MAX(phase), COALESCE(MAX(NULLIF(owner, '?')), '?'), NULL, MAX(file), 'scan', ? "
+    "FROM scanned WHERE route_name = ? GROUP BY route_name "
+    "ON CONFLICT (route_name) DO UPDATE SET "
+    "category = CASE WHEN routes.generator = 'scan' THEN NULL ELSE routes.category END, "
+    "phase = CASE WHEN routes.generator = 'scan' THEN excluded.phase ELSE COALESCE(routes.phase, excluded.phase) END, "
+    "series = CASE WHEN routes.generator = 'scan' OR routes.series = '?' THEN excluded.series ELSE routes.series END, "
+    "api_file = CASE WHEN routes.generator = 'scan' THEN excluded.api_file "
+    "ELSE COALESCE(routes.api_file, excluded.api_file) END, "
+    "updated_at = excluded.updated_at"
+)
+
+
+def db_path(output_dir: str) -> str:
+    return os.path.join(output_dir, DB_NAME)
+
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def template_hash(template: str) -> str:
+    return content_hash(template.encode("utf-8"))
+
+
+def category_of(route_name: str):
+    """'ebay-<category>-...' -> category (None for names without one).
+
+    Only meaningful for generator-built names; scanned rows store no category.
+    """
+    parts = route_name.split("-")
+    return parts[1] if len(parts) > 2 else None
+
+
+def repo_relative(path: str):
+    return None if path is None else os.path.relpath(path, repo_root())
+
+
+def route_row(route_name: str, phase: int, series: str, generator: str, category: str = None, color: str = None,
+              template: str = None, api_file: str = None, ui_file: str = None) -> tuple:
+    return (route_name, phase, series, category or category_of(route_name), color,
+            None if template is None else template_hash(template),
+            repo_relative(api_file), repo_relative(ui_file), generator, time.time())
+
+
+class RouteRecorder:
+    """Upserts route_row() tuples into output_dir's registry in batches of batch_size.
+
+    The connection opens with the first batch; every batch is its own
+    transaction, so the write lock is held only for one executemany().
+    """
+
+    def __init__(self, output_dir: str, writer=None, batch_size: int = ROW_BATCH):
+        self.output_dir = output_dir
+        self.enabled = writer is None or writer.backend.persistent
+        self.batch_size = batch_size
+        self.rows = 0
+        self._batch = []
+        self._conn = None
+
+    def add(self, row):
+        if not self.enabled:
+            return
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    @PROFILE.timed("route registry")
+    def flush(self):
+        if not self._batch:
+            return
+        if self._conn is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._conn = connect(db_path(self.output_dir))
+        with self._conn:
+            self._conn.executemany(UPSERT, self._batch)
+        PROFILE.count("registry rows", len(self._batch))
+        self.rows += len(self._batch)
+        self._batch = []
+
+    def close(self) -> int:
+        try:
+            self.flush()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._batch = []
+        self.close()
+
+
+def record_routes(output_dir: str, rows, writer=None) -> int:
+    """Upsert route_row() tuples into output_dir's registry. Returns the number of rows."""
+    with RouteRecorder(output_dir, writer) as recorder:
+        for row in rows:
+            recorder.add(row)
+    return recorder.rows
+
+
+def scan_mounts(path: str):
+    """(route_name, phase, owner, None) for every app.use('/api/...') mount in a routes module.
+
+    Mounts under a "// Phase <start>-<end> (<Series> series)" header get consecutive
+    phases from start, the same order the generators register them in. A block
+    ends at the next blank line.
+    """
+    entries = []
+    phase = end = None
+    owner = "?"
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                phase = end = None
+                owner = "?"
+                continue
+            m = PHASE_RE.search(line)
+            if m:
+                phase, end = int(m.group(1)), int(m.group(2))
+                owner = owner_of(m.group(3)) if m.group(3) else "?"
+                continue
+            m = MOUNT_RE.search(line)
+            if m:
+                entries.append((m.group(1), phase if phase is not None and phase <= end else None, owner, None))
+                if phase is not None:
+                    phase += 1
+    return entries
+
+
+def scan_route_files(names, routes_dir: str):
+    """(route_name, None, '?', file) for every router module in a routes dir listing."""
+    return [
+        (name[:-3], None, "?", os.path.join(routes_dir, name))
+        for name in names
+        if name.endswith(".ts") and not name.startswith("ebay-routes") and name not in SUPPORT_FILES
+    ]
+
+
+def _stat_key(path: str):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _rescan(conn, source: str, key, entries) -> None:
+    old = {row[0] for row in conn.execute("SELECT route_name FROM scanned WHERE source = ?", (source,))}
+    conn.execute("DELETE FROM scanned WHERE source = ?", (source,))
+    conn.executemany("INSERT OR IGNORE INTO scanned VALUES (?, ?, ?, ?, ?)",
+                     [(source, name, phase, owner, repo_relative(file)) for name, phase, owner, file in entries])
+    now = time.time()
+    for name in old | {entry[0] for entry in entries}:
+        if conn.execute(SCAN_UPSERT, (now, name)).rowcount == 0:
+            conn.execute("DELETE FROM routes WHERE route_name = ? AND generator = 'scan'", (name,))
+    if key is None:
+        conn.execute("DELETE FROM sources WHERE path = ?", (source,))
+    else:
+        conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (source, *key))
+
+
+@PROFILE.timed("route registry")
+def refresh(conn, routes_dir: str = ROUTES_DIR, routes_file: str = ROUTES_FILE, full: bool = False) -> int:
+    """Rescan the routes file, shards and routes dir listing where they changed. Returns sources rescanned."""
+    known = {path: (mtime_ns, size) for path, mtime_ns, size in conn.execute("SELECT * FROM sources")}
+
+    def stale(path):
+        key = _stat_key(path)
+        return key, full or known.get(repo_relative(path)) != key
+
+    rescanned = 0
+    with conn:
+        dir_key, dir_stale = stale(routes_dir)
+        if dir_stale:
+            # The listing only changes when files are added, removed or renamed into place.
+            names = sorted(os.listdir(routes_dir)) if dir_key is not None else []
+            _rescan(conn, repo_relative(routes_dir), dir_key, scan_route_files(names, routes_dir))
+            rescanned += 1
+            modules = [os.path.join(routes_dir, name) for name in names
+                       if name.startswith(SHARD_PREFIX) and name.endswith(".ts")]
+            modules += [os.path.join(repo_root(), path) for path in known
+                        if os.path.basename(path).startswith(SHARD_PREFIX)
+                        and not os.path.exists(os.path.join(repo_root(), path))]
+        else:
+            modules = [os.path.join(repo_root(), path) for path in known
+                       if os.path.basename(path).startswith(SHARD_PREFIX)]
+        for path in [routes_file, *modules]:
+            key, changed = stale(path)
+            if changed:
+                _rescan(conn, repo_relative(path), key, scan_mounts(path) if key is not None else [])
+                rescanned += 1
+    PROFILE.count("registry sources rescanned", rescanned)
+    return rescanned
+
+
+def phase_owner(conn, phase: int):
+    return conn.execute("SELECT * FROM routes WHERE phase = ?", (phase,)).fetchone()
+
+
+def series_routes(conn, series: str):
+    return conn.execute("SELECT * FROM routes WHERE series = ? ORDER BY phase", (series,)).fetchall()
+
+
+def category_routes(conn, category: str):
+    return conn.execute("SELECT * FROM routes WHERE category = ? ORDER BY phase", (category,)).fetchall()
+
+
+def route(conn, route_name: str):
+    return conn.execute("SELECT * FROM routes WHERE route_name = ?", (route_name,)).fetchone()
+
+
+def generated_routes(conn, series=None):
+    """Routes a generator recorded, in phase order; optionally only the given series."""
+    if series:
+        marks = ", ".join("?" * len(series))
+        return conn.execute(f"SELECT * FROM routes WHERE generator != 'scan' AND series IN ({marks}) "
+                            "ORDER BY phase", list(series)).fetchall()
+    return conn.execute("SELECT * FROM routes WHERE generator != 'scan' ORDER BY phase").fetchall()
+
+
+def series_ranges(conn):
+    """[(series, start, end)] runs of consecutive phases that a generator recorded for each series."""
+    return conn.execute(
+        "SELECT series, MIN(phase), MAX(phase) FROM ("
+        "  SELECT series, phase, phase - ROW_NUMBER() OVER (PARTITION BY series ORDER BY phase) AS run"
+        "  FROM routes WHERE generator != 'scan' AND phase IS NOT NULL"
+        ") GROUP BY series, run ORDER BY MIN(phase)").fetchall()
+
+
+def prefix_routes(conn, prefix: str):
+    """Routes whose name starts with prefix, as a range scan over the primary key."""
+    if not prefix:
+        return conn.execute("SELECT * FROM routes ORDER BY route_name").fetchall()
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return conn.execute("SELECT * FROM routes WHERE route_name >= ? AND route_name < ? ORDER BY route_name",
+                        (prefix, upper)).fetchall()
+
+
+def free_ranges(conn, size: int = 1):
+    """[(start, end)] of unused phases with at least size phases; the last range is open (end None)."""
+    gaps = conn.execute(
+        "SELECT phase + 1, next - 1 FROM ("
+        "  SELECT phase, LEAD(phase) OVER (ORDER BY phase) AS next"
+        "  FROM (SELECT DISTINCT phase FROM routes WHERE phase IS NOT NULL)"
+        ") WHERE next - phase > ?", (size,)).fetchall()
+    first, last = conn.execute("SELECT MIN(phase), MAX(phase) FROM routes").fetchone()
+    if first is None:
+        return [(1, None)]
+    head = [(1, first - 1)] if first - 1 >= size else []
+    return head + [tuple(gap) for gap in gaps] + [(last + 1, None)]
+
+
+def print_rows(rows):
+    for row in rows:
+        print(f"{row['phase'] if row['phase'] is not None else '-':>6}  {row['series']:<14} "
+              f"{row['category'] or '-':<10} {row['route_name']}")
+
+
+def main(argv):
+    commands = ("phase", "series", "category", "route", "exists", "prefix", "free", "stats", "build")
+    optional = {"free": ("<size>",), "stats": (), "build": ("--full",)}
+    if not argv or argv[0] not in commands or (
+            len(argv) != 2 if argv[0] not in optional else len(argv) > 1 + len(optional[argv[0]])):
+        print(__doc__.split("Usage:")[1].rstrip())
+        return 1
+    command = argv[0]
+    numeric = command in ("phase", "free") and len(argv) > 1
+    if (numeric and not (argv[1].isdigit() and (command == "phase" or int(argv[1]) > 0))) or (command == "build" and argv[1:] not in ([], ["--full"])):
+        print(f"Invalid argument for {command}: {argv[1]}")
+        print(__doc__.split("Usage:")[1].rstrip())
+        return 1
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    conn = connect(db_path(OUTPUT_DIR))
+    rescanned = refresh(conn, full=argv[1:] == ["--full"])
+    if command == "build":
+        count = conn.execute("SELECT COUNT(*) FROM routes").fetchone()[0]
+        print(f"Rescanned {rescanned} sources; {count} routes in {db_path(OUTPUT_DIR)}")
+        return 0
+    if command == "free":
+        for start, end in free_ranges(conn, int(argv[1]) if len(argv) > 1 else 1):
+            print(f"{start}-{end}" if end is not None else f"{start}-")
+        return 0
+    if command == "exists":
+        row = route(conn, argv[1])
+        print(f"{argv[1]}: {'series ' + row['series'] + ', phase ' + str(row['phase']) if row else 'not found'}")
+        return 0 if row else 1
+    if command == "stats":
+        for row in conn.execute("SELECT series, COUNT(*) AS routes, MIN(phase) AS first, MAX(phase) AS last "
+                                "FROM routes GROUP BY series ORDER BY first"):
+            phases = f"phase {row['first']}-{row['last']}" if row['first'] is not None else "no phase"
+            print(f"{row['series']:<14} {row['routes']:>5} routes  {phases}")
+        return 0
+    if command == "phase":
+        rows = [phase_owner(conn, int(argv[1]))]
+    elif command == "series":
+        rows = series_routes(conn, argv[1])
+    elif command == "category":
+        rows = category_routes(conn, argv[1])
+    elif command == "prefix":
+        rows = prefix_routes(conn, argv[1])
+    else:
+        rows = [route(conn, argv[1])]
+    rows = [row for row in rows if row is not None]
+    if not rows:
+        print("No matching routes")
+        return 1
+    if command == "route":
+        print("\n".join(f"{key}: {rows[0][key]}" for key in rows[0].keys()))
+    else:
+        print_rows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Radix-trie dispatcher for the generated /api/ebay-* mount table.
+
+Express checks app.use() layers one by one, so with thousands of generated
+`app.use('/api/ebay-...', router)` mounts the routes registered last pay a
+full linear scan on every request. Dispatch mode records route names in a
+JSON table and compiles them into a radix trie at generation time; a single
+middleware resolves the first path segment in O(path length) and hands the
+request to the matching router.
+
+Generated files (routes dir):
+  ebay-dispatch-routes.json   route table (index order = trie indices)
+  ebay-dispatch-trie.ts       ROUTE_NAMES + the compiled trie + matchEbayRoute()
+  ebay-dispatch-routes.ts     static router imports + registerDispatchedEbayRoutes(app)
+
+plus codex/output/dispatch-bench.ts, a micro-benchmark comparing trie lookup
+with an Express-style linear scan over the same mounts
+(run: npx tsx codex/output/dispatch-bench.ts).
+
+Routes that are still mounted statically in ebay-routes.ts, or through a series
+shard, are moved out so nothing is matched twice. Routes without a router
+module of their own (--shared series live in the standard router table) are
+left where they are.
+
+generate_series.py, generate_elite.py, generate_apex_routes.py,
+generate-titan.py and scripts/generate-ultra-routes.py take --dispatch to
+register their routes here directly; this script sweeps an existing tree.
+
+Usage: python3 route_dispatch.py   (dispatch every route in codex/output/*-registrations.txt)
+"""
+
+import glob
+import json
+import os
+
+from output_backend import repo_path
+from output_writer import make_writer
+from phase_planner import PHASE_RE
+from route_registry import MOUNT_RE, load_routes_file, read_side_file, series_header
+from route_shards import unhook_shard
+from route_stream import to_camel
+from run_profile import PROFILE
+
+TABLE_FILE = "ebay-dispatch-routes.json"
+TRIE_FILE = "ebay-dispatch-trie.ts"
+DISPATCHER_FILE = "ebay-dispatch-routes.ts"
+BENCH_FILE = "dispatch-bench.ts"
+DISPATCH_HEADER = "// Trie-dispatched generated routes (ebay-dispatch-routes.json)"
+DISPATCH_IMPORT = "import { registerDispatchedEbayRoutes } from './ebay-dispatch-routes';"
+DISPATCH_REGISTRATION = "registerDispatchedEbayRoutes(app);"
+DISPATCH_CONFLICT = "--dispatch cannot be combined with --shared (shared routes have no router module to dispatch to)"
+
+ROUTES_DIR = repo_path("apps/api/src/routes")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+
+
+def build_trie(names):
+    """Radix trie as nested [label, route index or -1, {first char: child}] lists."""
+    root = ["", -1, {}]
+    for index, name in enumerate(names):
+        node, rest = root, name
+        while rest:
+            child = node[2].get(rest[0])
+            if child is None:
+                node[2][rest[0]] = [rest, index, {}]
+                break
+            label = child[0]
+            common = len(os.path.commonprefix([label, rest]))
+            if common < len(label):
+                child[0] = label[common:]
+                child = node[2][rest[0]] = [label[:common], -1, {child[0][0]: child}]
+            node, rest = child, rest[common:]
+        else:
+            node[1] = index
+    return root
+
+
+def _compact(node):
+    label, index, children = node
+    return [label, index, {c: _compact(child) for c, child in sorted(children.items())} or None]
+
+
+def render_trie_module(names) -> str:
+    # The trie ships as a JSON string: tsc does not have to type-check a huge nested literal.
+    trie = json.dumps(_compact(build_trie(names)), separators=(",", ":"))
+    return (
+        "// Generated by codex/route_dispatch.py. Do not edit by hand.\n"
+        "type TrieNode = [label: string, index: number, children: Record<string, TrieNode> | null];\n"
+        "\n"
+        "export const ROUTE_NAMES: readonly string[] = [\n"
+        + "".join(f"  {json.dumps(name)},\n" for name in names)
+        + "];\n"
+        "\n"
+        f"const TRIE: TrieNode = JSON.parse({json.dumps(trie)});\n"
+        "\n"
+        "/** Index into ROUTE_NAMES for an exact route name, or -1. O(name length). */\n"
+        "export function matchEbayRoute(name: string): number {\n"
+        "  let node: TrieNode = TRIE;\n"
+        "  let pos = 0;\n"
+        "  for (;;) {\n"
+        "    const label = node[0];\n"
+        "    if (!name.startsWith(label, pos)) return -1;\n"
+        "    pos += label.length;\n"
+        "    if (pos === name.length) return node[1];\n"
+        "    const next: TrieNode | undefined = node[2]?.[name[pos]];\n"
+        "    if (!next) return -1;\n"
+        "    node = next;\n"
+        "  }\n"
+        "}\n"
+    )
+
+
+DISPATCHER_BODY = '''
+export function registerDispatchedEbayRoutes(app: Express): void {
+  app.use('/api', (req: Request, res: Response, next: NextFunction) => {
+    const end = req.path.indexOf('/', 1);
+    const name = end === -1 ? req.path.slice(1) : req.path.slice(1, end);
+    const index = matchEbayRoute(name);
+    if (index < 0) return next();
+
+    const { url, baseUrl } = req;
+    const rest = url.slice(name.length + 1);
+    req.baseUrl = `${baseUrl}/${name}`;
+    req.url = rest.startsWith('/') ? rest : `/${rest}`;
+    ROUTERS[index](req, res, (err?: unknown) => {
+      req.url = url;
+      req.baseUrl = baseUrl;
+      next(err);
+    });
+  });
+}
+'''
+
+
+def render_dispatcher(names) -> str:
+    variables = [to_camel(name) + "Router" for name in names]
+    return (
+        "import type { Express, NextFunction, Request, Response, Router } from 'express';\n"
+        "import { matchEbayRoute } from './ebay-dispatch-trie';\n"
+        + "".join(f"import {var} from './{name}';\n" for var, name in zip(variables, names))
+        + "\n"
+        "// Generated by codex/route_dispatch.py. Do not edit by hand.\n"
+        "// Same order as ROUTE_NAMES in ebay-dispatch-trie.ts.\n"
+        "const ROUTERS: Router[] = [\n"
+        + "".join(f"  {var},\n" for var in variables)
+        + "];\n"
+        + DISPATCHER_BODY
+    )
+
+
+BENCH_TEMPLATE = '''// Generated by codex/route_dispatch.py. Do not edit by hand.
+// Match latency: radix trie vs. an Express-style linear scan over the same mounts.
+// Run: npx tsx codex/output/dispatch-bench.ts
+import { ROUTE_NAMES, matchEbayRoute } from '{trie_module}';
+
+const escape = (s: string) => s.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+// app.use('/api/<name>') compiles to this (path-to-regexp, end: false, case-insensitive).
+const LAYERS = ROUTE_NAMES.map((name) => new RegExp(`^\\\\/api\\\\/${escape(name)}\\\\/?(?=\\\\/|$)`, 'i'));
+
+function matchLinear(path: string): number {
+  for (let i = 0; i < LAYERS.length; i++) {
+    if (LAYERS[i].test(path)) return i;
+  }
+  return -1;
+}
+
+function matchTrie(path: string): number {
+  const end = path.indexOf('/', 5);
+  return matchEbayRoute(end === -1 ? path.slice(5) : path.slice(5, end));
+}
+
+function nsPerOp(match: (path: string) => number, path: string, iterations: number): number {
+  let sink = 0;
+  const started = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) sink += match(path);
+  const elapsed = Number(process.hrtime.bigint() - started);
+  if (sink === 0.5) console.log(sink);
+  return elapsed / iterations;
+}
+
+const last = ROUTE_NAMES.length - 1;
+const samples: Record<string, string> = {
+  first: ROUTE_NAMES[0],
+  middle: ROUTE_NAMES[Math.floor(last / 2)],
+  last: ROUTE_NAMES[last],
+  miss: 'ebay-no-such-route',
+};
+const TRIE_ITERATIONS = 1_000_000;
+const LINEAR_ITERATIONS = Math.max(100, Math.floor(20_000_000 / Math.max(1, ROUTE_NAMES.length)));
+
+const rows: Record<string, { linear_ns: string; trie_ns: string; speedup: string }> = {};
+for (const [position, name] of Object.entries(samples)) {
+  const path = `/api/${name}/dashboard/summary`;
+  if (matchLinear(path) !== matchTrie(path)) throw new Error(`matchers disagree on ${path}`);
+  const linear = nsPerOp(matchLinear, path, LINEAR_ITERATIONS);
+  const trie = nsPerOp(matchTrie, path, TRIE_ITERATIONS);
+  rows[position] = { linear_ns: linear.toFixed(1), trie_ns: trie.toFixed(1), speedup: `${(linear / trie).toFixed(1)}x` };
+}
+console.log(`${ROUTE_NAMES.length} mounted routes`);
+console.table(rows);
+'''
+
+
+def render_bench(trie_module: str) -> str:
+    return BENCH_TEMPLATE.replace("{trie_module}", trie_module)
+
+
+def load_table(routes_dir: str, writer) -> list:
+    text = writer.read_text(os.path.join(routes_dir, TABLE_FILE))
+    return [] if text is None else json.loads(text)
+
+
+def render_table(names) -> str:
+    return "[\n" + ",\n".join(json.dumps(name) for name in names) + "\n]\n"
+
+
+@PROFILE.timed("routes splice")
+def emit_dispatch_routes(routes_dir: str, routes_file: str, route_names, writer,
+                         series=(), output_dir: str = None, phases=()) -> int:
+    """Add route_names to the dispatch table, regenerate the trie/dispatcher and hook it into routes_file.
+
+    Static app.use() mounts of those routes, and the shards of the given series,
+    are removed from routes_file; their "// Phase X-Y (Name series)" headers
+    move above the dispatch hook, together with a record for every (series,
+    start, end) in phases. With output_dir, the micro-benchmark is written
+    there too. Names without a <name>.ts router module in routes_dir are
+    skipped (and dropped from the table). Returns the number of routes newly
+    added to the table.
+    """
+    def has_module(name):
+        return writer.backend.signature(os.path.join(routes_dir, f"{name}.ts")) is not None
+
+    table = load_table(routes_dir, writer)
+    names = [name for name in table if has_module(name)]
+    known = set(names)
+    skipped = set(table) - known
+    before = len(names)
+    for name in route_names:
+        if name in known or name in skipped:
+            continue
+        if not has_module(name):
+            skipped.add(name)
+            continue
+        known.add(name)
+        names.append(name)
+    added = len(names) - before
+    if skipped:
+        print(f"Skipped {len(skipped)} routes without a router module (e.g. shared-mode series)")
+
+    writer.write(os.path.join(routes_dir, TABLE_FILE), render_table(names))
+    writer.write(os.path.join(routes_dir, TRIE_FILE), render_trie_module(names))
+    writer.write(os.path.join(routes_dir, DISPATCHER_FILE), render_dispatcher(names))
+    if output_dir:
+        trie_module = os.path.relpath(os.path.join(routes_dir, TRIE_FILE[:-3]), output_dir)
+        writer.write(os.path.join(output_dir, BENCH_FILE), render_bench(trie_module))
+
+    registry = load_routes_file(writer, routes_file)
+    records = phase_records(registry.body)
+    moved = registry.remove_routes(f"/api/{name}" for name in known)
+    for series_name in series:
+        moved += unhook_shard(registry, series_name)
+    if moved:
+        print(f"Moved {moved} static registrations into the dispatch table")
+        kept = set(phase_records(registry.body))
+        records = [record for record in records if record not in kept]
+    else:
+        records = []
+    registry.add_block(DISPATCH_HEADER, [DISPATCH_IMPORT], [DISPATCH_REGISTRATION])
+    registry.add_records(DISPATCH_REGISTRATION, records + [series_header(*phase) for phase in phases])
+    if registry.changed:
+        writer.write(routes_file, registry.render(), atomic=True)
+    return added
+
+
+def phase_records(text: str):
+    """The "// Phase X-Y (...)" header lines of a routes module, in order."""
+    return [line.strip() for line in text.splitlines() if PHASE_RE.search(line)]
+
+
+def side_file_routes(output_dir: str, writer) -> dict:
+    """{series: [route names]} from every <series>-registrations.txt in output_dir."""
+    routes = {}
+    for path in sorted(glob.glob(os.path.join(output_dir, "*-registrations.txt"))):
+        series_name = os.path.basename(path)[: -len("-registrations.txt")]
+        for line in read_side_file(writer, path):
+            m = MOUNT_RE.search(line)
+            if m and m.group(1).startswith("/api/"):
+                routes.setdefault(series_name, []).append(m.group(1)[len("/api/"):])
+    return routes
+
+
+def main():
+    writer = make_writer(OUTPUT_DIR)
+    routes = side_file_routes(OUTPUT_DIR, writer)
+    names = [name for series_names in routes.values() for name in series_names]
+    added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, names, writer, routes, OUTPUT_DIR)
+    dispatched = len(load_table(ROUTES_DIR, writer))
+    writer.close()
+    print(f"Dispatch table: {dispatched} routes from {len(routes)} series ({added} new)")
+    print(f"Benchmark: npx tsx {os.path.relpath(os.path.join(OUTPUT_DIR, BENCH_FILE), repo_path())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Single-pass, idempotent updater for apps/api/src/routes/ebay-routes.ts.
+
+The routes file is parsed once into two regions: the import region (everything
+before `export function registerEbayRoutes`) and the registration region (the
+function body up to its closing brace). Any number of series blocks are then
+spliced in and the file is rendered once.
+
+Imports and registrations that are already present are skipped, so re-running a
+series is a no-op. A missing or duplicated anchor raises RouteFileError instead
+of silently producing a broken file.
+"""
+
+import re
+
+from output_writer import make_writer
+from run_profile import PROFILE
+
+ANCHOR = "export function registerEbayRoutes"
+
+IMPORT_RE = re.compile(r"^import\s+(?:\{\s*)?(\w+)")
+MOUNT_RE = re.compile(r"app\.use\(\s*'([^']+)'")
+BLANK_RUN_RE = re.compile(r"\n(?:[ \t]*\n){2,}")
+MOUNT_VAR_RE = re.compile(r"app\.use\(\s*'[^']+',\s*(\w+)\s*\)")
+IMPORT_FROM_RE = re.compile(r"^\s*import\b.*\bfrom\s+'\./([^']+)'")
+
+
+def _prune(text: str, drop) -> str:
+    """Remove lines for which drop(line) is true, plus comment headers left without any lines."""
+    kept = []
+    header = None  # (index in kept, whether anything under it survived, whether anything was dropped)
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("//") or not stripped:
+            if header and header[2] and not header[1]:
+                kept[header[0]] = None
+            header = (len(kept), False, False) if stripped else None
+            kept.append(line)
+        elif drop(line):
+            if header:
+                header = (header[0], header[1], True)
+        else:
+            if header:
+                header = (header[0], True, header[2])
+            kept.append(line)
+    if header and header[2] and not header[1]:
+        kept[header[0]] = None
+    return BLANK_RUN_RE.sub("\n\n", "\n".join(line for line in kept if line is not None))
+
+
+def prune_routes(text: str, route_names, modules=(), statements=()) -> str:
+    """Remove route_names' app.use() mounts and './<name>' imports from a routes module.
+
+    Imports of the extra modules (e.g. series shards) and the given registration
+    statements are removed too. Works on ebay-routes.ts and on series shards.
+    """
+    paths = {f"/api/{name}" for name in route_names}
+    modules = set(route_names) | set(modules)
+    statements = set(statements)
+
+    def drop(line):
+        m = MOUNT_RE.search(line)
+        if m and m.group(1) in paths:
+            return True
+        m = IMPORT_FROM_RE.match(line)
+        if m and m.group(1) in modules:
+            return True
+        return line.strip() in statements
+
+    # As in RoutesFile, the closing brace must not count as a line under the last header.
+    body, brace, _ = text.rstrip().rpartition("\n}")
+    if not brace:
+        return _prune(text, drop)
+    return _prune(body, drop).rstrip() + "\n}\n"
+
+
+class RouteFileError(Exception):
+    pass
+
+
+class RoutesFile:
+    def __init__(self, content: str, path: str = "ebay-routes.ts"):
+        self.path = path
+        count = content.count(ANCHOR)
+        if count != 1:
+            raise RouteFileError(f"{path}: expected exactly one '{ANCHOR}', found {count}")
+        anchor = content.index(ANCHOR)
+        if anchor == 0 or content[anchor - 1] != "\n":
+            raise RouteFileError(f"{path}: '{ANCHOR}' must start a line")
+        stripped = content.rstrip()
+        if not stripped.endswith("\n}"):
+            raise RouteFileError(f"{path}: registerEbayRoutes must end with a closing '}}' line")
+        close = len(stripped) - 1
+        if close < anchor:
+            raise RouteFileError(f"{path}: closing '}}' precedes '{ANCHOR}'")
+
+        self.head = content[:anchor - 1]
+        self.body = content[anchor:close]
+        self.imported = {m.group(1) for m in map(IMPORT_RE.match, self.head.splitlines()) if m}
+        self.mounted = set(MOUNT_RE.findall(self.body))
+        self.statements = {line.strip() for line in self.body.splitlines()}
+        self._import_blocks = []
+        self._registration_blocks = []
+        self._records = {}
+        self._removed = 0
+
+    def add_block(self, header: str, imports, registrations) -> int:
+        """Queue one commented block. Returns the number of new registrations."""
+        new_imports = []
+        for line in imports:
+            m = IMPORT_RE.match(line.strip())
+            if not m:
+                raise RouteFileError(f"{self.path}: not an import line: {line!r}")
+            if m.group(1) not in self.imported:
+                self.imported.add(m.group(1))
+                new_imports.append(line.strip())
+
+        new_registrations = []
+        for line in registrations:
+            statement = line.strip()
+            m = MOUNT_RE.search(statement)
+            if m:
+                if m.group(1) in self.mounted:
+                    continue
+                self.mounted.add(m.group(1))
+            elif not statement.endswith(";"):
+                raise RouteFileError(f"{self.path}: not a registration statement: {line!r}")
+            elif statement in self.statements:
+                continue
+            self.statements.add(statement)
+            new_registrations.append("  " + statement)
+
+        if new_imports:
+            self._import_blocks.append(f"\n{header}\n" + "\n".join(new_imports) + "\n")
+        if new_registrations:
+            self._registration_blocks.append(f"\n  {header}\n" + "\n".join(new_registrations))
+        return len(new_registrations)
+
+    def add_records(self, statement: str, records) -> int:
+        """Queue comment lines (e.g. phase headers) directly above a registration statement.
+
+        Hook statements such as registerLazyEbayRoutes(app); are shared by every
+        series, so add_block() writes their header only once; the per-series
+        "// Phase X-Y (Name series)" records go here instead. Records already in
+        the file are skipped. Returns the number of new records.
+        """
+        new_records = [record.strip() for record in records if record.strip() not in self.statements]
+        self.statements.update(new_records)
+        if new_records:
+            self._records.setdefault(statement.strip(), []).extend(new_records)
+        return len(new_records)
+
+    def remove_routes(self, route_paths) -> int:
+        """Drop existing app.use() mounts for route_paths and the imports they use.
+
+        Used when a series moves out of this file (e.g. into its own shard).
+        Returns the number of mounts removed.
+        """
+        route_paths = set(route_paths) & self.mounted
+        if not route_paths:
+            return 0
+        variables = set()
+
+        def drop_mount(line):
+            m = MOUNT_RE.search(line)
+            if m and m.group(1) in route_paths:
+                var = MOUNT_VAR_RE.search(line)
+                if var:
+                    variables.add(var.group(1))
+                return True
+            return False
+
+        self._drop(drop_mount, variables)
+        self.mounted -= route_paths
+        return len(route_paths)
+
+    def remove_statements(self, statements, import_names) -> int:
+        """Drop registration statements (e.g. registerXRoutes(app);) and the named imports.
+
+        Returns the number of statements removed.
+        """
+        statements = set(statements) & self.statements
+        if not statements:
+            return 0
+        self._drop(lambda line: line.strip() in statements, set(import_names) & self.imported)
+        return len(statements)
+
+    def _drop(self, drop_registration, import_names):
+        self.body = _prune(self.body, drop_registration).rstrip() + "\n"
+        self.head = _prune(self.head, lambda line: (IMPORT_RE.match(line) or [None, None])[1] in import_names)
+        self.imported -= import_names
+        self.statements = {line.strip() for line in self.body.splitlines()}
+        self._removed += 1
+
+    @property
+    def changed(self) -> bool:
+        return bool(self._import_blocks or self._registration_blocks or self._records or self._removed)
+
+    def render(self) -> str:
+        registrations = self.body + "".join(self._registration_blocks)
+        if self._records:
+            lines = registrations.split("\n")
+            for statement, records in self._records.items():
+                at = next((i for i, line in enumerate(lines) if line.strip() == statement), None)
+                if at is None:
+                    raise RouteFileError(f"{self.path}: no registration {statement!r} to record {records[0]!r} at")
+                lines[at:at] = ["  " + record for record in records]
+            registrations = "\n".join(lines)
+        return (
+            self.head
+            + "".join(self._import_blocks)
+            + "\n"
+            + registrations
+            + ("\n}\n" if self._registration_blocks else "}\n")
+        )
+
+
+def read_side_file(writer, path: str):
+    text = writer.read_text(path)
+    if text is None:
+        raise RouteFileError(f"missing side file: {path}")
+    return [line for line in text.splitlines() if line.strip() and not line.strip().startswith("//")]
+
+
+def load_routes_file(writer, routes_file: str) -> RoutesFile:
+    text = writer.read_text(routes_file)
+    if text is None:
+        raise RouteFileError(f"{routes_file}: file not found")
+    return RoutesFile(text, routes_file)
+
+
+def series_header(series_name: str, start_phase: int, end_phase: int) -> str:
+    return f"// Phase {start_phase}-{end_phase} ({series_name.capitalize()} series)"
+
+
+@PROFILE.timed("routes splice")
+def apply_series(routes_file: str, output_dir: str, plan, writer=None) -> int:
+    """Splice every (series, start, end) in plan into routes_file with one read and one write.
+
+    Imports/registrations are read from <output_dir>/<series>-imports.txt and
+    -registrations.txt. Returns the number of newly mounted routes.
+    """
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(output_dir)
+    routes = load_routes_file(writer, routes_file)
+
+    added = 0
+    for series_name, start_phase, end_phase in plan:
+        added += routes.add_block(
+            series_header(series_name, start_phase, end_phase),
+            read_side_file(writer, f"{output_dir}/{series_name}-imports.txt"),
+            read_side_file(writer, f"{output_dir}/{series_name}-registrations.txt"),
+        )
+
+    if routes.changed:
+        writer.write(routes_file, routes.render(), atomic=True)
+    if owns_writer:
+        writer.close()
+    return added
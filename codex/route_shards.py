@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Per-series route registration shards.
+
+Instead of splicing every series into apps/api/src/routes/ebay-routes.ts, each
+series gets its own module, ebay-routes-<series>.ts, holding that series'
+imports and a register<Series>Routes(app) function. ebay-routes.ts only
+imports and calls the shard entry points, so regenerating one series rewrites
+(and makes tsc / tsx-watch recheck) one small module instead of the whole
+registry. Unchanged shards are skipped by OutputWriter.
+
+Shards are built from the same <series>-imports.txt / -registrations.txt side
+files as the monolithic splice. A series that is still mounted statically in
+ebay-routes.ts is moved into its shard.
+"""
+
+import os
+
+from output_writer import make_writer
+from route_registry import MOUNT_RE, load_routes_file, read_side_file, series_header
+from run_profile import PROFILE
+
+
+def shard_module(series_name: str) -> str:
+    return f"ebay-routes-{series_name}"
+
+
+def register_function(series_name: str) -> str:
+    return "register" + "".join(part.capitalize() for part in series_name.split("-")) + "Routes"
+
+
+def render_shard(series_name: str, header: str, imports, registrations) -> str:
+    return (
+        "import type { Express } from 'express';\n"
+        + "".join(line.strip() + "\n" for line in imports)
+        + "\n"
+        "// Generated by codex/route_shards.py. Do not edit by hand.\n"
+        f"{header}\n"
+        f"export function {register_function(series_name)}(app: Express): void {{\n"
+        + "".join("  " + line.strip() + "\n" for line in registrations)
+        + "}\n"
+    )
+
+
+def unhook_shard(routes, series_name: str) -> int:
+    """Remove a series' shard import and register call from a RoutesFile (the shard file itself stays)."""
+    function = register_function(series_name)
+    return routes.remove_statements([f"{function}(app);"], [function])
+
+
+@PROFILE.timed("routes splice")
+def apply_shards(routes_dir: str, routes_file: str, output_dir: str, plan, writer=None) -> int:
+    """Write ebay-routes-<series>.ts for every (series, start, end) in plan and hook them into routes_file.
+
+    Returns the number of series whose shard was newly added to routes_file.
+    """
+    owns_writer = writer is None
+    if owns_writer:
+        writer = make_writer(output_dir)
+    routes = load_routes_file(writer, routes_file)
+
+    added = 0
+    for series_name, start_phase, end_phase in plan:
+        header = series_header(series_name, start_phase, end_phase)
+        imports = read_side_file(writer, f"{output_dir}/{series_name}-imports.txt")
+        registrations = read_side_file(writer, f"{output_dir}/{series_name}-registrations.txt")
+        module = shard_module(series_name)
+        writer.write(os.path.join(routes_dir, f"{module}.ts"),
+                     render_shard(series_name, header, imports, registrations))
+
+        moved = routes.remove_routes(m.group(1) for m in map(MOUNT_RE.search, registrations) if m)
+        if moved:
+            print(f"[{series_name}] Moved {moved} static registrations into {module}.ts")
+        function = register_function(series_name)
+        added += routes.add_block(header, [f"import {{ {function} }} from './{module}';"], [f"{function}(app);"])
+
+    if routes.changed:
+        writer.write(routes_file, routes.render(), atomic=True)
+    if owns_writer:
+        writer.close()
+    return added
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Streaming building blocks for the series generators.
+
+Route specs are produced lazily by iter_route_specs(), and the
+imports/registrations side files are written line by line through LineSink
+instead of being collected into lists and joined at the end. Peak memory is
+therefore one route at a time, however many series a run covers.
+"""
+
+import hashlib
+import sys
+import time
+from collections import namedtuple
+
+RouteSpec = namedtuple("RouteSpec", "phase route_name category adjective noun color var_name")
+
+SINK_BUFFER = 1 << 16
+
+
+def to_camel(kebab: str) -> str:
+    parts = kebab.split("-")
+    return parts[0] + "".join(p.capitalize() for p in parts[1:])
+
+
+def iter_route_specs(series_name: str, adjectives, start_phase: int, categories, cat_nouns, colors):
+    """Yield one RouteSpec per (adjective, category), in phase order."""
+    phase = start_phase
+    for adj in adjectives:
+        for cat in categories:
+            noun = cat_nouns[cat]
+            route_name = f"ebay-{cat}-{adj}-{noun}-{series_name}"
+            color = colors[(phase - start_phase) % len(colors)]
+            yield RouteSpec(phase, route_name, cat, adj, noun, color, to_camel(route_name) + "Router")
+            phase += 1
+
+
+class LineSink:
+    """Buffered line writer that hashes as it goes and hands the result to an OutputWriter.
+
+    Lines go to a backend temp file; close() keeps the old file untouched if the
+    content is unchanged, otherwise moves the temp file into place.
+    """
+
+    def __init__(self, path: str, writer):
+        self.path = path
+        self.writer = writer
+        self.lines = 0
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._f = writer.open_temp(path, SINK_BUFFER)
+
+    def write_line(self, line: str):
+        encoded = (line + "\n").encode("utf-8")
+        self._f.write(encoded)
+        self._hash.update(encoded)
+        self._size += len(encoded)
+        self.lines += 1
+
+    def close(self) -> bool:
+        return self.writer.commit(self._f, self.path, self._hash.hexdigest(), self._size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.writer.discard(self._f, self.path)
+
+
+class Progress:
+    """Periodic '[label] n/total' progress lines, at most one per interval seconds."""
+
+    def __init__(self, label: str, total: int, interval: float = 1.0, stream=sys.stdout):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.done = 0
+        self._started = self._last = time.perf_counter()
+
+    def tick(self, n: int = 1):
+        self.done += n
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            rate = self.done / (now - self._started)
+            print(f"[{self.label}] {self.done}/{self.total} routes ({rate:.0f}/s)", file=self.stream, flush=True)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Write-ahead journal for resumable generate_series.py runs.
+
+A run appends one JSON record per line to codex/output/.generate-journal.jsonl:
+
+  {"op": "plan", "plan": [[series, start, end], ...], "options": {...}}
+                                             before the first file is written
+  {"op": "route", "series": s, "route": r}   once a route's files are written
+  {"op": "series", "series": s}              once a series' side files are in place
+  {"op": "routes"}                           once ebay-routes.ts (or its mode's
+                                             registry) has been committed
+
+The journal is removed when the run finishes. If the process dies midway
+(Ctrl-C, disk full, ...), `generate_series.py --resume` replays the journaled
+plan and options, skips every route and series already recorded and only then
+runs the routes step, which refuses to touch ebay-routes.ts until every file
+of the plan exists (see check_complete).
+
+Records are flushed line by line, which survives a killed process, and fsynced
+at series boundaries. A torn last line from a crash is ignored on resume.
+"""
+
+import json
+import os
+import threading
+
+JOURNAL_NAME = ".generate-journal.jsonl"
+
+
+class JournalError(Exception):
+    pass
+
+
+class IncompleteSeriesError(Exception):
+    pass
+
+
+def journal_path(output_dir: str) -> str:
+    return os.path.join(output_dir, JOURNAL_NAME)
+
+
+class RunJournal:
+    def __init__(self, path: str, plan, options: dict):
+        self.path = path
+        self.plan = [tuple(entry) for entry in plan]
+        self.options = options
+        self.done_routes = {}
+        self.done_series = set()
+        self.routes_done = False
+        self._open()
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._f = open(self.path, "a", buffering=1, encoding="utf-8")
+        self._lock = threading.Lock()
+
+    # Process-pool workers get a copy that appends to the same file.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_f"], state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    @classmethod
+    def start(cls, path: str, plan, options: dict) -> "RunJournal":
+        """Journal a new run. Refuses to overwrite the journal of an unfinished one."""
+        if os.path.exists(path):
+            raise JournalError(f"{path}: an unfinished run is journaled here; "
+                               "rerun with --resume, or delete the file to start over")
+        journal = cls(path, plan, options)
+        journal._append({"op": "plan", "plan": journal.plan, "options": options}, sync=True)
+        return journal
+
+    @classmethod
+    def resume(cls, path: str) -> "RunJournal":
+        """Reopen the journal of an interrupted run with its completed work loaded."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            raise JournalError(f"{path}: no interrupted run to resume") from None
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # torn write from the crash; everything after it is lost anyway
+        if not records or records[0].get("op") != "plan":
+            raise JournalError(f"{path}: journal does not start with a plan record")
+
+        journal = cls(path, records[0]["plan"], records[0]["options"])
+        for record in records[1:]:
+            if record["op"] == "route":
+                journal.done_routes.setdefault(record["series"], set()).add(record["route"])
+            elif record["op"] == "series":
+                journal.done_series.add(record["series"])
+            elif record["op"] == "routes":
+                journal.routes_done = True
+        return journal
+
+    def _append(self, record: dict, sync: bool = False):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._f.write(line)
+            if sync:
+                os.fsync(self._f.fileno())
+
+    def is_done(self, series_name: str, route_name: str) -> bool:
+        return route_name in self.done_routes.get(series_name, ())
+
+    def route_done(self, series_name: str, route_name: str):
+        self._append({"op": "route", "series": series_name, "route": route_name})
+
+    def series_done(self, series_name: str):
+        self.done_series.add(series_name)
+        self._append({"op": "series", "series": series_name}, sync=True)
+
+    def routes_committed(self):
+        self.routes_done = True
+        self._append({"op": "routes"}, sync=True)
+
+    def progress(self) -> str:
+        routes = sum(len(names) for names in self.done_routes.values())
+        return (f"{len(self.done_series)}/{len(self.plan)} series complete, "
+                f"{routes} routes already written"
+                + (", routes step committed" if self.routes_done else ""))
+
+    def finish(self):
+        """The run completed: drop the journal."""
+        self._f.close()
+        os.remove(self.path)
+
+
+def check_complete(writer, expected: dict):
+    """Raise IncompleteSeriesError unless every {series: [paths]} file exists in the writer's backend."""
+    missing = {
+        series_name: [path for path in paths if writer.backend.signature(path) is None]
+        for series_name, paths in expected.items()
+    }
+    missing = {series_name: paths for series_name, paths in missing.items() if paths}
+    if missing:
+        detail = "; ".join(f"{s}: {len(paths)} missing, e.g. {paths[0]}" for s, paths in missing.items())
+        raise IncompleteSeriesError(f"not registering incomplete series ({detail})")
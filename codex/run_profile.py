@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Profiling mode for the codex generators (--profile).
+
+PROFILE is a process-wide profiler that is off unless a script runs through
+profile_run(). Shared code marks its stages and counts its I/O operations:
+
+  with PROFILE.stage("render UI"): ...      or   @PROFILE.timed("routes splice")
+  PROFILE.count("files opened")
+
+Stage times are exclusive: a "mkdir" inside a "write" is only counted as
+mkdir, so the stages plus "(other)" add up to the run's wall time. Wall time
+is per stage entry; CPU time is the calling thread's (time.thread_time), so
+thread-pool workers are accounted for too. cProfile only sees the main thread.
+
+profile_run() prints a table and writes <output_dir>/profile-<label>.json
+(stages, counters, totals) and profile-<label>.pstats (load with
+`python3 -m pstats`, or snakeviz).
+"""
+
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "frame")
+
+    def __init__(self, profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack()
+        # [wall at entry, cpu at entry, wall of nested stages, cpu of nested stages]
+        self.frame = [time.perf_counter(), time.thread_time(), 0.0, 0.0]
+        stack.append(self.frame)
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.frame[0]
+        cpu = time.thread_time() - self.frame[1]
+        stack = self.profiler._stack()
+        stack.pop()
+        if stack:
+            stack[-1][2] += wall
+            stack[-1][3] += cpu
+        self.profiler._add(self.name, wall - self.frame[2], cpu - self.frame[3])
+        return False
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.stages = {}
+        self.counters = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add(self, name: str, wall: float, cpu: float):
+        with self._lock:
+            entry = self.stages.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += wall
+            entry[2] += cpu
+
+    def stage(self, name: str):
+        """Context manager timing one stage (a no-op while profiling is off)."""
+        return _Stage(self, name) if self.enabled else _NULL_STAGE
+
+    def timed(self, name: str):
+        """Decorator: time every call of the function as stage `name`."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Stage(self, name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def count(self, name: str, n: int = 1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self, wall: float, cpu: float) -> dict:
+        return {
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "stages": {
+                name: {"calls": calls, "wall_s": stage_wall, "cpu_s": stage_cpu}
+                for name, (calls, stage_wall, stage_cpu) in sorted(self.stages.items(), key=lambda kv: -kv[1][1])
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+    def table(self, wall: float, cpu: float) -> str:
+        lines = [f"{'stage':<16} {'calls':>8} {'wall s':>9} {'cpu s':>9} {'wall %':>7}"]
+        accounted = 0.0
+        for name, (calls, stage_wall, stage_cpu) in sorted(self.stages.items(), key=lambda kv: -kv[1][1]):
+            accounted += stage_wall
+            lines.append(f"{name:<16} {calls:>8} {stage_wall:>9.3f} {stage_cpu:>9.3f} "
+                         f"{100.0 * stage_wall / wall if wall else 0:>6.1f}%")
+        # Worker threads can overlap, so stage wall time may exceed the run's wall time.
+        other = max(0.0, wall - accounted)
+        lines.append(f"{'(other)':<16} {'':>8} {other:>9.3f} {'':>9} {100.0 * other / wall if wall else 0:>6.1f}%")
+        lines.append(f"{'total':<16} {'':>8} {wall:>9.3f} {cpu:>9.3f}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'operation':<16} {'count':>12}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<16} {value:>12}")
+        return "\n".join(lines)
+
+
+PROFILE = Profiler()
+
+
+def profile_run(label: str, output_dir: str, fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) under cProfile with stage timers on, then report.
+
+    The report is written even if fn raises or exits (Ctrl-C included).
+    """
+    PROFILE.enabled = True
+    profiler = cProfile.Profile()
+    started_wall, started_cpu = time.perf_counter(), time.process_time()
+    profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        wall, cpu = time.perf_counter() - started_wall, time.process_time() - started_cpu
+        PROFILE.enabled = False
+
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(output_dir, f"profile-{label}")
+        profiler.dump_stats(base + ".pstats")
+        with open(base + ".json", "w") as f:
+            json.dump({"label": label, **PROFILE.to_dict(wall, cpu)}, f, indent=2)
+
+        top = io.StringIO()
+        pstats.Stats(profiler, stream=top).sort_stats("tottime").print_stats(10)
+        print(f"\n=== profile: {label} ===")
+        print(PROFILE.table(wall, cpu))
+        print("\nTop functions by own time (main thread):")
+        print("\n".join(line for line in top.getvalue().splitlines()[4:] if line.strip()))
+        print(f"Profile written to {base}.json and {base}.pstats")
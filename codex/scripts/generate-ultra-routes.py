@@ -1,10 +1,35 @@
 #!/usr/bin/env python3
-"""Generate eBay Phase 2261-2330 (Ultra series) route files."""
+"""Generate eBay Phase 2261-2330 (Ultra series) route files.
+
+Pass --shared to mount the routes on the shared standard router instead of
+writing one file per route, or --dispatch to also add them to the radix-trie
+dispatch table (see route_dispatch.py).
+
+Pass --static-responses to write routers that send precomputed JSON buffers
+(with ETag / 304 support) instead of calling res.json() per request.
+
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-generate-ultra-routes.json / .pstats).
+"""
 
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from output_backend import repo_path  # noqa: E402
+from output_writer import make_writer  # noqa: E402
+from route_db import record_routes, route_row  # noqa: E402
+from route_dispatch import DISPATCH_CONFLICT, emit_dispatch_routes  # noqa: E402
+from run_profile import profile_run  # noqa: E402
+from shared_router import BUNDLE_HANDLER, emit_shared_routes, variant_of  # noqa: E402
+from smoke_tests import emit_smoke_tests  # noqa: E402
+from static_router import SHARED_CONFLICT, static_template  # noqa: E402
 
-ROUTES_DIR = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+ROUTES_DIR = repo_path("apps/api/src/routes")
+OUTPUT_DIR = repo_path("codex/output")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+TESTS_DIR = repo_path("apps/api/src/test/generated")
 
 TEMPLATE = """import { Router } from 'express';
 import type { Request, Response } from 'express';
@@ -53,6 +78,24 @@ router.get('/export', (_req: Request, res: Response) => res.json({ section: 'uti
 router.post('/import', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'import' }));
 router.post('/sync', (_req: Request, res: Response) => res.json({ section: 'utilities', action: 'sync' }));
 
+// Bundle (1)
+const BUNDLE: Record<string, { section: string; action: string }> = {
+  'dashboard': { section: 'dashboard', action: 'dashboard' },
+  'dashboard/summary': { section: 'dashboard', action: 'summary' },
+  'dashboard/metrics': { section: 'dashboard', action: 'metrics' },
+  'dashboard/recent': { section: 'dashboard', action: 'recent' },
+  'dashboard/alerts': { section: 'dashboard', action: 'alerts' },
+  'tests': { section: 'tests', action: 'list' },
+  'variants': { section: 'variants', action: 'list' },
+  'listings': { section: 'listings', action: 'list' },
+  'analytics': { section: 'analytics', action: 'analytics' },
+  'analytics/overview': { section: 'analytics', action: 'overview' },
+  'analytics/trends': { section: 'analytics', action: 'trends' },
+  'settings': { section: 'settings', action: 'get' },
+  'health': { section: 'utilities', action: 'health' },
+  'export': { section: 'utilities', action: 'export' },
+};
+""" + BUNDLE_HANDLER + """
 export default router;
 """
 
@@ -164,21 +207,21 @@ def kebab_to_camel(name):
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
-def main():
-    os.makedirs(ROUTES_DIR, exist_ok=True)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def main(shared: bool = False, static_responses: bool = False, dispatch: bool = False):
+    template = static_template(TEMPLATE) if static_responses else TEMPLATE
 
     imports_lines = []
     registrations_lines = []
     file_count = 0
+    writer = make_writer(OUTPUT_DIR)
 
     for start, end, names in GROUPS:
         registrations_lines.append(f"// Phase {start}-{end}")
         for name in names:
-            filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
-            with open(filepath, "w") as f:
-                f.write(TEMPLATE)
-            file_count += 1
+            if not shared:
+                filepath = os.path.join(ROUTES_DIR, f"{name}.ts")
+                writer.write(filepath, template)
+                file_count += 1
 
             var_name = kebab_to_camel(name) + "Router"
 
@@ -193,17 +236,44 @@ def main():
         registrations_lines.append("")
 
     imports_path = os.path.join(OUTPUT_DIR, "ultra-imports.txt")
-    with open(imports_path, "w") as f:
-        f.write("\n".join(imports_lines) + "\n")
+    writer.write(imports_path, "\n".join(imports_lines) + "\n")
 
     registrations_path = os.path.join(OUTPUT_DIR, "ultra-registrations.txt")
-    with open(registrations_path, "w") as f:
-        f.write("\n".join(registrations_lines) + "\n")
+    writer.write(registrations_path, "\n".join(registrations_lines) + "\n")
+    if shared:
+        names = [name for _, _, group in GROUPS for name in group]
+        added = emit_shared_routes(ROUTES_DIR, ROUTES_FILE, variant_of(TEMPLATE), names, writer,
+                                   [("ultra", GROUPS[0][0], GROUPS[-1][1])])
+        print(f"Added {added} Ultra routes to the shared router table")
+    elif dispatch:
+        names = [name for _, _, group in GROUPS for name in group]
+        added = emit_dispatch_routes(ROUTES_DIR, ROUTES_FILE, names, writer, (), OUTPUT_DIR,
+                                     [("ultra", GROUPS[0][0], GROUPS[-1][1])])
+        print(f"Added {added} Ultra routes to the route dispatch table")
+    record_routes(OUTPUT_DIR, [
+        route_row(name, start + i, "ultra", "generate-ultra-routes", template=template,
+                  api_file=None if shared else os.path.join(ROUTES_DIR, f"{name}.ts"))
+        for start, _, group in GROUPS
+        for i, name in enumerate(group)
+    ], writer)
+    shards = emit_smoke_tests("ultra", [name for _, _, group in GROUPS for name in group], variant_of(TEMPLATE),
+                              writer, ROUTES_DIR, TESTS_DIR, shared)
+    writer.close()
 
-    print(f"Generated {file_count} route files in {ROUTES_DIR}")
+    print(f"Generated {file_count} route files in {ROUTES_DIR} ({writer.summary()})")
     print(f"Generated {imports_path}")
     print(f"Generated {registrations_path}")
+    print(f"Smoke specs: {shards} shards in {TESTS_DIR}")
 
 
 if __name__ == "__main__":
-    main()
+    options = dict(shared="--shared" in sys.argv[1:], static_responses="--static-responses" in sys.argv[1:],
+                   dispatch="--dispatch" in sys.argv[1:])
+    if options["shared"] and options["static_responses"]:
+        sys.exit(SHARED_CONFLICT)
+    if options["shared"] and options["dispatch"]:
+        sys.exit(DISPATCH_CONFLICT)
+    if "--profile" in sys.argv[1:]:
+        profile_run("generate-ultra-routes", OUTPUT_DIR, main, **options)
+    else:
+        main(**options)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Packed, indexed adjective sets for the generate_series.py series.
+
+The series dictionary used to be a literal dict in generate_series.py that
+every invocation parsed and built in full. It now lives in two files next to
+this module:
+
+  series-adjectives.dat   one record per series: "<series> <adj> <adj> ...\\n"
+  series-adjectives.idx   offset table: "<series> <byte offset> <byte length>\\n"
+
+SeriesIndex is a read-only Mapping over them. Listing or checking series
+names reads only the index; looking a series up seeks to its record and
+splits that one line. Records are self-describing, so the index can always be
+rebuilt from the data file.
+
+Usage:
+  python3 series_data.py list
+  python3 series_data.py show <series>
+  python3 series_data.py add <series> <adj,adj,...>   (appends to both files)
+  python3 series_data.py reindex                      (rebuild .idx from .dat)
+"""
+
+import os
+import sys
+from collections.abc import Mapping
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(HERE, "series-adjectives.dat")
+INDEX_FILE = os.path.join(HERE, "series-adjectives.idx")
+
+
+class SeriesIndex(Mapping):
+    """Mapping series name -> list of adjectives, loaded one series at a time."""
+
+    def __init__(self, data_path: str = DATA_FILE, index_path: str = INDEX_FILE):
+        self.data_path = data_path
+        self.index_path = index_path
+        self._offsets = None
+        self._cache = {}
+
+    def _index(self) -> dict:
+        if self._offsets is None:
+            offsets = {}
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    name, offset, length = line.split()
+                    offsets[name] = (int(offset), int(length))
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, name: str):
+        adjectives = self._cache.get(name)
+        if adjectives is None:
+            offset, length = self._index()[name]
+            with open(self.data_path, "rb") as f:
+                f.seek(offset)
+                record = f.read(length).decode("utf-8")
+            fields = record.split()
+            if not record.endswith("\n") or not fields or fields[0] != name:
+                raise ValueError(f"{self.index_path} is out of date for {name!r}; "
+                                 "run `python3 series_data.py reindex`")
+            adjectives = self._cache[name] = fields[1:]
+        return adjectives
+
+    def __contains__(self, name) -> bool:
+        return name in self._index()
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+
+def pack_record(name: str, adjectives) -> bytes:
+    for word in (name, *adjectives):
+        if not word or any(c.isspace() for c in word):
+            raise ValueError(f"series names and adjectives cannot be empty or contain whitespace: {word!r}")
+    return (" ".join([name, *adjectives]) + "\n").encode("utf-8")
+
+
+def append_series(name: str, adjectives, data_path: str = DATA_FILE, index_path: str = INDEX_FILE):
+    """Append a new series to the data file and its offset to the index."""
+    if name in SeriesIndex(data_path, index_path):
+        raise ValueError(f"series already exists: {name}")
+    record = pack_record(name, adjectives)
+    with open(data_path, "ab") as f:
+        offset = f.tell()
+        f.write(record)
+    with open(index_path, "a", encoding="utf-8") as f:
+        f.write(f"{name} {offset} {len(record)}\n")
+
+
+def reindex(data_path: str = DATA_FILE, index_path: str = INDEX_FILE) -> int:
+    """Rebuild the offset table from the data file. Returns the number of series."""
+    lines = []
+    offset = 0
+    with open(data_path, "rb") as f:
+        for record in f:
+            name = record.split(maxsplit=1)[0].decode("utf-8")
+            lines.append(f"{name} {offset} {len(record)}\n")
+            offset += len(record)
+    tmp = index_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+    os.replace(tmp, index_path)
+    return len(lines)
+
+
+def main(argv):
+    if not argv or argv[0] not in ("list", "show", "add", "reindex"):
+        print(__doc__.split("Usage:")[1].rstrip())
+        return 1
+    command, args = argv[0], argv[1:]
+    series = SeriesIndex()
+    if command == "list":
+        print("\n".join(series))
+    elif command == "show":
+        if not args or args[0] not in series:
+            print(f"Unknown series: {args[0] if args else ''}")
+            return 1
+        print(" ".join(series[args[0]]))
+    elif command == "add":
+        if len(args) != 2:
+            print("Usage: python3 series_data.py add <series> <adj,adj,...>")
+            return 1
+        append_series(args[0], [a for a in args[1].split(",") if a])
+        print(f"Added {args[0]} ({len(series)} series)")
+    else:
+        print(f"Indexed {reindex()} series")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Shared parametric router mode for generated eBay routes.
+
+Every generated router file is one of two byte-identical templates: the
+"resources" variant (API_TEMPLATE in generate_series.py / generate_spark.py)
+and the "tests" variant (ROUTE_CONTENT / TEMPLATE in the titan, apex and ultra
+scripts). They only differ in the name of the second section. Both end with
+GET /bundle?paths=a,b, which answers several parameterless GETs in one round
+trip, keyed by path (see render_bundle).
+
+Shared mode writes a single factory module, createStandardRouter(primary), and
+a JSON table of variant -> route names. registerStandardEbayRoutes() builds one
+router per variant and mounts it on all of that variant's paths, so tsc, the
+bundler and the API process handle two routers instead of thousands of files.
+"""
+
+import json
+import os
+
+from route_registry import load_routes_file, series_header
+from run_profile import PROFILE
+
+FACTORY_FILE = "ebay-standard-router.ts"
+TABLE_FILE = "ebay-standard-routes.json"
+REGISTRY_FILE = "ebay-standard-routes.ts"
+SHARED_HEADER = "// Shared standard routers (ebay-standard-routes.json)"
+SHARED_IMPORT = "import { registerStandardEbayRoutes } from './ebay-standard-routes';"
+SHARED_REGISTRATION = "registerStandardEbayRoutes(app);"
+
+VARIANTS = ("resources", "tests")
+
+# (comment, [(method, path, section, action)]). "{primary}" is the variant name.
+SECTIONS = [
+    ("Dashboard", [
+        ("get", "/dashboard", "dashboard", "dashboard"),
+        ("get", "/dashboard/summary", "dashboard", "summary"),
+        ("get", "/dashboard/metrics", "dashboard", "metrics"),
+        ("get", "/dashboard/recent", "dashboard", "recent"),
+        ("get", "/dashboard/alerts", "dashboard", "alerts"),
+    ]),
+    ("{Primary}", [
+        ("get", "/{primary}", "{primary}", "list"),
+        ("get", "/{primary}/:id", "{primary}", "detail"),
+        ("post", "/{primary}", "{primary}", "create"),
+        ("put", "/{primary}/:id", "{primary}", "update"),
+        ("delete", "/{primary}/:id", "{primary}", "delete"),
+        ("post", "/{primary}/:id/process", "{primary}", "process"),
+    ]),
+    ("Variants", [
+        ("get", "/variants", "variants", "list"),
+        ("get", "/variants/:id", "variants", "detail"),
+        ("post", "/variants", "variants", "create"),
+        ("put", "/variants/:id", "variants", "update"),
+    ]),
+    ("Listings", [
+        ("get", "/listings", "listings", "list"),
+        ("get", "/listings/:id", "listings", "detail"),
+        ("post", "/listings", "listings", "create"),
+        ("put", "/listings/:id", "listings", "update"),
+    ]),
+    ("Analytics", [
+        ("get", "/analytics", "analytics", "analytics"),
+        ("get", "/analytics/overview", "analytics", "overview"),
+        ("get", "/analytics/trends", "analytics", "trends"),
+    ]),
+    ("Settings", [
+        ("get", "/settings", "settings", "get"),
+        ("put", "/settings", "settings", "put"),
+    ]),
+    ("Utilities", [
+        ("get", "/health", "utilities", "health"),
+        ("get", "/export", "utilities", "export"),
+        ("post", "/import", "utilities", "import"),
+        ("post", "/sync", "utilities", "sync"),
+    ]),
+]
+
+
+def endpoints(primary: str):
+    """Flat [(method, path, section, action)] list for one variant."""
+    return [
+        tuple(part.replace("{primary}", primary) for part in endpoint)
+        for _, group in SECTIONS
+        for endpoint in group
+    ]
+
+
+def bundle_endpoints(primary: str):
+    """[(path, section, action)] of the parameterless GETs that /bundle can resolve."""
+    return [
+        (path, section, action)
+        for method, path, section, action in endpoints(primary)
+        if method == "get" and ":" not in path
+    ]
+
+
+# GET /bundle handler shared by every generated router; the BUNDLE table above it is per variant.
+BUNDLE_HANDLER = """router.get('/bundle', (req: Request, res: Response) => {
+  const paths = String(req.query.paths ?? '').split(',').filter(Boolean);
+  res.json(Object.fromEntries(paths.map((path) => [path, Object.hasOwn(BUNDLE, path) ? BUNDLE[path] : null])));
+});
+"""
+
+
+def render_bundle(primary: str) -> list:
+    """Lines of the GET /bundle?paths=a,b endpoint: several GET sub-actions in one round trip, keyed by path."""
+    lines = ["// Bundle (1)", "const BUNDLE: Record<string, { section: string; action: string }> = {"]
+    for path, section, action in bundle_endpoints(primary):
+        lines.append(f"  '{path[1:]}': {{ section: '{section}', action: '{action}' }},")
+    lines += ["};", *BUNDLE_HANDLER.splitlines(), ""]
+    return lines
+
+
+def render_router(primary: str) -> str:
+    """Render the classic one-file-per-route template for a variant."""
+    lines = ["import { Router } from 'express';", "import type { Request, Response } from 'express';", "",
+             "const router = Router();", ""]
+    for comment, group in SECTIONS:
+        lines.append(f"// {comment.replace('{Primary}', primary.capitalize())} ({len(group)})")
+        for method, path, section, action in group:
+            path, section = path.replace("{primary}", primary), section.replace("{primary}", primary)
+            lines.append(f"router.{method}('{path}', (_req: Request, res: Response) => "
+                         f"res.json({{ section: '{section}', action: '{action}' }}));")
+        lines.append("")
+    lines += render_bundle(primary)
+    lines.append("export default router;")
+    return "\n".join(lines) + "\n"
+
+
+def variant_of(template: str) -> str:
+    """Map a generator's literal template to its variant, or raise if it has drifted."""
+    for variant in VARIANTS:
+        if render_router(variant) == template:
+            return variant
+    raise ValueError("template does not match any shared router variant")
+
+
+def render_factory() -> str:
+    rows = []
+    for comment, group in SECTIONS:
+        rows.append(f"    // {comment.replace('{Primary}', 'Primary')}")
+        for method, path, section, action in group:
+            path = "`" + path.replace("{primary}", "${primary}") + "`" if "{primary}" in path else f"'{path}'"
+            section = "primary" if section == "{primary}" else f"'{section}'"
+            rows.append(f"    ['{method}', {path}, {section}, '{action}'],")
+    return (
+        "import { Router } from 'express';\n"
+        "import type { Request, Response } from 'express';\n"
+        "\n"
+        "// Generated by codex/shared_router.py. Do not edit by hand.\n"
+        "type Method = 'get' | 'post' | 'put' | 'delete';\n"
+        "type Endpoint = [method: Method, path: string, section: string, action: string];\n"
+        "\n"
+        "export function standardEndpoints(primary: string): Endpoint[] {\n"
+        "  return [\n"
+        + "\n".join(rows) + "\n"
+        "  ];\n"
+        "}\n"
+        "\n"
+        "export function createStandardRouter(primary: string): Router {\n"
+        "  const router = Router();\n"
+        "  for (const [method, path, section, action] of standardEndpoints(primary)) {\n"
+        "    router[method](path, (_req: Request, res: Response) => res.json({ section, action }));\n"
+        "  }\n"
+        "  // GET /bundle?paths=a,b: several parameterless GETs in one round trip, keyed by path.\n"
+        "  const bundle = new Map<string, { section: string; action: string }>();\n"
+        "  for (const [method, path, section, action] of standardEndpoints(primary)) {\n"
+        "    if (method === 'get' && !path.includes(':')) bundle.set(path.slice(1), { section, action });\n"
+        "  }\n"
+        "  router.get('/bundle', (req: Request, res: Response) => {\n"
+        "    const paths = String(req.query.paths ?? '').split(',').filter(Boolean);\n"
+        "    res.json(Object.fromEntries(paths.map((path) => [path, bundle.get(path) ?? null])));\n"
+        "  });\n"
+        "  return router;\n"
+        "}\n"
+    )
+
+
+REGISTRY_TEMPLATE = '''import type { Express } from 'express';
+import table from './ebay-standard-routes.json';
+import { createStandardRouter } from './ebay-standard-router';
+
+// Generated by codex/shared_router.py. Do not edit by hand.
+const TABLE: Record<string, string[]> = table;
+
+export function registerStandardEbayRoutes(app: Express): void {
+  for (const [variant, names] of Object.entries(TABLE)) {
+    if (names.length === 0) continue;
+    app.use(names.map((name) => `/api/${name}`), createStandardRouter(variant));
+  }
+}
+'''
+
+
+def load_table(routes_dir: str, writer) -> dict:
+    text = writer.read_text(os.path.join(routes_dir, TABLE_FILE))
+    if text is None:
+        return {variant: [] for variant in VARIANTS}
+    return json.loads(text)
+
+
+def render_table(table: dict) -> str:
+    return "{\n" + ",\n".join(
+        f"{json.dumps(variant)}:[\n" + ",\n".join(json.dumps(n) for n in names) + "\n]"
+        for variant, names in table.items()
+    ) + "\n}\n"
+
+
+@PROFILE.timed("routes splice")
+def emit_shared_routes(routes_dir: str, routes_file: str, variant: str, route_names, writer, phases=()) -> int:
+    """Add route_names to the shared table under variant and hook the registry into routes_file.
+
+    Every (series, start, end) in phases is recorded as a "// Phase X-Y (Name
+    series)" comment above the hook. Returns the number of routes newly added
+    to the table.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown router variant: {variant}")
+    table = load_table(routes_dir, writer)
+    known = {name for names in table.values() for name in names}
+    names = table.setdefault(variant, [])
+    added = 0
+    for name in route_names:
+        if name not in known:
+            known.add(name)
+            names.append(name)
+            added += 1
+
+    writer.write(os.path.join(routes_dir, TABLE_FILE), render_table(table))
+    writer.write(os.path.join(routes_dir, FACTORY_FILE), render_factory())
+    writer.write(os.path.join(routes_dir, REGISTRY_FILE), REGISTRY_TEMPLATE)
+
+    registry = load_routes_file(writer, routes_file)
+    registry.add_block(SHARED_HEADER, [SHARED_IMPORT], [SHARED_REGISTRATION])
+    registry.add_records(SHARED_REGISTRATION, [series_header(*phase) for phase in phases])
+    if registry.changed:
+        writer.write(routes_file, registry.render(), atomic=True)
+    return added
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Generated vitest/supertest smoke specs for the generated routers.
+
+Every generated router answers the same 28 endpoints of shared_router.SECTIONS
+(plus GET /bundle) with a constant { section, action } body, so one table
+describes what every router must return. Generators call emit_smoke_tests()
+per series with their routes dir and tests dir (apps/api/src/test/generated/
+under the same root), which writes:
+
+  smoke.ts                        the endpoint table for both variants and
+                                  smokeRouters(), which mounts a set of routers
+                                  on one app / one listening server and checks
+                                  every endpoint's status and body
+  <series>.smoke-<k>.test.ts      one shard: imports SMOKE_SHARD_SIZE of the
+                                  series' routers and calls smokeRouters()
+
+Shards are separate spec files, so vitest runs them in parallel on all cores
+(and `vitest run --shard=i/n` splits them across machines). Each shard starts
+a single server and issues its requests concurrently. The default vitest
+config excludes the directory; apps/api/vitest.smoke.config.ts runs it:
+
+  cd apps/api && npm run test:smoke                    all generated specs
+  cd apps/api && npm run test:smoke -- blaze.smoke     one series
+"""
+
+import os
+
+from route_stream import to_camel
+from run_profile import PROFILE
+from shared_router import FACTORY_FILE, VARIANTS, bundle_endpoints, endpoints
+
+HELPER_FILE = "smoke.ts"
+SMOKE_SHARD_SIZE = 10
+
+HELPER_TEMPLATE = '''// Generated by codex/smoke_tests.py. Do not edit by hand.
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
+import express from 'express';
+import type { Router } from 'express';
+import type { Server } from 'http';
+import request from 'supertest';
+
+type Method = 'get' | 'post' | 'put' | 'delete';
+type Endpoint = [method: Method, path: string, section: string, action: string];
+
+const ENDPOINTS: Record<string, Endpoint[]> = {
+{endpoints}};
+
+// Parameterless GETs that /bundle resolves, keyed by path without the leading '/'.
+const BUNDLE: Record<string, Record<string, { section: string; action: string }>> = {
+{bundles}};
+
+function concrete(path: string): string {
+  return path.replace(/:\\w+/g, 'smoke-1');
+}
+
+export function smokeRouters(title: string, primary: string, routers: Record<string, Router>): void {
+  const endpoints = ENDPOINTS[primary];
+  const bundle = BUNDLE[primary];
+
+  describe(title, () => {
+    let server: Server;
+
+    beforeAll(() => {
+      const app = express();
+      app.use(express.json());
+      for (const [name, router] of Object.entries(routers)) app.use(`/api/${name}`, router);
+      server = app.listen(0);
+    });
+
+    afterAll(() => new Promise<void>((resolve) => server.close(() => resolve())));
+
+    describe.each(Object.keys(routers))('%s', (name) => {
+      it.concurrent.each(endpoints)('%s %s', async (method, path, section, action) => {
+        const res = await request(server)[method](`/api/${name}${concrete(path)}`);
+        expect(res.status).toBe(200);
+        expect(res.body).toEqual({ section, action });
+      });
+
+      it.concurrent('get /bundle', async () => {
+        const res = await request(server).get(`/api/${name}/bundle`).query({ paths: [...Object.keys(bundle), 'missing'].join(',') });
+        expect(res.status).toBe(200);
+        expect(res.body).toEqual({ ...bundle, missing: null });
+      });
+    });
+  });
+}
+'''
+
+
+def render_helper() -> str:
+    endpoint_rows = "".join(
+        f"  {variant}: [\n"
+        + "".join(f"    ['{method}', '{path}', '{section}', '{action}'],\n"
+                  for method, path, section, action in endpoints(variant))
+        + "  ],\n"
+        for variant in VARIANTS
+    )
+    bundle_rows = "".join(
+        f"  {variant}: {{\n"
+        + "".join(f"    '{path[1:]}': {{ section: '{section}', action: '{action}' }},\n"
+                  for path, section, action in bundle_endpoints(variant))
+        + "  },\n"
+        for variant in VARIANTS
+    )
+    return HELPER_TEMPLATE.replace("{endpoints}", endpoint_rows).replace("{bundles}", bundle_rows)
+
+
+def shard_file(series_name: str, index: int) -> str:
+    return f"{series_name}.smoke-{index}.test.ts"
+
+
+def render_shard(series_name: str, index: int, shards: int, variant: str, route_names, shared: bool,
+                 routes: str) -> str:
+    """One spec file; routes is the routes dir as an import path relative to the spec."""
+    lines = ["// Generated by codex/smoke_tests.py. Do not edit by hand.",
+             "import { smokeRouters } from './smoke';"]
+    if shared:
+        lines += [f"import {{ createStandardRouter }} from '{routes}/{FACTORY_FILE[:-3]}';", "",
+                  f"const router = createStandardRouter('{variant}');"]
+        entries = [f"  '{name}': router," for name in route_names]
+    else:
+        lines += [f"import {to_camel(name)}Router from '{routes}/{name}';" for name in route_names]
+        entries = [f"  '{name}': {to_camel(name)}Router," for name in route_names]
+    lines += ["", f"smokeRouters('{series_name} smoke {index}/{shards}', '{variant}', {{", *entries, "});"]
+    return "\n".join(lines) + "\n"
+
+
+@PROFILE.timed("smoke tests")
+def emit_smoke_tests(series_name: str, route_names, variant: str, writer, routes_dir: str, tests_dir: str,
+                     shared: bool = False, shard_size: int = SMOKE_SHARD_SIZE) -> int:
+    """Write the helper and <series>.smoke-<k>.test.ts shards for route_names; returns the number of shards.
+
+    Specs import the routers from routes_dir, so both dirs must belong to the same tree.
+    """
+    route_names = list(route_names)
+    routes = os.path.relpath(routes_dir, tests_dir)
+    writer.write(os.path.join(tests_dir, HELPER_FILE), render_helper())
+    shards = -(-len(route_names) // shard_size)
+    for index in range(1, shards + 1):
+        names = route_names[(index - 1) * shard_size:index * shard_size]
+        writer.write(os.path.join(tests_dir, shard_file(series_name, index)),
+                     render_shard(series_name, index, shards, variant, names, shared, routes))
+    return shards
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Pre-serialized static responses for the generated router templates.
+
+Every endpoint of the standard router templates (API_TEMPLATE, ROUTE_CONTENT,
+TEMPLATE; see shared_router.SECTIONS) answers with a constant body such as
+{ section: 'dashboard', action: 'summary' }, yet res.json() re-serializes it
+on every request. Static mode renders the same router with each body's JSON,
+byte length and ETag computed at generation time. Handlers send a Buffer that
+is allocated once at module load, and they answer a matching If-None-Match on
+GET/HEAD with 304. The bodies are byte-identical to what res.json() produced.
+"""
+
+import base64
+import hashlib
+import json
+
+from run_profile import PROFILE
+from shared_router import SECTIONS, render_bundle, variant_of
+
+# --shared mounts routes on the createStandardRouter factory, whose handlers use
+# res.json(); there is no static variant of it, so the flags are rejected together.
+SHARED_CONFLICT = "--static-responses cannot be combined with --shared (the shared router factory has no static variant)"
+
+
+def response_body(section: str, action: str) -> bytes:
+    # Same bytes as JSON.stringify({ section, action }).
+    return json.dumps({"section": section, "action": action}, separators=(",", ":")).encode("utf-8")
+
+
+def entity_tag(body: bytes) -> str:
+    """Strong ETag in the format of the `etag` package Express uses: "<len hex>-<sha1 base64[:27]>"."""
+    digest = base64.b64encode(hashlib.sha1(body).digest()).decode("ascii")[:27]
+    return f'"{len(body):x}-{digest}"'
+
+
+STATIC_PRELUDE = '''import { Router } from 'express';
+import type { Request, Response } from 'express';
+
+// Generated by codex/static_router.py. Bodies, lengths and ETags are precomputed; do not edit by hand.
+type Cached = [body: Buffer, length: string, etag: string];
+
+function notModified(req: Request, etag: string): boolean {
+  if (req.method !== 'GET' && req.method !== 'HEAD') return false;
+  const header = req.headers['if-none-match'];
+  if (!header) return false;
+  if (header.trim() === '*') return true;
+  return header.split(',').some((tag) => {
+    const candidate = tag.trim();
+    return (candidate.startsWith('W/') ? candidate.slice(2) : candidate) === etag;
+  });
+}
+
+function send(req: Request, res: Response, [body, length, etag]: Cached): void {
+  res.setHeader('ETag', etag);
+  if (notModified(req, etag)) {
+    res.status(304).end();
+    return;
+  }
+  res.setHeader('Content-Type', 'application/json; charset=utf-8');
+  res.setHeader('Content-Length', length);
+  res.end(body);
+}
+
+'''
+
+
+def render_static_router(primary: str) -> str:
+    """Render the standard router for a variant with precomputed response buffers."""
+    responses = {}
+    lines = []
+    for comment, group in SECTIONS:
+        lines.append(f"// {comment.replace('{Primary}', primary.capitalize())} ({len(group)})")
+        for method, path, section, action in group:
+            path, section = path.replace("{primary}", primary), section.replace("{primary}", primary)
+            body = response_body(section, action)
+            const = responses.setdefault(body, f"R{len(responses)}")
+            lines.append(f"router.{method}('{path}', (req: Request, res: Response) => send(req, res, {const}));")
+        lines.append("")
+
+    constants = [
+        f"const {const}: Cached = [Buffer.from('{body.decode('utf-8')}'), '{len(body)}', '{entity_tag(body)}'];"
+        for body, const in responses.items()
+    ]
+    return (
+        STATIC_PRELUDE
+        + "\n".join(constants) + "\n"
+        + "\n"
+        + "const router = Router();\n"
+        + "\n"
+        + "\n".join(lines + render_bundle(primary))
+        + "export default router;\n"
+    )
+
+
+@PROFILE.timed("render API")
+def static_template(template: str) -> str:
+    """Static-response version of a generator's literal router template."""
+    return render_static_router(variant_of(template))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Phase allocation across generate_series.py runs in the single-hook modes.
+
+Each test runs generate_series.py against a scratch tree ($RAKUDA_ROOT), so
+nothing in the checkout is touched.
+
+Usage: python3 -m unittest test_phase_planner   (from codex/)
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROUTES_FILE = "apps/api/src/routes/ebay-routes.ts"
+SEED = "import { Express } from 'express';\n\nexport function registerEbayRoutes(app: Express): void {\n}\n"
+DONE_RE = re.compile(r"Done! Phase (\d+)-(\d+)")
+
+
+class PhaseAllocationTest(unittest.TestCase):
+    def setUp(self):
+        self.make_tree()
+
+    def make_tree(self):
+        self.root = tempfile.mkdtemp(prefix="phase-planner-")
+        self.addCleanup(shutil.rmtree, self.root)
+        for path in ("apps/api/src/routes", "apps/web/src/app/ebay", "codex/output"):
+            os.makedirs(os.path.join(self.root, path))
+        with open(os.path.join(self.root, ROUTES_FILE), "w") as f:
+            f.write(SEED)
+
+    def generate(self, *args):
+        return subprocess.run([sys.executable, "generate_series.py", *args], cwd=HERE, capture_output=True,
+                              text=True, env=dict(os.environ, RAKUDA_ROOT=self.root))
+
+    def allocated(self, *args):
+        result = self.generate(*args)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        start, end = DONE_RE.search(result.stdout).groups()
+        return int(start), int(end)
+
+    def test_auto_allocations_do_not_overlap(self):
+        for mode in ("--lazy", "--shared", "--dispatch"):
+            with self.subTest(mode=mode):
+                self.make_tree()
+                self.assertEqual(self.allocated("selkie", "auto", mode), (1, 70))
+                self.assertEqual(self.allocated("kelpie", "auto", mode), (71, 140))
+                # Re-running a registered series keeps its range.
+                self.assertEqual(self.allocated("selkie", "auto", mode), (1, 70))
+
+    def test_registry_ranges_without_phase_records(self):
+        self.allocated("selkie", "auto", "--shared")
+        path = os.path.join(self.root, ROUTES_FILE)
+        with open(path) as f:
+            lines = [line for line in f if "// Phase" not in line]
+        with open(path, "w") as f:
+            f.writelines(lines)
+        self.assertEqual(self.allocated("kelpie", "auto", "--shared"), (71, 140))
+
+    def test_overlapping_start_fails(self):
+        self.allocated("selkie", "auto", "--lazy")
+        result = self.generate("kelpie", "60", "--lazy")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("phases 60-129 overlap selkie", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
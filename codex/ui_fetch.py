@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Client-side data loading shared by every generated eBay UI page.
+
+Pages used to fetch(API_BASE + tab.path) on each tab switch: no cache, no
+abort, and a slow response for an old tab could overwrite the current one.
+The snippets below give each page:
+
+  - cachedFetch(): a response cache keyed by URL (so per API_BASE and tab),
+    kept on globalThis so it survives client-side navigation, with a TTL
+  - prefetch of all tabs on mount through the routers' GET /bundle endpoint,
+    one request instead of one per tab, so switches render from memory
+  - an AbortController per active-tab request, aborted on switch / unmount
+
+Used by generate_series.render_ui_page, generate_spark.make_ui_page and the
+dynamic ebay/[slug] client page (ui_manifest.py).
+"""
+
+CACHE_TTL_MS = 30_000
+
+CACHED_FETCH = f'''
+const CACHE_TTL_MS = {CACHE_TTL_MS};
+type CacheEntry = {{ at: number; promise: Promise<ApiResponse> }};
+const cacheHost = globalThis as {{ __ebayApiCache?: Map<string, CacheEntry> }};
+const apiCache = (cacheHost.__ebayApiCache ??= new Map<string, CacheEntry>());
+
+function getJson<T>(url: string, signal: AbortSignal): Promise<T> {{
+  return fetch(url, {{ signal }}).then((r) => {{
+    if (!r.ok) throw new Error(`HTTP ${{r.status}}`);
+    return r.json() as Promise<T>;
+  }});
+}}
+
+function isFresh(url: string): boolean {{
+  const hit = apiCache.get(url);
+  return !!hit && Date.now() - hit.at < CACHE_TTL_MS;
+}}
+
+function remember(url: string, promise: Promise<ApiResponse>, signal: AbortSignal): Promise<ApiResponse> {{
+  const entry = {{ at: Date.now(), promise }};
+  const evict = () => {{
+    if (apiCache.get(url) === entry) apiCache.delete(url);
+  }};
+  apiCache.set(url, entry);
+  signal.addEventListener("abort", evict);
+  promise.then(() => signal.removeEventListener("abort", evict), evict);
+  return promise;
+}}
+
+function cachedFetch(url: string, signal: AbortSignal): Promise<ApiResponse> {{
+  if (isFresh(url)) return apiCache.get(url)!.promise;
+  return remember(url, getJson<ApiResponse>(url, signal), signal);
+}}
+
+// One GET <base>bundle?paths=... for every tab that is not cached yet; each tab's
+// cache entry resolves from its slice of the bundle.
+function prefetchBundle(base: string, tabs: readonly {{ path: string }}[], signal: AbortSignal): void {{
+  const missing = tabs.filter((t) => !isFresh(base + t.path));
+  if (missing.length === 0) return;
+  const paths = missing.map((t) => encodeURIComponent(t.path)).join(",");
+  const bundle = getJson<Record<string, ApiResponse | null>>(`${{base}}bundle?paths=${{paths}}`, signal);
+  for (const t of missing) {{
+    const promise = bundle.then((b) => {{
+      const d = b[t.path];
+      if (!d) throw new Error(`bundle has no ${{t.path}}`);
+      return d;
+    }});
+    remember(base + t.path, promise, signal);
+  }}
+}}
+'''
+
+
+def fetch_hooks(tabs: str, base: str, deps: str = "") -> str:
+    """Prefetch + active-tab effects; tabs / base are the page's TS expressions for the tab list and API base."""
+    extra = f", {deps}" if deps else ""
+    return f'''  const [results, setResults] = useState<Record<string, ApiResponse>>({{}});
+  const data = results[active] ?? null;
+
+  // Initial load: every tab in one /bundle round trip, so tab switches render from memory.
+  useEffect(() => {{
+    const controller = new AbortController();
+    prefetchBundle({base}, {tabs}, controller.signal);
+    for (const t of {tabs}) {{
+      cachedFetch({base} + t.path, controller.signal)
+        .then((d) => setResults((prev) => ({{ ...prev, [t.key]: d }})))
+        .catch(() => {{}});
+    }}
+    return () => controller.abort();
+  }}, [{deps}]);
+
+  // Active tab: served from the cache while fresh; switching away aborts a pending request.
+  useEffect(() => {{
+    const tab = {tabs}.find((t) => t.key === active);
+    if (!tab) return;
+    const controller = new AbortController();
+    setError(null);
+    cachedFetch({base} + tab.path, controller.signal)
+      .then((d) => setResults((prev) => ({{ ...prev, [tab.key]: d }})))
+      .catch((e) => {{
+        if (!controller.signal.aborted) setError(e.message);
+      }});
+    return () => controller.abort();
+  }}, [active{extra}]);
+'''
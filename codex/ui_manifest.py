@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Single dynamic Next.js route for the generated eBay UI pages.
+
+Page mode writes one apps/web/src/app/ebay/<slug>/page.tsx per generated route,
+so Next.js compiles and chunks ~11k near-identical pages. Dynamic mode instead
+writes a fixed set of files under apps/web/src/app/ebay/[slug]/:
+
+  page.tsx              server component; generateStaticParams() from the manifest
+  ebay-route-page.tsx   the client UI, parameterised by route / color / tabs
+  ebay-ui-manifest.json compact slug -> [category, color index] table
+
+Only the manifest grows with the number of series; the page code is the same
+for every run, so OutputWriter leaves it untouched after the first one.
+"""
+
+import json
+import os
+
+from run_profile import PROFILE
+from ui_fetch import CACHED_FETCH, fetch_hooks
+
+MANIFEST_FILE = "ebay-ui-manifest.json"
+PAGE_FILE = "page.tsx"
+CLIENT_FILE = "ebay-route-page.tsx"
+SLUG_DIR = "[slug]"
+
+PAGE_TEMPLATE = '''import { notFound } from "next/navigation";
+import manifest from "./ebay-ui-manifest.json";
+import EbayRoutePage from "./ebay-route-page";
+
+// Generated by codex/ui_manifest.py. Do not edit by hand.
+type Manifest = {
+  colors: string[];
+  tabs: Record<string, [key: string, label: string, path: string][]>;
+  pages: Record<string, [category: string, color: number]>;
+};
+const MANIFEST = manifest as unknown as Manifest;
+
+export const dynamicParams = false;
+
+export function generateStaticParams() {
+  return Object.keys(MANIFEST.pages).map((slug) => ({ slug }));
+}
+
+export default async function Page({ params }: { params: Promise<{ slug: string }> }) {
+  const { slug } = await params;
+  const entry = MANIFEST.pages[slug];
+  if (!entry) notFound();
+  const [category, color] = entry;
+  const tabs = MANIFEST.tabs[category].map(([key, label, path]) => ({ key, label, path }));
+  return <EbayRoutePage route={`ebay-${slug}`} color={MANIFEST.colors[color]} tabs={tabs} />;
+}
+'''
+
+CLIENT_TEMPLATE = '''"use client";
+import { useEffect, useState } from "react";
+
+// Generated by codex/ui_manifest.py. Do not edit by hand.
+type ApiResponse = { section: string; action: string };
+export type Tab = { key: string; label: string; path: string };
+{cached_fetch}
+// Full class names, so Tailwind's content scan still sees every color.
+const COLOR_CLASSES: Record<string, [title: string, active: string]> = {
+{color_classes}
+};
+
+export default function EbayRoutePage({ route, color, tabs }: { route: string; color: string; tabs: Tab[] }) {
+  const [active, setActive] = useState("dashboard");
+  const [error, setError] = useState<string | null>(null);
+  const [title, activeClass] = COLOR_CLASSES[color];
+  const apiBase = `/api/${route}/`;
+{fetch_hooks}
+  return (
+    <div className="p-6">
+      <h1 className={`text-2xl font-bold ${title} mb-4`}>{route}</h1>
+      <div className="flex gap-2 mb-6">
+        {tabs.map((t) => (
+          <button
+            key={t.key}
+            onClick={() => setActive(t.key)}
+            className={`px-4 py-2 rounded ${
+              active === t.key ? activeClass : "bg-gray-100 text-gray-600 hover:bg-gray-200"
+            }`}
+          >
+            {t.label}
+          </button>
+        ))}
+      </div>
+      {error && <p className="text-red-500 mb-4">{error}</p>}
+      {data && (
+        <pre className="bg-gray-50 p-4 rounded text-sm overflow-auto">
+          {JSON.stringify(data, null, 2)}
+        </pre>
+      )}
+    </div>
+  );
+}
+'''
+
+
+def render_client(colors) -> str:
+    rows = ",\n".join(
+        f'  "{color}": ["text-{color}", "bg-{color.replace("-600", "")}-100 text-{color} font-bold"]'
+        for color in colors
+    )
+    return (
+        CLIENT_TEMPLATE.replace("{cached_fetch}", CACHED_FETCH)
+        .replace("{fetch_hooks}", fetch_hooks("tabs", "apiBase", "apiBase, tabs"))
+        .replace("{color_classes}", rows)
+    )
+
+
+def load_manifest(ui_dir: str, writer) -> dict:
+    text = writer.read_text(os.path.join(ui_dir, SLUG_DIR, MANIFEST_FILE))
+    if text is None:
+        return {"colors": [], "tabs": {}, "pages": {}}
+    return json.loads(text)
+
+
+def render_manifest(manifest: dict) -> str:
+    return (
+        "{\n"
+        f'"colors":{json.dumps(manifest["colors"], separators=(",", ":"))},\n'
+        f'"tabs":{json.dumps(manifest["tabs"], ensure_ascii=False, separators=(",", ":"))},\n'
+        '"pages":{\n'
+        + ",\n".join(f"{json.dumps(slug)}:{json.dumps(entry)}" for slug, entry in manifest["pages"].items())
+        + "\n}\n}\n"
+    )
+
+
+@PROFILE.timed("UI manifest")
+def emit_dynamic_ui(ui_dir: str, pages, cat_ui_tabs, writer) -> int:
+    """Add (slug, category, color) pages to the [slug] manifest and write the dynamic route files.
+
+    Returns the number of slugs newly added to the manifest.
+    """
+    manifest = load_manifest(ui_dir, writer)
+    colors = manifest["colors"]
+    color_index = {color: i for i, color in enumerate(colors)}
+    added = 0
+    for slug, category, color in pages:
+        if color not in color_index:
+            color_index[color] = len(colors)
+            colors.append(color)
+        manifest["tabs"].setdefault(category, [list(tab) for tab in cat_ui_tabs[category]])
+        if slug not in manifest["pages"]:
+            added += 1
+        manifest["pages"][slug] = [category, color_index[color]]
+
+    slug_dir = os.path.join(ui_dir, SLUG_DIR)
+    writer.write(os.path.join(slug_dir, MANIFEST_FILE), render_manifest(manifest))
+    writer.write(os.path.join(slug_dir, PAGE_FILE), PAGE_TEMPLATE)
+    writer.write(os.path.join(slug_dir, CLIENT_FILE), render_client(colors))
+    return added
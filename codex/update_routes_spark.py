@@ -1,36 +1,36 @@
 #!/usr/bin/env python3
-"""Insert Spark series imports and registrations into ebay-routes.ts."""
+"""Register the Spark series: ebay-routes-spark.ts shard, or --monolithic to splice into ebay-routes.ts.
 
-ROUTES_FILE = "/Users/naokijodan/Desktop/rakuda/apps/api/src/routes/ebay-routes.ts"
-OUTPUT_DIR = "/Users/naokijodan/Desktop/rakuda/codex/output"
+Pass --profile to run under cProfile with per-stage timers (report printed and
+written to codex/output/profile-update_routes_spark.json / .pstats).
+"""
 
-with open(ROUTES_FILE, "r") as f:
-    content = f.read()
+import sys
 
-with open(f"{OUTPUT_DIR}/spark-imports.txt", "r") as f:
-    imports = f.read().strip()
+from output_backend import repo_path
+from route_registry import apply_series
+from route_shards import apply_shards
+from run_profile import profile_run
 
-with open(f"{OUTPUT_DIR}/spark-registrations.txt", "r") as f:
-    registrations = f.read().strip()
+ROUTES_DIR = repo_path("apps/api/src/routes")
+ROUTES_FILE = repo_path("apps/api/src/routes/ebay-routes.ts")
+OUTPUT_DIR = repo_path("codex/output")
+PLAN = [("spark", 2961, 3030)]
 
-# Insert imports before the export function line
-content = content.replace(
-    "\nexport function registerEbayRoutes",
-    f"\n// Phase 2961-3030 (Spark series)\n{imports}\n\nexport function registerEbayRoutes"
-)
 
-# Insert registrations before the closing }
-# Find the last } which closes the function
-last_brace = content.rstrip().rfind("}")
-content = (
-    content[:last_brace]
-    + "\n  // Phase 2961-3030 (Spark series)\n"
-    + registrations
-    + "\n}\n"
-)
+def main(monolithic: bool = False):
+    if monolithic:
+        added = apply_series(ROUTES_FILE, OUTPUT_DIR, PLAN)
+        print(f"Updated {ROUTES_FILE}")
+        print(f"Added {added} imports + {added} registrations for Spark series")
+    else:
+        added = apply_shards(ROUTES_DIR, ROUTES_FILE, OUTPUT_DIR, PLAN)
+        print(f"Updated {ROUTES_FILE}")
+        print(f"Registered Spark series through ebay-routes-spark.ts ({added} new shard)")
 
-with open(ROUTES_FILE, "w") as f:
-    f.write(content)
 
-print(f"Updated {ROUTES_FILE}")
-print("Added 70 imports + 70 registrations for Spark series")
+if __name__ == "__main__":
+    if "--profile" in sys.argv[1:]:
+        profile_run("update_routes_spark", OUTPUT_DIR, main, monolithic="--monolithic" in sys.argv[1:])
+    else:
+        main(monolithic="--monolithic" in sys.argv[1:])